@@ -0,0 +1,58 @@
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from cases import load_service, population, recommend_frames
+from suite import quiet
+
+# 크루 추천 배치 블록 계산 (scoring.top_crews_blocks) 확인 / 메모리 / 속도
+# 1. 작은 규모에서 모든 사용자의 상위 20개가 score_crews (사용자 1명씩 계산)와 같은지
+# 2. 사용자 수를 늘려도 블록 계산 중 최대 메모리(tracemalloc)가 메모리 상한 근처에서 일정한지
+#    (한 블록 = 전체 사용자로 계산했을 때와 비교)
+
+def consume(main, user_df, crew_df, memory_mb):
+    sport_index = main.build_sport_index(user_df, crew_df)
+    positions = list(range(len(user_df)))
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = 0
+    for block in main.recommendation_blocks(user_df, crew_df, positions, sport_index, memory_mb=memory_mb):
+        count += len(block)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 추천 배치 블록 계산 확인 / 메모리')
+    parser.add_argument('--users', type=int, nargs='+', default=[2000, 8000, 32000])
+    parser.add_argument('--crews', type=int, default=2000)
+    parser.add_argument('--memory-mb', type=float, default=32)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from loadtest import crew_payload
+
+    # 1. 사용자 1명씩 계산한 결과와 같은지
+    rng = np.random.default_rng(args.seed)
+    user_df, crew_df = recommend_frames(main, crew_payload(population(300, args.seed), 300, 80, rng))
+    sport_index = main.build_sport_index(user_df, crew_df)
+    with quiet():
+        blocks = list(main.recommendation_blocks(user_df, crew_df, list(range(len(user_df))), sport_index, memory_mb=0.01))
+        for user_idx, ranked in (row for block in blocks for row in block):
+            exact = main.score_crews(user_df.loc[user_idx], user_df, crew_df, sport_index=sport_index)[:20]
+            assert [crew[0] for crew in ranked] == [crew[0] for crew in exact], user_idx
+            assert np.allclose([crew[1:] for crew in ranked], [crew[1:] for crew in exact]), user_idx
+    print(f'{len(user_df)} users x {len(crew_df)} crews ({len(blocks)} blocks) : same top 20 as score_crews')
+
+    # 2. 메모리 / 속도
+    print(f"{'users':>8}{'block ms':>10}{'block MB':>10}{'single ms':>11}{'single MB':>11}")
+    for n_users in args.users:
+        rng = np.random.default_rng(args.seed)
+        user_df, crew_df = recommend_frames(main, crew_payload(population(min(n_users, 5000), args.seed), n_users, args.crews, rng))
+        _, block_time, block_peak = consume(main, user_df, crew_df, args.memory_mb)
+        _, single_time, single_peak = consume(main, user_df, crew_df, 10 ** 6)
+        print(f'{n_users:>8}{block_time * 1000:>10.0f}{block_peak / 2 ** 20:>10.1f}{single_time * 1000:>11.0f}{single_peak / 2 ** 20:>11.1f}')
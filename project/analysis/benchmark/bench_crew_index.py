@@ -0,0 +1,60 @@
+import time
+import argparse
+import numpy as np
+from cases import load_service, population, recommend_frames
+from suite import quiet
+
+# 크루 후보 인덱스 (KD-tree shortlist) recall@20 vs 속도
+# - exact : 전체 크루 유사도 계산 (score_crews)
+# - index : KD-tree에서 가까운 k개 + 선호 스포츠가 겹치는 사용자의 크루만 뽑아서 같은 방식으로 계산
+# recall@20 = 전체 계산 상위 20개 크루 중 shortlist 계산 상위 20개에 들어간 비율
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 후보 인덱스 recall / 속도 비교')
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--crews', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--shortlist', type=int, nargs='+', default=[25, 50, 100, 200])
+    parser.add_argument('--queries', type=int, default=10, help='측정할 사용자 수')
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from loadtest import crew_payload
+
+    for n_crews in args.crews:
+        rng = np.random.default_rng(args.seed)
+        user_df, crew_df = recommend_frames(main, crew_payload(population(args.users, args.seed), args.users, n_crews, rng))
+        queries = rng.choice(len(user_df), size=min(args.queries, len(user_df)), replace=False)
+
+        start = time.perf_counter()
+        sport_index = main.build_sport_index(user_df, crew_df)
+        crew_index = main.build_crew_index(crew_df, sport_index)
+        build_time = time.perf_counter() - start
+
+        # 1. 전체 계산
+        exact = {}
+        start = time.perf_counter()
+        with quiet():
+            for q in queries:
+                exact[q] = [crew[0] for crew in main.score_crews(user_df.loc[q], user_df, crew_df, sport_index=sport_index)[:20]]
+        exact_time = (time.perf_counter() - start) / len(queries)
+
+        print(f'{args.users} users x {n_crews} crews (index build {build_time * 1000:.1f} ms)')
+        print(f"{'':<16}{'ms/user':>10}{'speedup':>10}{'recall@20':>12}")
+        print(f"{'exact':<16}{exact_time * 1000:>10.1f}{1:>9.1f}x{1:>12.3f}")
+
+        # 2. shortlist k개만 계산
+        for k in args.shortlist:
+            recalls = []
+            start = time.perf_counter()
+            with quiet():
+                for q in queries:
+                    now_user = user_df.loc[q]
+                    candidates = main.shortlist_crews(crew_index, now_user, k)
+                    approx = [crew[0] for crew in main.score_crews(now_user, user_df, crew_df, candidates, sport_index)[:20]]
+                    recalls.append(len(set(approx) & set(exact[q])) / max(len(exact[q]), 1))
+            index_time = (time.perf_counter() - start) / len(queries)
+            print(f"{f'index k={k}':<16}{index_time * 1000:>10.1f}{exact_time / index_time:>9.1f}x{np.mean(recalls):>12.3f}")
+        print()
@@ -0,0 +1,69 @@
+import gc
+import time
+import json
+import argparse
+import tracemalloc
+import numpy as np
+from cases import load_service, population
+
+# 크루 추천 요청 body 읽기 - 이전 방식 vs ingest.total_frames
+# - pydantic : json.loads -> TotalData 모델 -> list comprehension으로 DataFrame 2개 (이전 crew_recommendation 1-1)
+# - ingest   : orjson (없으면 json) -> 컬럼 배열 -> DataFrame 2개
+# 시간은 여러 번 중 최소, 메모리는 tracemalloc 최대 사용량 (body bytes 제외)
+
+def pydantic_frames(main, body):
+    import pandas as pd
+    request = main.TotalData(**json.loads(body))
+    user_data = pd.DataFrame([{
+        'user_id': u.user_id, 'm_type': u.score.m_type, 'type': u.score.type, 'age': u.score.age,
+        'score_1': u.score.basic_score, 'score_2': u.score.activity_score, 'score_3': u.score.intake_score,
+        'favorite_sports': u.favorite_sports, 'crew_list': u.crew_list} for u in request.total_users.users])
+    crew_data = pd.DataFrame([{
+        'crew_id': c.crew_id, 'm_type': c.score.m_type, 'type': c.score.type, 'age': c.score.age,
+        'score_1': c.score.basic_score, 'score_2': c.score.activity_score, 'score_3': c.score.intake_score,
+        'crew_sports': c.crew_sports} for c in request.total_crews.crews])
+    return user_data, crew_data
+
+def measure(func, body, repeat):
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(body)
+        times.append(time.perf_counter() - start)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    result = func(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak, result
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 추천 요청 body 읽기 속도 / 메모리')
+    parser.add_argument('--users', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--crews', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    import ingest
+    from loadtest import crew_payload
+
+    print(f"decoder : {'orjson' if ingest.orjson is not None else 'json'}")
+    print(f"{'users':>8}{'body MB':>9}{'pydantic ms':>13}{'pydantic MB':>13}{'ingest ms':>11}{'ingest MB':>11}{'speedup':>9}")
+    for n_users in args.users:
+        body = json.dumps(crew_payload(population(min(n_users, 5000), args.seed), n_users, args.crews, np.random.default_rng(args.seed))).encode()
+        old_time, old_peak, (old_users, old_crews) = measure(lambda b: pydantic_frames(main, b), body, args.repeat)
+        new_time, new_peak, (new_users, new_crews) = measure(ingest.total_frames, body, args.repeat)
+
+        # 같은 값인지
+        for old, new in [(old_users, new_users), (old_crews, new_crews)]:
+            assert list(old.columns) == list(new.columns)
+            for column in old.columns:
+                assert old[column].tolist() == new[column].tolist(), column
+        print(f'{n_users:>8}{len(body) / 2 ** 20:>9.1f}{old_time * 1000:>13.0f}{old_peak / 2 ** 20:>13.1f}'
+              f'{new_time * 1000:>11.0f}{new_peak / 2 ** 20:>11.1f}{old_time / new_time:>8.1f}x')
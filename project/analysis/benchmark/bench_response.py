@@ -0,0 +1,75 @@
+import time
+import argparse
+from datetime import datetime
+from bson import ObjectId
+from cases import load_service
+
+# 응답 직렬화 비교 - 이전 방식 vs 응답 모델 + ingest.FastJSONResponse
+# - 이전 : convert_objectid (dict 재귀 순회) -> FastAPI jsonable_encoder -> JSONResponse (json.dumps)
+# - 현재 : 응답 모델 model_validate (ObjectId -> 문자열) -> FastJSONResponse (pydantic JSON 직렬화)
+# 두 방식의 JSON 값이 같은지 확인 후 시간 (여러 번 중 최소, 1회당 µs)
+
+# 이전 main.py의 convert_objectid
+def convert_objectid(data):
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, ObjectId):
+                data[key] = str(value)
+            elif isinstance(value, list):
+                data[key] = [convert_objectid(item) for item in value]
+            elif isinstance(value, dict):
+                data[key] = convert_objectid(value)
+    elif isinstance(data, list):
+        data = [convert_objectid(item) for item in data]
+    return data
+
+def old_render(document):
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    return JSONResponse(jsonable_encoder(convert_objectid(dict(document)))).body
+
+def new_render(model, document):
+    import ingest
+    return ingest.FastJSONResponse(model.model_validate(document)).body
+
+def best(func, repeat, number):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+def prediction(k):
+    return {'user_id': k, 'current': 70.12, 'p30': 69.5, 'p90': 68.21, 'created_at': datetime.utcnow(), '_id': ObjectId()}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='응답 직렬화 속도')
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    import json
+
+    extra = dict(prediction(1), exercise={'exercise_id': 3, 'count': 2, 'duration': 40})
+    crew = {'user_id': 1, 'user': {'basic_score': 60.0, 'activity_score': 40.5, 'intake_score': 70.0},
+            'crew_recommended': [{'crew_id': c, 'similarity': 0.512, 'score': {'basic_score': 61.0, 'activity_score': 39.0, 'intake_score': 72.5}}
+                                 for c in range(9)], 'created_at': datetime.utcnow(), '_id': ObjectId()}
+    batch = {'predictions': [prediction(k) for k in range(args.batch)], 'errors': []}
+    cases = [
+        ('predict', main.PredictionResponse, prediction(1), 2000),
+        ('extra_predict', main.ExtraPredictionResponse, extra, 2000),
+        ('crew_recommendation_single', main.CrewRecommendResult, crew, 1000),
+        (f'predict_batch [{args.batch}]', main.PredictionBatchResponse, batch, 5),
+    ]
+
+    print(f"{'response':<32}{'before µs':>12}{'after µs':>12}{'speedup':>9}")
+    for name, model, document, number in cases:
+        assert json.loads(old_render(document)) == json.loads(new_render(model, document)), name
+        old_time = best(lambda: old_render(document), args.repeat, number)
+        new_time = best(lambda: new_render(model, document), args.repeat, number)
+        print(f'{name:<32}{old_time * 1e6:>12.1f}{new_time * 1e6:>12.1f}{old_time / new_time:>8.1f}x')
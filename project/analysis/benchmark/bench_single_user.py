@@ -0,0 +1,77 @@
+import time
+import argparse
+import numpy as np
+from cases import load_service, population, recommend_frames
+from suite import quiet
+
+# 단건 크루 추천 (scoring.ResidentIndex) 확인 / 속도
+# 1. 작은 규모에서 모든 사용자에 대해 score_crews (배치 계산)와 점수가 같은지 확인
+# 2. 사용자 / 크루 수별로 사용자 1명 추천 (rank 상위 20개), 사용자 / 크루 upsert 시간
+
+def index_from_payload(main, payload):
+    import pandas as pd
+    request = main.TotalData(**payload)
+    user_data = pd.DataFrame([dict(zip(main.score_columns, main.score_values(u.score)), user_id=u.user_id,
+                                   favorite_sports=u.favorite_sports, crew_list=u.crew_list) for u in request.total_users.users])
+    crew_data = pd.DataFrame([dict(zip(main.score_columns, main.score_values(c.score)), crew_id=c.crew_id,
+                                   crew_sports=c.crew_sports) for c in request.total_crews.crews])
+    scaler = main.scoring.FeatureScaler()
+    scaler.partial_fit(np.vstack([user_data[main.score_columns].to_numpy(dtype=float), crew_data[main.score_columns].to_numpy(dtype=float)]))
+    index = main.scoring.ResidentIndex()
+    index.refresh(user_data, crew_data, scaler)
+    return index
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='단건 크루 추천 확인 / 속도')
+    parser.add_argument('--scales', nargs='+', default=['1000x100', '10000x1000', '100000x10000'], help='사용자수x크루수')
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from loadtest import crew_payload
+
+    # 1. 배치 계산과 같은 점수인지
+    rng = np.random.default_rng(args.seed)
+    payload = crew_payload(population(200, args.seed), 200, 60, rng)
+    user_df, crew_df = recommend_frames(main, payload)
+    index = index_from_payload(main, payload)
+    with quiet():
+        for i in range(len(user_df)):
+            exact = {crew[0]: crew[1:] for crew in main.score_crews(user_df.loc[i], user_df, crew_df)}
+            ranked = {crew[0]: crew[1:] for crew in index.rank(int(user_df.at[i, 'user_id']))}
+            assert exact.keys() == ranked.keys(), i
+            assert np.allclose([exact[c] for c in exact], [ranked[c] for c in exact]), i
+            top = [crew[1] for crew in index.rank(int(user_df.at[i, 'user_id']), limit=20)]
+            assert np.allclose(top, [exact[c][0] for c in list(exact)[:20]]), i
+    print(f'{len(user_df)} users x {len(crew_df)} crews : same scores as score_crews')
+
+    # 2. 속도
+    print(f"{'users x crews':<16}{'refresh ms':>12}{'rank ms':>10}{'upsert user ms':>16}{'upsert crew ms':>16}")
+    for scale in args.scales:
+        n_users, n_crews = (int(x) for x in scale.split('x'))
+        rng = np.random.default_rng(args.seed)
+        payload = crew_payload(population(min(n_users, 5000), args.seed), n_users, n_crews, rng)
+
+        start = time.perf_counter()
+        index = index_from_payload(main, payload)
+        refresh_time = time.perf_counter() - start
+
+        users = rng.choice(index.user_ids, size=args.queries)
+        start = time.perf_counter()
+        for user_id in users:
+            index.rank(int(user_id), limit=20)
+        rank_time = (time.perf_counter() - start) / args.queries
+
+        start = time.perf_counter()
+        for user_id in users[:10]:
+            index.upsert_user(int(user_id), [1, 0, 30, 50, 50, 50], [1, 2], [1])
+        upsert_user_time = (time.perf_counter() - start) / 10
+
+        start = time.perf_counter()
+        for k in range(10):
+            index.upsert_crew(n_crews + k + 1, [1, 0, 30, 50, 50, 50], 3)
+        upsert_crew_time = (time.perf_counter() - start) / 10
+        print(f'{scale:<16}{refresh_time * 1000:>12.1f}{rank_time * 1000:>10.2f}{upsert_user_time * 1000:>16.2f}{upsert_crew_time * 1000:>16.2f}')
@@ -0,0 +1,63 @@
+import time
+import argparse
+import numpy as np
+from cases import load_service, population
+
+# 요청 / 응답 body 형식 비교 - JSON (orjson) vs MessagePack
+# - bytes : 인코딩된 크기 (네트워크 전송량)
+# - encode : 보내는 쪽 직렬화 (Spring 대신 python으로), decode : 서비스가 endpoint에서 읽는 방식 그대로
+#   predict / batch : ingest.parse_model (pydantic 검증 포함), crew : ingest.total_frames (컬럼 DataFrame)
+# 시간은 여러 번 중 최소
+
+def best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='JSON vs MessagePack 크기 / 직렬화 시간')
+    parser.add_argument('--batch-users', type=int, default=1000)
+    parser.add_argument('--crew-users', type=int, default=100000)
+    parser.add_argument('--crew-crews', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    import ingest
+    from loadtest import predict_payload, crew_payload
+
+    rng = np.random.default_rng(args.seed)
+    pop = population(min(args.crew_users, 5000), args.seed)
+    batch = {'requests': [dict(predict_payload(pop, k % len(pop['user_id']), rng), user_id=k) for k in range(args.batch_users)]}
+    cases = [
+        ('predict', predict_payload(pop, 0, rng), lambda body: ingest.parse_model(main.UserExerciseRequest, body)),
+        (f'predict batch [{args.batch_users}]', batch, lambda body: ingest.parse_model(main.UserExerciseBatchRequest, body)),
+        (f'crew [{args.crew_users}x{args.crew_crews}]', crew_payload(pop, args.crew_users, args.crew_crews, rng), lambda body: ingest.total_frames(body.data, body.format)),
+    ]
+    # 응답 (예측 document batch-users개 - ObjectId / datetime 포함)
+    from bson import ObjectId
+    from datetime import datetime
+    response = {'predictions': [{'_id': ObjectId(), 'user_id': k, 'current': 70.1, 'p30': 69.5, 'p90': 68.2, 'created_at': datetime.utcnow()}
+                                for k in range(args.batch_users)], 'errors': []}
+
+    print(f"{'payload':<28}{'format':<9}{'KB':>10}{'encode ms':>11}{'decode ms':>11}")
+    for name, payload, decode in cases:
+        for body_format in ['json', 'msgpack']:
+            data = ingest.dumps(payload, body_format)
+            body = ingest.Body(data, body_format, body_format)
+            encode_time = best(lambda: ingest.dumps(payload, body_format), args.repeat)
+            decode_time = best(lambda: decode(body), max(1, args.repeat // 2) if 'crew' in name else args.repeat)
+            print(f'{name:<28}{body_format:<9}{len(data) / 1024:>10.1f}{encode_time * 1000:>11.2f}{decode_time * 1000:>11.2f}')
+
+    name = f'response [{args.batch_users}]'
+    for body_format in ['json', 'msgpack']:
+        data = ingest.dumps(response, body_format)
+        encode_time = best(lambda: ingest.dumps(response, body_format), args.repeat)
+        decode_time = best(lambda: ingest.loads(data, body_format), args.repeat)
+        print(f'{name:<28}{body_format:<9}{len(data) / 1024:>10.1f}{encode_time * 1000:>11.2f}{decode_time * 1000:>11.2f}')
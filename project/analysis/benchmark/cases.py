@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import asyncio
+import numpy as np
+
+# 벤치마크 대상과 가짜 입력 데이터 (외부 파일 / DB 없이 seed로 매번 같은 데이터 생성)
+# - dock/main.py : preprocess_data, model_predict, make_confirmed_weight, recommend_crews, crew_recommendation
+# - prediction/dataset.py : create_multi_step_sequences
+# - prediction/dummy/simulation.py : dummy_maker 체중 시뮬레이션 (simulate_users)
+# 각 setup 함수는 입력을 미리 만들어두고, 측정할 호출만 하는 함수를 돌려준다.
+
+analysis_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+dock_dir = os.path.join(analysis_dir, 'practice', 'dock')
+prediction_dir = os.path.join(analysis_dir, 'prediction')
+dummy_dir = os.path.join(prediction_dir, 'dummy')
+
+# dock 폴더가 맨 앞 (prediction/main.py와 모듈 이름이 같음)
+for path in [dummy_dir, prediction_dir, dock_dir]:
+    if path in sys.path:
+        sys.path.remove(path)
+    sys.path.insert(0, path)
+
+# 규모별 (사용자 수, 크루 수)
+scales = {
+    'small': {'recommend': [(100, 20), (500, 50)], 'crew': [(50, 20), (100, 30)], 'sequences': [1, 20], 'simulation': [100, 1000]},
+    'large': {'recommend': [(100, 20), (500, 50), (2000, 200)], 'crew': [(50, 20), (200, 50), (500, 100)], 'sequences': [1, 20, 100], 'simulation': [100, 1000, 5000]},
+}
+
+service = None
+
+# dock/main.py 불러오기 - MongoDB는 메모리 저장소, 모델 / 스케일러는 lifespan으로 로드 (dock 폴더 기준 상대 경로)
+def load_service():
+    global service
+    if service is None:
+        os.environ.setdefault('MONGO_URI', 'memory://')
+        cwd = os.getcwd()
+        os.chdir(dock_dir)
+        try:
+            import main
+            asyncio.run(main.load_model_startup(main.app).__aenter__())
+        finally:
+            os.chdir(cwd)
+        service = main
+    return service
+
+def population(n_users, seed):
+    from loadtest import synthetic_population
+    return synthetic_population(n_users, np.random.default_rng(seed), days=200)
+
+### 예측
+def setup_preprocess_data(seed):
+    main = load_service()
+    from loadtest import predict_payload
+    data = [main.ExerciseData(**d) for d in predict_payload(population(1, seed), 0, np.random.default_rng(seed))['exercise_data']]
+    return lambda: main.preprocess_data(data)
+
+def setup_model_predict(seed):
+    main = load_service()
+    X_test = np.random.default_rng(seed).random((1, 7, 6), dtype=np.float32)
+    return lambda: main.model_predict(X_test)
+
+def setup_make_confirmed_weight(seed):
+    main = load_service()
+    from loadtest import predict_payload
+    np.random.seed(seed)
+    data = [main.ExerciseData(**d) for d in predict_payload(population(1, seed), 0, np.random.default_rng(seed))['exercise_data']]
+    return lambda: main.make_confirmed_weight(0.04, 0.1, data, 70.0, 72.0, False)
+
+### 크루 추천
+# crew_recommendation 안의 1-1, 1-2 전처리와 같은 user_df / crew_df (저장된 정규화 기준 없이 이 데이터로만)
+def recommend_frames(main, payload):
+    import pandas as pd
+    request = main.TotalData(**payload)
+    columns = ['m_type', 'type', 'age', 'score_1', 'score_2', 'score_3']
+    rows = lambda items: [{'m_type': x.score.m_type, 'type': x.score.type, 'age': x.score.age, 'score_1': x.score.basic_score,
+                           'score_2': x.score.activity_score, 'score_3': x.score.intake_score} for x in items]
+    user_raw = pd.DataFrame(rows(request.total_users.users))[columns].to_numpy(dtype=float)
+    crew_raw = pd.DataFrame(rows(request.total_crews.crews))[columns].to_numpy(dtype=float)
+    scaler = main.scoring.FeatureScaler()
+    scaler.partial_fit(np.vstack([user_raw, crew_raw]))
+    user_df = pd.DataFrame(scaler.transform(user_raw), columns=columns)
+    crew_df = pd.DataFrame(scaler.transform(crew_raw), columns=columns)
+    user_df['user_id'] = [u.user_id for u in request.total_users.users]
+    user_df['favorite_sports'] = [u.favorite_sports for u in request.total_users.users]
+    user_df['crew_list'] = [u.crew_list for u in request.total_users.users]
+    crew_df['crew_id'] = [c.crew_id for c in request.total_crews.crews]
+    crew_df['crew_sports'] = [c.crew_sports for c in request.total_crews.crews]
+    return user_df, crew_df
+
+def setup_recommend_crews(seed, users, crews):
+    main = load_service()
+    from loadtest import crew_payload
+    rng = np.random.default_rng(seed)
+    user_df, crew_df = recommend_frames(main, crew_payload(population(users, seed), users, crews, rng))
+    now_user = user_df.loc[0]
+    np.random.seed(seed)
+    return lambda: main.recommend_crews(now_user, user_df, crew_df)
+
+# incremental=False : 전체 사용자 계산 (full), True : 입력이 그대로인 두 번째 실행 (fingerprint 비교만)
+def setup_crew_recommendation(seed, users, crews, incremental=False):
+    main = load_service()
+    from loadtest import crew_payload
+    import ingest
+    body = ingest.Body(json.dumps(crew_payload(population(users, seed), users, crews, np.random.default_rng(seed))).encode(), 'json', 'json')
+    np.random.seed(seed)
+    main.crew_fingerprint.delete_many({})
+    main.crew_scaler.delete_many({})
+    if incremental:
+        main.crew_recommendation(body, full=True)
+
+    def run():
+        main.crew_recommend.delete_many({})  # 저장 결과가 쌓이지 않도록
+        main.crew_recommendation(body, full=not incremental)
+    return run
+
+### 학습 데이터 / 가상 사용자 생성
+def simulated_people(n_users, seed):
+    from bench_simulation import make_people
+    return make_people(np.random.default_rng(seed), n_users)
+
+def setup_create_multi_step_sequences(seed, users):
+    from simulation import simulate_users, user_frame
+    from dataset import create_multi_step_sequences
+    result = simulate_users(simulated_people(users, seed), np.random.default_rng(seed))
+    frames = [user_frame(result, k).rename(columns={'calories': 'consumed_cal'}) for k in range(users)]
+    return lambda: [create_multi_step_sequences(df) for df in frames]
+
+def setup_simulate_users(seed, users):
+    from simulation import simulate_users
+    people = simulated_people(users, seed)
+    return lambda: simulate_users(people, np.random.default_rng(seed))
+
+# (이름, setup 함수, 인자) 목록
+def build_cases(scale='small'):
+    sizes = scales[scale]
+    cases = [
+        ('predict.preprocess_data', setup_preprocess_data, {}),
+        ('predict.model_predict', setup_model_predict, {}),
+        ('predict.make_confirmed_weight', setup_make_confirmed_weight, {}),
+    ]
+    cases += [(f'crew.recommend_crews[users={u},crews={c}]', setup_recommend_crews, {'users': u, 'crews': c}) for u, c in sizes['recommend']]
+    cases += [(f'crew.crew_recommendation[users={u},crews={c}]', setup_crew_recommendation, {'users': u, 'crews': c}) for u, c in sizes['crew']]
+    cases += [(f'crew.crew_recommendation_unchanged[users={u},crews={c}]', setup_crew_recommendation, {'users': u, 'crews': c, 'incremental': True}) for u, c in sizes['crew']]
+    cases += [(f'train.create_multi_step_sequences[users={u}]', setup_create_multi_step_sequences, {'users': u}) for u in sizes['sequences']]
+    cases += [(f'dummy.simulate_users[users={u}]', setup_simulate_users, {'users': u}) for u in sizes['simulation']]
+    return cases
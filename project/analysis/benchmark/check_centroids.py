@@ -0,0 +1,119 @@
+import time
+import threading
+import argparse
+import numpy as np
+from cases import load_service, population, recommend_frames
+
+# 크루 평균 벡터(CrewProfileStore) 내용 유사도 확인 / 속도
+# 1. 이전 계산식 (사용자 - 크루 멤버별 코사인 유사도 평균 * 0.3)과 사용자 x 크루 전체가 같은지
+# 2. ResidentIndex에서 사용자 / 크루 upsert (가입, 탈퇴, 선호 스포츠 변경, 새 스포츠 ID, 새 크루) 후에도 새로 만든 것과 같은지
+#    (스레드 여러 개에서 upsert와 rank를 동시에 실행해도 오류 없이 같은 결과인지 포함)
+# 3. 이전 계산식 vs 행렬 곱 1번 시간
+
+# 이전 계산식 - 선호 스포츠 multi-hot 벡터 코사인 유사도를 크루 멤버마다 구해서 평균
+def mean_member_cosine(user_df, crew_df):
+    from sklearn.metrics.pairwise import cosine_similarity
+    sports = sorted({s for sports in user_df['favorite_sports'] for s in sports} | set(crew_df['crew_sports']))
+    columns = {s: j for j, s in enumerate(sports)}
+    vectors = np.zeros((len(user_df), len(sports)))
+    for i, favorite in enumerate(user_df['favorite_sports']):
+        vectors[i, [columns[s] for s in favorite]] = 1
+    cosine = cosine_similarity(vectors)
+
+    content = np.zeros((len(user_df), len(crew_df)))
+    for j, crew_id in enumerate(crew_df['crew_id']):
+        members = [i for i, crew_list in enumerate(user_df['crew_list']) if crew_id in crew_list]
+        if members:
+            content[:, j] = cosine[:, members].mean(axis=1) * 0.3
+    return content
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 평균 벡터 내용 유사도 확인')
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--crews', type=int, default=100)
+    parser.add_argument('--upserts', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from loadtest import crew_payload
+    from bench_single_user import index_from_payload
+
+    rng = np.random.default_rng(args.seed)
+    payload = crew_payload(population(args.users, args.seed), args.users, args.crews, rng)
+    user_df, crew_df = recommend_frames(main, payload)
+
+    # 1. 이전 계산식과 비교
+    start = time.perf_counter()
+    expected = mean_member_cosine(user_df, crew_df)
+    expected_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sport_index = main.build_sport_index(user_df, crew_df)
+    content = main.content_similarities(sport_index, list(range(len(user_df))))
+    centroid_time = time.perf_counter() - start
+
+    assert content.shape == expected.shape
+    assert np.allclose(content, expected), np.abs(content - expected).max()
+    print(f'{len(user_df)} users x {len(crew_df)} crews : same content similarity (max diff {np.abs(content - expected).max():.2e})')
+
+    # 2. upsert 후 새로 만든 인덱스와 비교 (users / crews : upsert를 반영한 입력 그대로)
+    index = index_from_payload(main, payload)
+    users = {u['user_id']: dict(u) for u in payload['total_users']['users']}
+    crews = {c['crew_id']: dict(c) for c in payload['total_crews']['crews']}
+    new_crews = [10 ** 6 + c for c in range(4)]  # 아직 없는 크루 (가입한 사용자가 생긴 뒤 upsert)
+    crew_ids, sports = list(crews), sorted({c['crew_sports'] for c in crews.values()}) + [999]  # 999 : 처음 나오는 스포츠 ID
+    score = {'m_type': 1, 'type': 0, 'age': 30, 'basic_score': 50, 'activity_score': 50, 'intake_score': 50}
+    upserts = []
+    for k in range(args.upserts):
+        user_id = int(rng.choice(list(users))) if k % 4 else 10 ** 6 + k
+        favorite = sorted({int(s) for s in rng.choice(sports, size=rng.integers(1, 4))})
+        crew_list = sorted({int(c) for c in rng.choice(crew_ids + new_crews, size=rng.integers(0, 4))})
+        users[user_id] = {'user_id': user_id, 'score': score, 'favorite_sports': favorite, 'crew_list': crew_list}
+        upserts.append((user_id, favorite, crew_list))
+
+    # 사용자 upsert는 스레드 4개로 나눠서 (같은 사용자는 같은 스레드 - 마지막 값이 입력 순서와 같도록), 그 사이 rank를 계속 호출
+    errors, done = [], threading.Event()
+    def upsert_part(part):
+        try:
+            for user_id, favorite, crew_list in upserts:
+                if user_id % 4 == part:
+                    index.upsert_user(user_id, main.score_values(main.ScoreData(**score)), favorite, crew_list)
+        except Exception as e:
+            errors.append(e)
+    def read_loop():
+        try:
+            while not done.is_set():
+                for user_id in list(users)[:50]:
+                    if index.has_user(user_id):
+                        index.rank(user_id, limit=20)
+        except Exception as e:
+            errors.append(e)
+    reader = threading.Thread(target=read_loop)
+    writers = [threading.Thread(target=upsert_part, args=(part,)) for part in range(4)]
+    reader.start()
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    done.set()
+    reader.join()
+    assert not errors, errors
+
+    for crew_id in new_crews:
+        crews[crew_id] = {'crew_id': crew_id, 'score': score, 'crew_sports': 3}
+        index.upsert_crew(crew_id, main.score_values(main.ScoreData(**score)), 3)
+
+    fresh = index_from_payload(main, {'total_users': {'users': list(users.values())}, 'total_crews': {'crews': list(crews.values())}})
+    for user_id in users:
+        updated = {crew[0]: crew[3] for crew in index.rank(user_id)}
+        rebuilt = {crew[0]: crew[3] for crew in fresh.rank(user_id)}
+        assert updated.keys() == rebuilt.keys(), user_id
+        assert np.allclose([updated[c] for c in updated], [rebuilt[c] for c in updated]), user_id
+    print(f'{args.upserts} upserts : same content similarity as a rebuilt index')
+
+    # 3. 시간
+    print(f'member cosine mean : {expected_time * 1000:.1f} ms, crew centroids : {centroid_time * 1000:.1f} ms '
+          f'({expected_time / centroid_time:.1f}x)')
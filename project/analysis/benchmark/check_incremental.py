@@ -0,0 +1,58 @@
+import json
+import argparse
+import numpy as np
+from cases import load_service, population
+
+# 크루 추천 incremental 실행 확인
+# 전체 실행 뒤 크루 1개만 바꾼 입력으로 incremental 실행 -> 일부 사용자만 다시 계산하고,
+# 모든 사용자의 저장된 상위 20개 후보가 바로 이어서 전체(full) 실행한 결과와 같은지
+# 바꾸는 경우 : 크루 점수, 사용자 1명 크루 가입, 새 크루, 크루 삭제
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 추천 incremental 확인')
+    parser.add_argument('--users', type=int, default=400)
+    parser.add_argument('--crews', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+def run(main, payload, full=False):
+    import ingest
+    response = main.crew_recommendation(ingest.Body(json.dumps(payload).encode(), 'json', 'json'), full=full)
+    return json.loads(response.body)
+
+def saved_candidates(main):
+    return {d['id']: set(d['candidates']) for d in main.crew_fingerprint.find({'kind': 'user'})}
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from loadtest import crew_payload
+
+    rng = np.random.default_rng(args.seed)
+    payload = crew_payload(population(args.users, args.seed), args.users, args.crews, rng)
+    users, crews = payload['total_users']['users'], payload['total_crews']['crews']
+    main.crew_fingerprint.delete_many({})
+    run(main, payload, full=True)
+    assert run(main, payload)['recomputed'] == 0
+
+    def join_crew(payload):
+        user = next(u for u in users if crews[5]['crew_id'] not in (u.get('crew_list') or []))
+        user['crew_list'] = (user.get('crew_list') or []) + [crews[5]['crew_id']]
+
+    def new_crew(payload):
+        crews.append(dict(crews[0], crew_id=max(c['crew_id'] for c in crews) + 1))
+
+    changes = [
+        ('crew score', lambda payload: crews[3]['score'].update(intake_score=crews[3]['score']['intake_score'] + 1)),
+        ('user joins crew', join_crew),
+        ('new crew', new_crew),
+        ('crew removed', lambda payload: crews.pop(7)),
+    ]
+    for name, change in changes:
+        change(payload)
+        result = run(main, payload)
+        incremental = saved_candidates(main)
+        run(main, payload, full=True)
+        assert incremental == saved_candidates(main), name
+        assert result['recomputed'] < len(users), (name, result)
+        print(f"{name:<16} : {result['recomputed']} / {len(users)} users recomputed {result['reasons']}, same top 20 as a full run")
@@ -0,0 +1,72 @@
+import copy
+import argparse
+import numpy as np
+from cases import load_service, population
+
+# 크루 추천 body 빠른 읽기 (ingest.total_frames) 값 검사 확인
+# 1. 정상 body : TotalData(pydantic)로 읽은 값과 같은 DataFrame
+# 2. pydantic이 변환하던 값 ("3", 3.0) : 빠른 경로 대신 TotalData로 다시 읽어서 정상 body와 같은 결과
+# 3. 변환할 수 없는 값 (3.5, 중첩 list, 문자열 점수, null ID) : endpoint에서 422 (RequestValidationError, loc는 body부터)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='크루 추천 body 값 검사 확인')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--crews', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+def changed(payload, kind, key, value, nested=None):
+    payload = copy.deepcopy(payload)
+    item = payload[f'total_{kind}'][kind][0]
+    if nested is None:
+        item[key] = value
+    else:
+        item[key][nested] = value
+    return payload
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    import ingest
+    from fastapi.testclient import TestClient
+    from loadtest import crew_payload
+
+    payload = crew_payload(population(args.users, args.seed), args.users, args.crews, np.random.default_rng(args.seed))
+    user = payload['total_users']['users'][0]
+    user['crew_list'] = user.get('crew_list') or [payload['total_crews']['crews'][0]['crew_id']]
+
+    # 1. pydantic 경로와 같은 값
+    def frames(payload):
+        return ingest.total_frames(ingest.dumps(payload), 'json', main.TotalData)
+    expected_users, expected_crews = frames(payload)
+    request = main.TotalData.model_validate(payload)
+    assert expected_users['user_id'].tolist() == [u.user_id for u in request.total_users.users]
+    assert expected_users['crew_list'].tolist() == [u.crew_list or [] for u in request.total_users.users]
+    assert np.allclose(expected_crews[main.score_columns].to_numpy(), [list(c.score.model_dump().values()) for c in request.total_crews.crews])
+
+    # 2. 변환되는 값
+    coerced = [
+        changed(payload, 'users', 'crew_list', [str(c) for c in user['crew_list']]),
+        changed(payload, 'users', 'favorite_sports', [float(s) for s in user['favorite_sports']]),
+        changed(payload, 'crews', 'crew_sports', float(payload['total_crews']['crews'][0]['crew_sports'])),
+        changed(payload, 'users', 'score', str(user['score']['age']), nested='age'),
+    ]
+    for body in coerced:
+        users, crews = frames(body)
+        assert users.equals(expected_users) and crews.equals(expected_crews)
+
+    # 3. 변환할 수 없는 값 -> 422
+    client = TestClient(main.app)
+    invalid = [
+        ('favorite_sports 3.5', changed(payload, 'users', 'favorite_sports', [3.5])),
+        ('crew_list nested list', changed(payload, 'users', 'crew_list', [[1, 2]])),
+        ('crew_list "abc"', changed(payload, 'users', 'crew_list', ['abc'])),
+        ('crew_sports 2.5', changed(payload, 'crews', 'crew_sports', 2.5)),
+        ('user_id null', changed(payload, 'users', 'user_id', None)),
+        ('score "high"', changed(payload, 'crews', 'score', 'high', nested='basic_score')),
+    ]
+    for name, body in invalid:
+        response = client.post('/api/v1/users/crew-recommendation/fast-api', json=body)
+        assert response.status_code == 422, (name, response.status_code, response.text)
+        assert response.json()['detail'][0]['loc'][0] == 'body', (name, response.json())
+    print(f'{len(coerced)} coercible bodies read like TotalData, {len(invalid)} invalid bodies -> 422')
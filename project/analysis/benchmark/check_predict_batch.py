@@ -0,0 +1,37 @@
+import argparse
+import numpy as np
+from cases import load_service, population
+
+# 예측 batch endpoint 사용자별 오류 확인
+# 정상 사용자 사이에 7일보다 긴 exercise_data (8일) / 빈 exercise_data 사용자를 섞어서 보냈을 때
+# - 응답은 200, 정상 사용자는 predictions에, 잘못된 사용자만 errors에
+# - 정상 사용자 예측은 저장됨 (predict_basic)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='예측 batch 사용자별 오류 확인')
+    parser.add_argument('--users', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    main = load_service()
+    from fastapi.testclient import TestClient
+    from loadtest import predict_payload, exercise_days
+
+    rng = np.random.default_rng(args.seed)
+    pop = population(args.users, args.seed)
+    requests = [dict(predict_payload(pop, k, rng), user_id=k) for k in range(args.users)]
+    oversized, empty = 10 ** 6, 10 ** 6 + 1
+    requests.insert(1, {'user_id': oversized, 'exercise_data': exercise_days(pop, 0, 0, 8)})
+    requests.insert(3, {'user_id': empty, 'exercise_data': []})
+
+    before = main.predict_basic.count_documents({})
+    response = TestClient(main.app).post('/api/v1/users/body/prediction/batch/fast-api', json={'requests': requests})
+    assert response.status_code == 200, (response.status_code, response.text)
+    result = response.json()
+
+    assert sorted(p['user_id'] for p in result['predictions']) == list(range(args.users)), result['predictions']
+    assert sorted(e['user_id'] for e in result['errors']) == [oversized, empty], result['errors']
+    assert main.predict_basic.count_documents({}) - before == args.users
+    print(f"{args.users} valid + 2 invalid users : {len(result['predictions'])} predictions saved, errors {[e['detail'] for e in result['errors']]}")
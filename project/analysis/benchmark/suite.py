@@ -0,0 +1,157 @@
+import os
+import io
+import sys
+import json
+import time
+import platform
+import argparse
+import warnings
+import subprocess
+import contextlib
+from datetime import datetime
+import numpy as np
+from cases import analysis_dir, build_cases
+
+# 분석 코드 성능 벤치마크 실행 / 비교
+#   python suite.py run [--scale small|large] [-k 이름 일부] [--out results/xxx.json]
+#   python suite.py compare results/base.json results/new.json [--threshold 0.1]
+# - 케이스마다 warm-up 1번 후, repeat번 x number회 호출해서 1회당 시간 (number는 1번 측정이 min_time 이상 되도록 자동)
+# - 결과는 commit 별 json으로 저장하고, compare는 두 결과의 시간 비율로 느려진 케이스를 표시 (있으면 종료 코드 1)
+
+default_out_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=analysis_dir, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--', '.', ':!benchmark/results'], cwd=analysis_dir, capture_output=True, text=True).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+# 측정 중 print / keras 진행 표시 / sklearn 경고는 버린다.
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()), warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        yield
+
+def measure(func, repeat=5, min_time=0.2, max_number=1000):
+    with quiet():
+        func()  # warm-up
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time or number >= max_number:
+                break
+            number = min(max_number, number * 10)
+
+        times = [elapsed / number]
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            times.append((time.perf_counter() - start) / number)
+
+    times = np.array(times)
+    return {'min': float(times.min()), 'median': float(np.median(times)), 'mean': float(times.mean()),
+            'stdev': float(times.std()), 'repeat': repeat, 'number': number}
+
+def format_time(seconds):
+    if seconds >= 1:
+        return f'{seconds:.2f} s'
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.2f} ms'
+    return f'{seconds * 1e6:.1f} us'
+
+def run(scale='small', keyword=None, repeat=5, min_time=0.2, seed=0):
+    results = {}
+    for name, setup, params in build_cases(scale):
+        if keyword and keyword not in name:
+            continue
+        with quiet():
+            func = setup(seed, **params)
+        results[name] = measure(func, repeat, min_time)
+        print(f"{name:<55}{format_time(results[name]['median']):>12}  (min {format_time(results[name]['min'])}, x{results[name]['number']})")
+
+    meta = {
+        'commit': git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'scale': scale,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+    return {'meta': meta, 'results': results}
+
+# base 대비 new 시간 비율 - threshold 이상 느려지면 REGRESSION
+def compare(base, new, threshold=0.1, stat='min'):
+    rows = []
+    for name in sorted(set(base['results']) | set(new['results'])):
+        if name not in new['results']:
+            rows.append((name, base['results'][name][stat], None, None, 'removed'))
+        elif name not in base['results']:
+            rows.append((name, None, new['results'][name][stat], None, 'added'))
+        else:
+            old, now = base['results'][name][stat], new['results'][name][stat]
+            ratio = now / old
+            status = 'REGRESSION' if ratio > 1 + threshold else ('faster' if ratio < 1 / (1 + threshold) else '')
+            rows.append((name, old, now, ratio, status))
+    return rows
+
+def format_compare(rows, base_meta, new_meta, stat):
+    lines = [f"{stat} time per call : {base_meta['commit']} -> {new_meta['commit']}",
+             f"{'case':<55}{'base':>12}{'new':>12}{'ratio':>8}  status"]
+    for name, old, now, ratio, status in rows:
+        lines.append(f"{name:<55}{format_time(old) if old is not None else '-':>12}{format_time(now) if now is not None else '-':>12}"
+                     f"{f'{ratio:.2f}x' if ratio is not None else '-':>8}  {status}")
+    regressions = sum(1 for row in rows if row[4] == 'REGRESSION')
+    lines.append(f'{regressions} regression(s)')
+    return '\n'.join(lines)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='분석 코드 성능 벤치마크')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help='벤치마크 실행 후 json 저장')
+    run_parser.add_argument('--scale', choices=['small', 'large'], default='small')
+    run_parser.add_argument('-k', '--keyword', default=None, help='이름에 포함된 케이스만 실행')
+    run_parser.add_argument('--repeat', type=int, default=5)
+    run_parser.add_argument('--min-time', type=float, default=0.2, help='1번 측정의 최소 시간 (초)')
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--out', default=None, help='결과 json (기본: results/<commit>.json)')
+
+    compare_parser = sub.add_parser('compare', help='두 결과 비교')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='느려졌다고 볼 비율 (0.1 = 10%%)')
+    compare_parser.add_argument('--stat', choices=['min', 'median', 'mean'], default='min')
+
+    sub.add_parser('list', help='케이스 목록')
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == 'list':
+        for scale in ['small', 'large']:
+            print(f'[{scale}]')
+            for name, _, _ in build_cases(scale):
+                print(f'  {name}')
+    elif args.command == 'run':
+        report = run(args.scale, args.keyword, args.repeat, args.min_time, args.seed)
+        out = args.out or os.path.join(default_out_dir, f"{report['meta']['commit']}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+        with open(out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Saved {out}')
+    else:
+        with open(args.base) as f:
+            base = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        rows = compare(base, new, args.threshold, args.stat)
+        print(format_compare(rows, base['meta'], new['meta'], args.stat))
+        sys.exit(1 if any(row[4] == 'REGRESSION' for row in rows) else 0)
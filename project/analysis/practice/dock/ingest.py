@@ -0,0 +1,187 @@
+import gc
+import json
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import chain
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from bson import ObjectId
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from scoring import score_columns
+
+# 요청 / 응답 body 형식 (JSON, MessagePack)
+# - 요청 : Content-Type이 application/msgpack (x-msgpack, vnd.msgpack) 이면 MessagePack, 아니면 JSON
+# - 응답 : 요청과 같은 형식 (Accept에 다른 형식만 적혀 있으면 그 형식), 오류 응답은 JSON
+# JSON은 orjson (설치되어 있지 않으면 json), MessagePack은 msgpack (없으면 415)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_TYPE = 'application/msgpack'
+msgpack_types = {'application/msgpack', 'application/x-msgpack', 'application/vnd.msgpack'}
+
+# 요청 JSON 점수 키 -> score_columns 순서
+score_keys = ['m_type', 'type', 'age', 'basic_score', 'activity_score', 'intake_score']
+
+# data : body bytes, format : 요청 형식, reply : 응답 형식 ('json' | 'msgpack')
+Body = namedtuple('Body', ['data', 'format', 'reply'])
+
+# Content-Type / Accept 값 1개 -> 'json' | 'msgpack' | None
+def media_format(value):
+    media = (value or '').split(';')[0].strip().lower()
+    if media in msgpack_types:
+        return 'msgpack'
+    if media == 'application/json' or media.endswith('+json'):
+        return 'json'
+    return None
+
+def loads(data, body_format='json'):
+    try:
+        if body_format == 'msgpack':
+            return msgpack.unpackb(data, raw=False)
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception as e:
+        raise ValueError(f'invalid {body_format} body : {e!r}')
+
+@contextmanager
+def gc_paused():
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+# endpoint Depends 용 - body bytes와 형식만 읽고 파싱은 endpoint에서
+async def raw_body(request: Request):
+    body_format = media_format(request.headers.get('content-type')) or 'json'
+    if body_format == 'msgpack' and msgpack is None:
+        raise HTTPException(status_code=415, detail='MessagePack is not available : install msgpack')
+    accepted = {media_format(value) for value in request.headers.get('accept', '').split(',')} - {None}
+    if msgpack is None:
+        accepted.discard('msgpack')
+    reply = body_format if body_format in accepted or not accepted else accepted.pop()
+    return Body(await request.body(), body_format, reply)
+
+# pydantic 모델로 읽기 - 형식 / 값 오류는 FastAPI 기본과 같은 422 (loc는 body부터)
+def parse_model(model, body):
+    try:
+        return model.model_validate(loads(body.data, body.format))
+    except ValidationError as e:
+        raise RequestValidationError([dict(error, loc=('body', *error['loc'])) for error in e.errors()])
+    except ValueError as e:
+        raise RequestValidationError([{'type': 'body_invalid', 'loc': ('body',), 'msg': str(e), 'input': None}])
+
+### 응답 인코딩
+# JSON / MessagePack에 없는 타입 - ObjectId는 문자열, datetime은 ISO 문자열, numpy 값은 python 값
+def plain_value(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f'{type(value).__name__} is not serializable')
+
+def dumps(content, body_format='json'):
+    if body_format == 'msgpack':
+        return msgpack.packb(content, default=plain_value)
+    if orjson is not None:
+        return orjson.dumps(content, default=plain_value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, default=plain_value).encode()
+
+# JSON 응답 - pydantic 모델은 pydantic 직렬화 (alias 사용), 나머지는 orjson (jsonable_encoder / convert_objectid 같은 dict 순회 없음)
+class FastJSONResponse(JSONResponse):
+    def render(self, content):
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode()
+        return dumps(content, 'json')
+
+# 응답 형식에 맞는 Response (body가 없으면 JSON) - endpoint에서 바로 돌려주면 FastAPI 응답 변환을 거치지 않는다.
+def respond(body, content):
+    if body is not None and body.reply == 'msgpack':
+        if isinstance(content, BaseModel):
+            content = content.model_dump(mode='json', by_alias=True)
+        return Response(content=dumps(content, 'msgpack'), media_type=MSGPACK_TYPE)
+    return FastJSONResponse(content)
+
+### 크루 추천 요청 (TotalData 형식) 빠른 읽기
+# pydantic 모델 (TotalData) -> DataFrame으로 두 번 옮기지 않고, body를 orjson / msgpack으로 파싱해서 바로 컬럼 배열로 만든다.
+# - 점수 6개 : (사용자 수 x 6) float 배열 1개 (score_columns 순서)
+# - ID : int64 배열, 선호 스포츠 / 가입 크루 : 파싱된 list를 그대로 사용 (복사 없음)
+# 사용자 / 크루 목록은 컬럼으로 옮긴 뒤 바로 버려서 파싱 결과와 DataFrame이 같이 오래 남지 않게 한다.
+# 파싱 중에는 gc를 멈춘다. (순환 참조 없는 객체를 수십만 개 만들 때 gc가 반복해서 도는 시간이 파싱 시간만큼 걸림)
+# 빠른 경로는 ID는 int, 점수는 int / float만 받는다. 아니면 ValueError -> model이 있으면 pydantic 모델로 다시 읽어서
+# 이전과 같이 변환 가능한 값은 변환하고 (예: "3"), 아니면 422 (RequestValidationError)
+number_types = {int, float}  # bool은 int의 하위 타입이지만 type()으로 비교하므로 제외
+
+def score_matrix(items, name):
+    try:
+        scores = [[item['score'][key] for key in score_keys] for item in items]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f'{name}.score : {e!r}')
+    if not set(map(type, chain.from_iterable(scores))) <= number_types:
+        raise ValueError(f'{name}.score : numbers required')
+    return np.array(scores, dtype=float).reshape(-1, len(score_keys))
+
+def int_array(items, key, name):
+    try:
+        values = [item[key] for item in items]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f'{name}.{key} : {e!r}')
+    if not set(map(type, values)) <= {int}:
+        raise ValueError(f'{name}.{key} : int required')
+    return np.array(values, dtype=np.int64)
+
+# 선호 스포츠 / 가입 크루 ID 목록 (required=False면 없거나 null일 때 빈 목록)
+def id_lists(items, key, name, required=True):
+    try:
+        values = [item[key] if required else (item.get(key) or []) for item in items]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f'{name}.{key} : {e!r}')
+    if not (set(map(type, values)) <= {list} and set(map(type, chain.from_iterable(values))) <= {int}):
+        raise ValueError(f'{name}.{key} : list of int required')
+    return values
+
+# body -> (user_data, crew_data) DataFrame (crew_recommendation 1-1과 같은 컬럼)
+# model (TotalData) : 빠른 경로에서 형식이 틀렸을 때 다시 읽을 pydantic 모델 (없으면 ValueError 그대로)
+def total_frames(data, body_format='json', model=None):
+    try:
+        with gc_paused():
+            return document_frames(loads(data, body_format))
+    except ValueError:
+        if model is None:
+            raise
+    request = parse_model(model, Body(data, body_format, body_format))
+    return document_frames(request.model_dump())
+
+# document의 사용자 / 크루 목록은 꺼내면서 지운다. (호출한 쪽이 document를 들고 있어도 목록은 여기서 바로 해제)
+def document_frames(document):
+    try:
+        users, crews = document['total_users'].pop('users'), document['total_crews'].pop('crews')
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f'total_users.users / total_crews.crews required : {e!r}')
+    del document
+
+    user_data = pd.DataFrame(score_matrix(users, 'users'), columns=score_columns)
+    user_data.insert(0, 'user_id', int_array(users, 'user_id', 'users'))
+    user_data['favorite_sports'] = id_lists(users, 'favorite_sports', 'users')
+    user_data['crew_list'] = id_lists(users, 'crew_list', 'users', required=False)
+    del users
+
+    crew_data = pd.DataFrame(score_matrix(crews, 'crews'), columns=score_columns)
+    crew_data.insert(0, 'crew_id', int_array(crews, 'crew_id', 'crews'))
+    crew_data['crew_sports'] = int_array(crews, 'crew_sports', 'crews')
+    return user_data, crew_data
@@ -0,0 +1,241 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import numpy as np
+import pandas as pd
+import httpx
+
+# FastAPI 서비스 부하 테스트 - Spring 스케쥴러의 새벽 요청을 재현
+# - 03:30 crew : 전체 사용자 / 크루 TotalData로 크루 추천 (crew-recommendation)
+# - 04:30 predict : 사용자마다 UserExerciseRequest로 기본 예측 (일부는 추가 운동 예측)
+# 요청 데이터는 prediction/dummy/outputs 에서 생성된 가상 사용자 (csv 또는 store.py 저장소)로 만든다.
+# --url 을 주지 않으면 main.app을 같은 프로세스에서 띄우고 (ASGI), MongoDB는 메모리 저장소로 대체
+# 결과: endpoint별 요청 수, 실패 수, 초당 처리량, p50 / p95 / p99 / max 지연 시간
+
+dock_dir = os.path.dirname(os.path.abspath(__file__))
+default_population = os.path.join(dock_dir, '..', '..', 'prediction', 'dummy', 'outputs', 'shards')
+
+endpoints = {
+    'predict': '/api/v1/users/{user_id}/body/prediction/fast-api',
+    'extra': '/api/v1/users/{user_id}/body/prediction/extra/fast-api',
+    'crew': '/api/v1/users/crew-recommendation/fast-api',
+}
+population_columns = ['sex', 'age', 'BMI', 'weight', 'calories', 'muscle']
+
+### 가상 사용자 불러오기 - 사용자별 정보 + (사용자 수, 일 수) 시계열
+def load_population(path, max_users, rng):
+    if path and os.path.isfile(os.path.join(path, '_store.json')):
+        # store.py 저장소 - chunk마다 npz 배열 그대로
+        arrays = {column: [] for column in ['user_id'] + population_columns}
+        for file in sorted(f for f in os.listdir(path) if f.endswith('.npz')):
+            with np.load(os.path.join(path, file)) as chunk:
+                for column in arrays:
+                    arrays[column].append(chunk[column])
+            if sum(len(a) for a in arrays['user_id']) >= max_users:
+                break
+        population = {column: np.concatenate(values)[:max_users] for column, values in arrays.items()}
+    elif path and os.path.isdir(path) and any(f.endswith('.csv') for f in os.listdir(path)):
+        # csv (sample_*.csv 또는 generate.py 파티션)
+        frames, count = [], 0
+        for file in sorted(f for f in os.listdir(path) if f.endswith('.csv')):
+            df = pd.read_csv(os.path.join(path, file), usecols=['user_id'] + population_columns)
+            frames.append(df)
+            count += df['user_id'].nunique()
+            if count >= max_users:
+                break
+        users = [user_df for _, user_df in pd.concat(frames).groupby('user_id', sort=True)][:max_users]
+        population = {'user_id': np.array([df['user_id'].iloc[0] for df in users])}
+        for column in population_columns:
+            population[column] = np.stack([df[column].to_numpy() for df in users])
+        for column in ['sex', 'age', 'muscle']:
+            population[column] = population[column][:, 0]
+    else:
+        print(f'가상 사용자 데이터가 없어서 ({path}) 난수로 {max_users}명을 만듭니다.')
+        population = synthetic_population(max_users, rng)
+
+    print(f'population: {len(population["user_id"])} users x {population["weight"].shape[1]} days')
+    return population
+
+# 가상 사용자 데이터 없이 실행할 때 (dummy 생성 결과와 같은 범위의 값)
+def synthetic_population(n_users, rng, days=980):
+    sex = rng.integers(1, 3, n_users)
+    height = np.where(sex == 1, rng.normal(172, 6, n_users), rng.normal(159, 5, n_users))
+    weight = rng.uniform(45, 100, (n_users, 1)) + np.cumsum(rng.uniform(-0.1, 0.1, (n_users, days)), axis=1)
+    return {
+        'user_id': np.arange(n_users),
+        'sex': sex,
+        'age': rng.integers(19, 80, n_users),
+        'weight': weight,
+        'BMI': weight / (height[:, np.newaxis] / 100) ** 2,
+        'calories': rng.normal(300, 120, (n_users, days)).clip(50, None),
+        'muscle': rng.uniform(20, 40, n_users),
+    }
+
+### 요청 데이터 만들기
+# 사용자 k의 임의의 날짜부터 n일간 ExerciseData 목록
+def exercise_days(population, k, start, n):
+    return [{
+        'sex': int(population['sex'][k]),
+        'age': int(population['age'][k]),
+        'bmi': round(float(population['BMI'][k, day]), 2),
+        'weight': round(float(population['weight'][k, day]), 2),
+        'calories': round(float(population['calories'][k, day]), 2),
+    } for day in range(start, start + n)]
+
+# UserExerciseRequest - 기본 예측은 최근 7일, 추가 운동 예측은 기록된 날 + 추가 운동한 날 (합쳐서 7일 이하)
+def predict_payload(population, k, rng, extra=False):
+    days = population['weight'].shape[1]
+    start = int(rng.integers(0, days - 7))
+    if not extra:
+        return {'exercise_data': exercise_days(population, k, start, 7)}
+
+    recorded = int(rng.integers(1, 7))
+    return {
+        'exercise_detail': {'exercise_id': int(rng.integers(1, 31)), 'duration': int(rng.integers(10, 121)), 'count': int(rng.integers(1, 6))},
+        'exercise_data': exercise_days(population, k, start, recorded),
+        'extra_exercise_data': exercise_days(population, k, start + recorded, int(rng.integers(1, 8 - recorded))),
+    }
+
+# 사용자의 체형 / 활동 / 식습관 점수 (0 ~ 100)
+def user_scores(population, rows, rng):
+    bmi = population['BMI'][rows, -1]
+    calories = population['calories'][rows].mean(axis=1)
+    return {
+        'm_type': (population['muscle'][rows] >= np.median(population['muscle'])).astype(float),
+        'type': (bmi >= 25).astype(float),
+        'age': population['age'][rows].astype(int),
+        'basic_score': np.clip(100 - np.abs(bmi - 22) * 5, 0, 100).round(1),
+        'activity_score': np.clip(calories / 8, 0, 100).round(1),
+        'intake_score': rng.uniform(30, 90, len(rows)).round(1),
+    }
+
+# TotalData - 사용자 n_users명, 크루 n_crews개 (크루 점수는 소속 사용자 평균)
+def crew_payload(population, n_users, n_crews, rng):
+    rows = rng.choice(len(population['user_id']), size=n_users, replace=n_users > len(population['user_id']))
+    scores = user_scores(population, rows, rng)
+    crew_lists = [sorted(set(rng.integers(1, n_crews + 1, int(rng.integers(0, 3))).tolist())) for _ in range(n_users)]
+
+    users = [{
+        'user_id': int(k),
+        'score': {name: (int(values[k]) if name == 'age' else float(values[k])) for name, values in scores.items()},
+        'favorite_sports': sorted(set(rng.integers(1, 31, int(rng.integers(1, 4))).tolist())),
+        'crew_list': crew_lists[k],
+    } for k in range(n_users)]
+
+    crew_members = {}
+    for k, crew_list in enumerate(crew_lists):
+        for crew_id in crew_list:
+            crew_members.setdefault(crew_id, []).append(k)
+
+    crews = []
+    for crew_id in range(1, n_crews + 1):
+        members = crew_members.get(crew_id) or [int(rng.integers(0, n_users))]
+        crews.append({
+            'crew_id': crew_id,
+            'score': {name: (int(np.mean(values[members])) if name == 'age' else float(np.mean(values[members]))) for name, values in scores.items()},
+            'crew_sports': int(rng.integers(1, 31)),
+        })
+    return {'total_users': {'users': users}, 'total_crews': {'crews': crews}}
+
+### 실행
+# 요청 목록을 concurrency개씩 동시에 보내고 (endpoint, 지연 시간, 상태 코드) 기록
+async def run_phase(client, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    records = []
+
+    async def send(endpoint, url, payload):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            records.append((endpoint, time.perf_counter() - start, status))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(*request) for request in requests))
+    return records, time.perf_counter() - start
+
+def summarize(phase, records, elapsed):
+    rows = []
+    for endpoint in sorted({r[0] for r in records}):
+        latency = np.array([r[1] for r in records if r[0] == endpoint]) * 1000
+        errors = sum(1 for r in records if r[0] == endpoint and r[2] != 200)
+        p50, p95, p99 = np.percentile(latency, [50, 95, 99])
+        rows.append({'phase': phase, 'endpoint': endpoint, 'requests': len(latency), 'errors': errors,
+                     'throughput': len(latency) / elapsed, 'p50_ms': p50, 'p95_ms': p95, 'p99_ms': p99, 'max_ms': latency.max()})
+    return rows
+
+def format_report(rows):
+    lines = [f"{'phase':<9}{'endpoint':<9}{'requests':>9}{'errors':>8}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for r in rows:
+        lines.append(f"{r['phase']:<9}{r['endpoint']:<9}{r['requests']:>9}{r['errors']:>8}{r['throughput']:>9.1f}"
+                     f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['max_ms']:>10.1f}")
+    return '\n'.join(lines)
+
+# 시나리오별 요청 목록 - [(phase, [(endpoint, url, payload), ...], concurrency)]
+def build_phases(args, population, rng):
+    phases = []
+    if args.scenario in ('nightly', 'crew'):
+        payload = crew_payload(population, args.crew_users, args.crew_crews, rng)
+        phases.append(('crew', [('crew', endpoints['crew'], payload)] * args.crew_requests, 1))
+    if args.scenario in ('nightly', 'predict'):
+        requests = []
+        for _ in range(args.requests):
+            k = int(rng.integers(0, len(population['user_id'])))
+            endpoint = 'extra' if rng.random() < args.extra_ratio else 'predict'
+            url = endpoints[endpoint].format(user_id=int(population['user_id'][k]))
+            requests.append((endpoint, url, predict_payload(population, k, rng, extra=endpoint == 'extra')))
+        phases.append(('predict', requests, args.concurrency))
+    return phases
+
+async def run(args):
+    rng = np.random.default_rng(args.seed)
+    population = load_population(args.population, args.max_users, rng)
+    phases = build_phases(args, population, rng)
+
+    rows = []
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=None) as client:
+            for phase, requests, concurrency in phases:
+                rows.extend(summarize(phase, *await run_phase(client, requests, concurrency)))
+    else:
+        # 같은 프로세스에서 main.app 실행 (모델 / 스케일러는 dock 폴더 기준 상대 경로)
+        os.environ.setdefault('MONGO_URI', 'memory://')
+        os.chdir(dock_dir)
+        sys.path.insert(0, dock_dir)
+        import main
+        async with main.load_model_startup(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url='http://loadtest', timeout=None) as client:
+                for phase, requests, concurrency in phases:
+                    rows.extend(summarize(phase, *await run_phase(client, requests, concurrency)))
+    return rows
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='FastAPI 서비스 부하 테스트 (새벽 스케쥴러 요청 재현)')
+    parser.add_argument('--url', default=None, help='서버 주소 (예: http://localhost:8000), 없으면 같은 프로세스에서 실행')
+    parser.add_argument('--scenario', choices=['nightly', 'crew', 'predict'], default='nightly')
+    parser.add_argument('--population', default=default_population, help='가상 사용자 폴더 (csv 또는 store 저장소)')
+    parser.add_argument('--max-users', type=int, default=5000, help='불러올 최대 사용자 수')
+    parser.add_argument('--requests', type=int, default=200, help='predict 단계 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--extra-ratio', type=float, default=0.1, help='추가 운동 예측 요청 비율')
+    parser.add_argument('--crew-users', type=int, default=200)
+    parser.add_argument('--crew-crews', type=int, default=50)
+    parser.add_argument('--crew-requests', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', default=None, help='결과 저장 경로')
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    rows = asyncio.run(run(args))
+    print(format_report(rows))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'args': vars(args), 'results': rows}, f, indent=2)
@@ -0,0 +1,143 @@
+import threading
+from copy import deepcopy as dp
+from bson import ObjectId
+
+# 로컬 테스트 / 부하 테스트용 MongoDB 대체 (MONGO_URI=memory://)
+# main.py에서 쓰는 pymongo API만 메모리 dict 리스트로 흉내낸다.
+# - insert_one / insert_many 는 pymongo처럼 문서에 _id(ObjectId)를 넣는다.
+# - find / find_one / count_documents / delete_many / update_one 은 단순 일치 조건만 지원
+# - bulk_write 는 pymongo UpdateOne($set, upsert)만 지원
+
+class InsertOneResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+class InsertManyResult:
+    def __init__(self, inserted_ids):
+        self.inserted_ids = inserted_ids
+
+class UpdateResult:
+    def __init__(self, matched_count, upserted_id=None):
+        self.matched_count = matched_count
+        self.upserted_id = upserted_id
+
+class BulkWriteResult:
+    def __init__(self, matched_count, upserted_count):
+        self.matched_count = matched_count
+        self.upserted_count = upserted_count
+
+class DeleteResult:
+    def __init__(self, deleted_count):
+        self.deleted_count = deleted_count
+
+def matches(document, query):
+    for key, value in (query or {}).items():
+        if isinstance(value, dict) and '$in' in value:
+            if document.get(key) not in value['$in']:
+                return False
+        elif document.get(key) != value:
+            return False
+    return True
+
+class MemoryCollection:
+    def __init__(self, name):
+        self.name = name
+        self.documents = []
+        self.lock = threading.Lock()
+
+    def insert_one(self, document):
+        document.setdefault('_id', ObjectId())
+        with self.lock:
+            self.documents.append(dp(document))
+        return InsertOneResult(document['_id'])
+
+    def insert_many(self, documents, ordered=True):
+        documents = list(documents)
+        for document in documents:
+            document.setdefault('_id', ObjectId())
+        with self.lock:
+            self.documents.extend(dp(documents))
+        return InsertManyResult([document['_id'] for document in documents])
+
+    def find(self, query=None, projection=None):
+        with self.lock:
+            found = [dp(d) for d in self.documents if matches(d, query)]
+        if projection:
+            keep = {k for k, v in projection.items() if v}
+            found = [{k: v for k, v in d.items() if k in keep or (k == '_id' and projection.get('_id', 1))} for d in found]
+        return found
+
+    def find_one(self, query=None, projection=None):
+        found = self.find(query, projection)
+        return found[0] if found else None
+
+    def count_documents(self, query):
+        with self.lock:
+            return sum(1 for d in self.documents if matches(d, query))
+
+    def update_one(self, query, update, upsert=False):
+        with self.lock:
+            for document in self.documents:
+                if matches(document, query):
+                    document.update(dp(update.get('$set', {})))
+                    return UpdateResult(1)
+            if upsert:
+                document = dict(query, **dp(update.get('$set', {})), _id=ObjectId())
+                self.documents.append(document)
+                return UpdateResult(0, document['_id'])
+        return UpdateResult(0)
+
+    # UpdateOne 목록 - 조건이 단순 일치(같은 키 집합)이면 문서를 한 번만 훑어서 색인을 만들고 적용 (update_one을 반복하면 문서 수 x 요청 수)
+    def bulk_write(self, requests, ordered=True):
+        matched, upserted, indexes = 0, 0, {}
+        with self.lock:
+            for request in requests:
+                query, update, upsert = request._filter, request._doc, request._upsert
+                keys = tuple(sorted(query))
+                if any(isinstance(query[key], dict) for key in keys):
+                    raise NotImplementedError('bulk_write supports equality filters only')
+                if keys not in indexes:
+                    indexes[keys] = {}
+                    for document in self.documents:
+                        indexes[keys].setdefault(tuple(document.get(key) for key in keys), document)
+                value = tuple(query[key] for key in keys)
+                document = indexes[keys].get(value)
+                if document is not None:
+                    document.update(dp(update.get('$set', {})))
+                    matched += 1
+                elif upsert:
+                    document = dict(query, **dp(update.get('$set', {})), _id=ObjectId())
+                    self.documents.append(document)
+                    for index_keys, index in indexes.items():
+                        index.setdefault(tuple(document.get(key) for key in index_keys), document)
+                    upserted += 1
+        return BulkWriteResult(matched, upserted)
+
+    def delete_many(self, query):
+        with self.lock:
+            before = len(self.documents)
+            self.documents = [d for d in self.documents if not matches(d, query)]
+            return DeleteResult(before - len(self.documents))
+
+class MemoryDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = MemoryCollection(name)
+        return self.collections[name]
+
+class MemoryClient:
+    def __init__(self):
+        self.databases = {}
+        self.admin = self
+
+    # client.admin.command("ping") 대응
+    def command(self, name):
+        return {'ok': 1.0}
+
+    def __getitem__(self, name):
+        if name not in self.databases:
+            self.databases[name] = MemoryDatabase()
+        return self.databases[name]
@@ -0,0 +1,261 @@
+import os
+import io
+import sys
+import json
+import time
+import uuid
+import pstats
+import cProfile
+import asyncio
+import threading
+import functools
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+from starlette.routing import Match
+
+# 운영 중 느린 요청 원인 확인용 프로파일링 (PROFILE_TOKEN 환경 변수가 있을 때만 동작)
+# - 요청 헤더 X-Profile: cprofile | sample | pyinstrument (+ X-Profile-Token) -> 그 요청 1번 프로파일
+# - POST /api/v1/admin/profiling/arm {route, count, kind} -> 해당 route의 다음 count개 요청 프로파일
+# - GET  /api/v1/admin/profiling/profiles (목록), /api/v1/admin/profiling/profiles/{file_name} (다운로드)
+# 프로파일은 PROFILE_DIR (기본 ./profiles)에 저장
+#   cprofile : <id>.prof (pstats) + <id>.txt (누적 시간 상위 함수)
+#   sample   : <id>.folded (요청 처리 스레드 스택을 interval마다 수집, flamegraph / speedscope 형식) + <id>.txt
+#   pyinstrument : <id>.html (설치되어 있을 때만)
+# 측정은 @profiled 를 붙인 endpoint 안에서 한다. (동기 endpoint는 threadpool 스레드에서 실행되기 때문)
+# 주의 : 비동기(async def) endpoint는 이벤트 루프 스레드에서 돌기 때문에 await 동안 같이 실행된 다른 요청의 코루틴도
+#        프로파일에 섞인다. (cprofile / sample 모두, 요청 1개만의 시간이 필요하면 동기 endpoint에서 측정)
+# 미들웨어는 PROFILE_TOKEN이 있을 때만 등록한다. (main.py)
+
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "./profiles")
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))  # 초
+profile_kinds = ['cprofile', 'sample', 'pyinstrument']
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:
+    PyinstrumentProfiler = None
+
+# 현재 요청의 프로파일 세션 (미들웨어에서 넣고 endpoint에서 채움)
+current_session: ContextVar[Optional[dict]] = ContextVar('current_session', default=None)
+
+# route 이름별 남은 프로파일 횟수 {'crew_recommendation': {'count': 3, 'kind': 'sample'}}
+armed = {}
+armed_lock = threading.Lock()
+
+def enabled():
+    return bool(PROFILE_TOKEN)
+
+def check_token(request: Request):
+    return enabled() and request.headers.get('x-profile-token') == PROFILE_TOKEN
+
+def route_name(request: Request):
+    for route in request.app.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, 'name', None)
+    return None
+
+# 이번 요청을 프로파일할지 - 헤더가 우선, 아니면 arm 해둔 횟수에서 1개 사용
+def take_kind(request: Request, name):
+    kind = request.headers.get('x-profile')
+    if kind and check_token(request):
+        return kind if kind in profile_kinds else 'cprofile'
+    with armed_lock:
+        entry = armed.get(name)
+        if entry:
+            entry['count'] -= 1
+            if entry['count'] <= 0:
+                del armed[name]
+            return entry['kind']
+    return None
+
+### 샘플링 프로파일러 - 대상 스레드의 스택을 interval마다 모아서 (root;...;leaf) 별 횟수
+class Sampler(threading.Thread):
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stop_event = threading.Event()
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+def sample_summary(stacks, top=40):
+    total = sum(stacks.values()) or 1
+    self_counts, inclusive = Counter(), Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')
+        self_counts[frames[-1]] += count
+        for frame in set(frames):
+            inclusive[frame] += count
+    lines = [f'{total} samples', '', 'self %    total %   function']
+    for frame, count in self_counts.most_common(top):
+        lines.append(f'{count / total * 100:>6.1f}    {inclusive[frame] / total * 100:>6.1f}   {frame}')
+    return '\n'.join(lines)
+
+### endpoint 안에서 프로파일러 켜고 끄기
+def start(session):
+    kind = session['kind']
+    if kind == 'pyinstrument' and PyinstrumentProfiler is not None:
+        session['profiler'] = PyinstrumentProfiler(async_mode='enabled')
+    elif kind == 'sample':
+        session['profiler'] = Sampler(threading.get_ident())
+    else:
+        session['kind'] = 'cprofile'
+        session['profiler'] = cProfile.Profile()
+    if session['kind'] == 'cprofile':
+        session['profiler'].enable()
+    else:
+        session['profiler'].start()
+    session['started'] = time.perf_counter()
+
+def stop(session):
+    profiler = session['profiler']
+    if session['kind'] == 'cprofile':
+        profiler.disable()
+    else:
+        profiler.stop()
+    session['duration_ms'] = round((time.perf_counter() - session['started']) * 1000, 1)
+
+# 동기 / 비동기 endpoint 모두 - 현재 요청에 세션이 있을 때만 측정
+# 비동기 endpoint는 start ~ stop 사이에 이벤트 루프가 실행한 다른 요청의 작업까지 포함된다. (위 주의 참고)
+def profiled(func):
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            session = current_session.get()
+            if session is None:
+                return await func(*args, **kwargs)
+            start(session)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                stop(session)
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            session = current_session.get()
+            if session is None:
+                return func(*args, **kwargs)
+            start(session)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stop(session)
+    return wrapper
+
+### 저장
+def save(session):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    base = os.path.join(PROFILE_DIR, session['id'])
+    profiler = session['profiler']
+    if session['kind'] == 'cprofile':
+        profiler.dump_stats(base + '.prof')
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(40)
+        files = {'.prof': None, '.txt': text.getvalue()}
+    elif session['kind'] == 'sample':
+        files = {'.folded': '\n'.join(f'{stack} {count}' for stack, count in profiler.stacks.items()),
+                 '.txt': sample_summary(profiler.stacks)}
+    else:
+        files = {'.html': profiler.output_html()}
+
+    for ext, content in files.items():
+        if content is not None:
+            with open(base + ext, 'w') as f:
+                f.write(content)
+
+    meta = {'id': session['id'], 'route': session['route'], 'kind': session['kind'], 'path': session['path'],
+            'duration_ms': session['duration_ms'], 'created_at': session['created_at'],
+            'files': [session['id'] + ext for ext in files]}
+    with open(base + '.json', 'w') as f:
+        json.dump(meta, f)
+    return meta
+
+# app.middleware("http")에 등록 (main.py에서 enabled()일 때만 등록)
+async def profile_middleware(request: Request, call_next):
+    if not enabled():
+        return await call_next(request)
+    name = route_name(request)
+    kind = take_kind(request, name) if name else None
+    if kind is None:
+        return await call_next(request)
+
+    session = {'id': f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{name}-{uuid.uuid4().hex[:6]}", 'route': name,
+               'kind': kind, 'path': request.url.path, 'created_at': datetime.utcnow().isoformat()}
+    token = current_session.set(session)
+    try:
+        response = await call_next(request)
+    finally:
+        current_session.reset(token)
+
+    if 'profiler' in session:  # @profiled 가 없는 route는 저장하지 않음
+        meta = save(session)
+        response.headers['X-Profile-Id'] = meta['id']
+    return response
+
+### 관리용 API
+router = APIRouter(prefix="/api/v1/admin/profiling")
+
+class ArmRequest(BaseModel):
+    route: str  # endpoint 함수 이름 (predict, extra_predict, crew_recommendation)
+    count: int = 1
+    kind: str = 'cprofile'
+
+def require_token(request: Request):
+    if not check_token(request):
+        raise HTTPException(status_code=404, detail='Not Found')
+
+@router.post("/arm")
+def arm(request: Request, body: ArmRequest):
+    require_token(request)
+    names = {getattr(route, 'name', None) for route in request.app.routes}
+    if body.route not in names:
+        raise HTTPException(status_code=400, detail=f'unknown route : {body.route}')
+    if body.kind not in profile_kinds or (body.kind == 'pyinstrument' and PyinstrumentProfiler is None):
+        raise HTTPException(status_code=400, detail=f'unsupported kind : {body.kind}')
+    with armed_lock:
+        if body.count > 0:
+            armed[body.route] = {'count': body.count, 'kind': body.kind}
+        else:
+            armed.pop(body.route, None)
+        return {'armed': dict(armed)}
+
+@router.get("/profiles")
+def list_profiles(request: Request):
+    require_token(request)
+    if not os.path.isdir(PROFILE_DIR):
+        return {'profiles': [], 'armed': dict(armed)}
+    profiles = []
+    for file in sorted(os.listdir(PROFILE_DIR), reverse=True):
+        if file.endswith('.json'):
+            with open(os.path.join(PROFILE_DIR, file)) as f:
+                profiles.append(json.load(f))
+    return {'profiles': profiles, 'armed': dict(armed)}
+
+@router.get("/profiles/{file_name}")
+def download_profile(request: Request, file_name: str):
+    require_token(request)
+    path = os.path.join(PROFILE_DIR, os.path.basename(file_name))
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail=f'profile not found : {file_name}')
+    return FileResponse(path, filename=os.path.basename(path))
@@ -0,0 +1,366 @@
+import threading
+from itertools import chain
+import numpy as np
+from scipy import sparse
+
+# 크루 추천 점수 계산 (벡터 연산) + 메모리 상주 인덱스
+# main.py의 euclidean_similarity / score_crews와 같은 식을 크루 전체에 한 번에 계산한다.
+# - 협업 유사도 : 0.7 * 1 / (1 + 거리) + 0.3 * 체형 유사도 (정규화된 6개 지표)
+# - 내용 유사도 : 크루 멤버들과의 선호 스포츠 코사인 유사도 평균 * 0.3 (= 크루 평균 벡터와의 내적, CrewProfileStore)
+# - 최종 점수   : 0.7 * 협업 유사도 + 내용 유사도
+# 배치는 top_crews_blocks로 사용자 블록 x 크루 전체를 계산 (메모리 상한 안에서 블록 크기 결정)
+# ResidentIndex는 배치(crew_recommendation)가 끝날 때 전체를 다시 만들고, 사용자 / 크루 1개씩 upsert 가능
+# 정규화는 FeatureScaler 하나로 사용자 / 크루 모두 같은 기준 (전체 기간 min / max, 배치마다 갱신해서 MongoDB에 저장)
+# upsert는 현재 min / max로 변환만 한다. (범위는 다음 배치에서 갱신)
+
+score_columns = ['m_type', 'type', 'age', 'score_1', 'score_2', 'score_3']
+
+def clean(values):
+    return np.nan_to_num(np.asarray(values, dtype=float), nan=0.0, posinf=0.0, neginf=0.0)
+
+### 정규화 - 요청에 들어온 사람에 따라 같은 점수가 다른 값이 되지 않도록 min / max를 계속 유지
+# partial_fit : 새 데이터로 min / max 넓히기 (바뀌었으면 True), transform : (x - min) / (max - min), 범위가 0인 컬럼은 0
+class FeatureScaler:
+    def __init__(self, low=None, high=None, version=0):
+        self.low = None if low is None else np.asarray(low, dtype=float)
+        self.high = None if high is None else np.asarray(high, dtype=float)
+        self.version = version  # min / max가 바뀔 때마다 증가 (캐시된 행렬 확인용)
+
+    def partial_fit(self, raw):
+        raw = clean(np.asarray(raw, dtype=float).reshape(-1, len(score_columns)))
+        if not len(raw):
+            return False
+        low, high = raw.min(axis=0), raw.max(axis=0)
+        if self.low is not None:
+            low, high = np.minimum(low, self.low), np.maximum(high, self.high)
+            if np.array_equal(low, self.low) and np.array_equal(high, self.high):
+                return False
+        self.low, self.high = low, high
+        self.version += 1
+        return True
+
+    # min / max가 있는지 (partial_fit 또는 저장된 값 load 이후)
+    @property
+    def fitted(self):
+        return self.low is not None
+
+    def transform(self, raw):
+        if not self.fitted:
+            raise ValueError('FeatureScaler has no min / max yet : call partial_fit or load saved bounds before transform')
+        raw = clean(raw)
+        span = self.high - self.low
+        return np.divide(raw - self.low, span, out=np.zeros(np.broadcast(raw, span).shape), where=span > 0)
+
+    def to_doc(self):
+        return {'columns': score_columns, 'min': self.low.tolist(), 'max': self.high.tolist(), 'version': self.version}
+
+    @classmethod
+    def from_doc(cls, doc):
+        if not doc:
+            return cls()
+        return cls(doc['min'], doc['max'], doc.get('version', 0))
+
+### 스포츠 선호 행렬 (희소 CSR) - 열은 요청에 나온 스포츠 ID만, 행은 크기 1로 정규화 (코사인 유사도 = 내적)
+# 스포츠 ID -> 열 번호
+def sport_vocabulary(sport_lists, extra_sports=()):
+    sports = {int(sport) for sports in sport_lists for sport in sports} | {int(sport) for sport in extra_sports}
+    return {sport: col for col, sport in enumerate(sorted(sports))}
+
+# 어휘에 없는 스포츠 ID는 vocabulary에 추가 (열이 늘어남)
+def extend_vocabulary(vocabulary, sports):
+    for sport in sports:
+        if int(sport) not in vocabulary:
+            vocabulary[int(sport)] = len(vocabulary)
+    return vocabulary
+
+def create_sport_matrix(sport_lists, vocabulary):
+    rows = [sorted({vocabulary[int(sport)] for sport in sports if int(sport) in vocabulary}) for sports in sport_lists]
+    lengths = np.array([len(row) for row in rows], dtype=int)
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    indices = np.fromiter(chain.from_iterable(rows), dtype=np.int32, count=int(indptr[-1]))
+    data = np.repeat(1 / np.sqrt(np.maximum(lengths, 1)), lengths)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(vocabulary)))
+
+# 사용자 여러 명 x 크루 전체 협업 유사도 (euclidean_similarity) - 지표 6개를 열마다 더해서 (사용자 x 크루 x 지표) 배열을 만들지 않음
+def collaborative_block(user_features, crew_features):
+    users, crews = clean(user_features).reshape(-1, len(score_columns)), clean(crew_features)
+    squared = np.zeros((len(users), len(crews)))
+    for j in range(len(score_columns)):
+        squared += (users[:, j, None] - crews[None, :, j]) ** 2
+    similarity = 1 / (1 + np.sqrt(squared))
+
+    # m_type이 있으면 m_type 기준 (0.4 / 0.6), 없으면 type 기준 (0.35 / 0.65)
+    has_m_type = users[:, 0, None] != 0
+    base = np.where(has_m_type, users[:, 0, None], users[:, 1, None])
+    weight = np.where(has_m_type, 0.4, 0.35)
+    body_similarity = 1 - np.abs(np.abs(base - crews[:, 0]) * weight + np.abs(base - crews[:, 1]) * (1 - weight))
+    return 0.7 * similarity + 0.3 * body_similarity
+
+# 사용자 1명 vs 크루 전체 협업 유사도
+def collaborative_scores(user_features, crew_features):
+    return collaborative_block(user_features, crew_features)[0]
+
+# (사용자 위치, 크루 위치) 가입 쌍 - crew_lists는 사용자별 가입 크루 ID 목록, 없는 크루 ID는 제외
+def member_pairs(crew_lists, crew_positions):
+    pairs = [(u, crew_positions[c]) for u, crews in enumerate(crew_lists) for c in set(crews) if c in crew_positions]
+    pairs = np.array(pairs, dtype=int).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+### 크루 프로필 - 크루별 멤버 선호 스포츠 벡터 합(sums)과 멤버 수(counts)
+# 행이 크기 1로 정규화되어 있으므로 멤버들과의 코사인 유사도 평균 = 크루 평균 벡터(centroid)와의 내적
+# -> 사용자 여러 명 x 크루 전체 내용 유사도가 행렬 곱 1번 (멤버 수와 관계 없음)
+# 가입 / 탈퇴, 멤버의 선호 스포츠 변경은 update로 해당 크루 행만 더하고 뺀다. (centroid는 필요할 때 다시 나눔)
+class CrewProfileStore:
+    def __init__(self, n_crews, n_sports):
+        self.sums = np.zeros((n_crews, n_sports))
+        self.counts = np.zeros(n_crews, dtype=int)
+        self.cache = None
+
+    @classmethod
+    def from_members(cls, sport_matrix, member_users, member_crews, n_crews):
+        store = cls(n_crews, sport_matrix.shape[1])
+        membership = sparse.csr_matrix((np.ones(len(member_users)), (member_crews, member_users)), shape=(n_crews, sport_matrix.shape[0]))
+        store.sums = (membership @ sport_matrix).toarray()
+        store.counts = np.bincount(member_crews, minlength=n_crews)
+        return store
+
+    # 사용자 1명(user_sports : sport_matrix 행 1개)이 crews(크루 위치 목록)에 가입 (sign=1) / 탈퇴 (sign=-1)
+    def update(self, crews, user_sports, sign=1):
+        crews = np.unique(np.asarray(crews, dtype=int))
+        if len(crews):
+            self.sums[crews] += sign * user_sports.toarray().ravel()
+            self.counts[crews] += sign
+            self.cache = None
+
+    # 크루 1개(crew : 크루 위치)에 멤버 여러 명(member_sports : 멤버 선호 스포츠 행들)을 한 번에 더하기
+    def add_members(self, crew, member_sports):
+        if member_sports.shape[0]:
+            self.sums[crew] += np.asarray(member_sports.sum(axis=0)).ravel()
+            self.counts[crew] += member_sports.shape[0]
+            self.cache = None
+
+    # 크루 / 스포츠 열 추가 (새 크루는 멤버 0명)
+    def resize(self, n_crews, n_sports):
+        sums = np.zeros((n_crews, n_sports))
+        sums[:self.sums.shape[0], :self.sums.shape[1]] = self.sums
+        self.sums = sums
+        self.counts = np.concatenate([self.counts, np.zeros(n_crews - len(self.counts), dtype=int)])
+        self.cache = None
+
+    def centroids(self):
+        if self.cache is None:
+            counts = self.counts[:, None]
+            self.cache = np.divide(self.sums, counts, out=np.zeros(self.sums.shape), where=counts > 0)
+        return self.cache
+
+    # 사용자 k명 (sport_matrix 행 k개) x 크루 전체 내용 유사도 (가중치 0.3 포함, 멤버 없는 크루는 0)
+    def content(self, user_sports):
+        return np.asarray(user_sports @ self.centroids().T) * 0.3
+
+# score_crews와 같은 (crew_id, 최종, 협업, 내용) 목록 - 가입한 크루 제외, 점수 높은 순 (limit이 있으면 상위 limit개만)
+def rank_crews(user_features, user_sports, user_crews, crew_ids, crew_features, profiles, limit=None):
+    collaborative = collaborative_scores(user_features, crew_features)
+    content = profiles.content(user_sports).ravel()
+    combined = 0.7 * collaborative + content
+
+    candidates = np.flatnonzero(~np.isin(crew_ids, list(user_crews)))
+    if limit is not None and limit < len(candidates):
+        candidates = np.sort(candidates[np.argpartition(-combined[candidates], limit)[:limit]])
+    order = candidates[np.argsort(-combined[candidates], kind='stable')]
+    return [(int(crew_ids[i]), float(combined[i]), float(collaborative[i]), float(content[i])) for i in order]
+
+### 블록 단위 전체 계산 (배치) - 사용자 block_rows명씩 (사용자 x 크루) 점수 블록을 만들고 사용자별 상위 top_k개만 남긴다.
+# 블록 계산 중 동시에 잡히는 (사용자 x 크루) float 배열 수 (협업 유사도 임시 배열 포함 대략)
+BLOCK_ARRAYS = 10
+
+# 메모리 상한 (바이트) 안에 들어가는 블록 사용자 수
+def block_rows(n_crews, memory_limit):
+    return max(1, int(memory_limit // (max(n_crews, 1) * 8 * BLOCK_ARRAYS)))
+
+# 블록마다 [(사용자 위치, [(크루 위치, 최종, 협업, 내용), ...]), ...] - 가입한 크루 제외, 점수 높은 순 (같은 점수는 앞 크루 먼저)
+# user_crews : 사용자 위치별 가입 크루 위치 목록
+def top_crews_blocks(user_positions, user_features, sport_matrix, user_crews, crew_features, profiles, top_k=20, memory_limit=256 * 2 ** 20):
+    n_crews = len(crew_features)
+    rows = block_rows(n_crews, memory_limit)
+    for start in range(0, len(user_positions), rows):
+        chunk = np.asarray(user_positions[start:start + rows], dtype=int)
+        if not n_crews:
+            yield [(int(u), []) for u in chunk]
+            continue
+        collaborative = collaborative_block(user_features[chunk], crew_features)
+        content = profiles.content(sport_matrix[chunk])
+        combined = 0.7 * collaborative + content
+
+        # 가입한 크루는 -inf
+        joined = [user_crews[u] for u in chunk]
+        joined_rows = np.repeat(np.arange(len(chunk)), [len(crews) for crews in joined])
+        joined_cols = np.fromiter(chain.from_iterable(joined), dtype=int, count=len(joined_rows))
+        combined[joined_rows, joined_cols] = -np.inf
+
+        k = min(top_k, n_crews)
+        top = np.argpartition(-combined, k - 1, axis=1)[:, :k] if k < n_crews else np.tile(np.arange(n_crews), (len(chunk), 1))
+        top.sort(axis=1)
+        top = np.take_along_axis(top, np.argsort(-np.take_along_axis(combined, top, axis=1), axis=1, kind='stable'), axis=1)
+        scores = [np.take_along_axis(values, top, axis=1) for values in (combined, collaborative, content)]
+
+        block = []
+        for r, u in enumerate(chunk):
+            valid = np.isfinite(scores[0][r])
+            block.append((int(u), list(zip(top[r][valid].tolist(), *(values[r][valid].tolist() for values in scores)))))
+        del collaborative, content, combined
+        yield block
+
+### 메모리 상주 인덱스
+# upsert로 바뀐 선호 스포츠 행을 sport_matrix에 합치는 최소 행 수 (사용자 수의 1/16과 큰 쪽)
+MERGE_ROWS = 256
+
+# 여유 행을 두고 행 수를 2배로 (늘어난 행은 0)
+def grow_rows(array):
+    grown = np.zeros((max(2 * len(array), 16),) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+class ResidentIndex:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.ready = False
+
+    # 배치 입력 전체로 다시 만들기 - user_data / crew_data는 crew_recommendation의 원래 점수 DataFrame
+    # 배치에서 이미 변환한 행렬(user_features / crew_features)을 그대로 받아서 다시 계산하지 않는다.
+    def refresh(self, user_data, crew_data, scaler, user_features=None, crew_features=None):
+        with self.lock:
+            self.scaler = scaler
+            self.user_ids = [int(u) for u in user_data['user_id']]
+            self.user_raw = user_data[score_columns].to_numpy(dtype=float)
+            self.user_features = scaler.transform(self.user_raw) if user_features is None else user_features
+            self.vocabulary = sport_vocabulary(user_data['favorite_sports'], crew_data['crew_sports'])
+            self.sport_matrix = create_sport_matrix(user_data['favorite_sports'], self.vocabulary)
+            self.sport_updates = {}
+            self.user_crews = [sorted(set(crews)) for crews in user_data['crew_list']]
+            self.user_positions = {u: i for i, u in enumerate(self.user_ids)}
+            # 크루 ID -> 가입한 사용자 위치 (인덱스에 아직 없는 크루 ID 포함, 새 크루 upsert 때 멤버를 바로 찾는다)
+            self.crew_members = {}
+            for i, crews in enumerate(self.user_crews):
+                for c in crews:
+                    self.crew_members.setdefault(c, set()).add(i)
+
+            self.crew_ids = np.array([int(c) for c in crew_data['crew_id']], dtype=int)
+            self.crew_raw = crew_data[score_columns].to_numpy(dtype=float)
+            self.crew_features = scaler.transform(self.crew_raw) if crew_features is None else crew_features
+            self.crew_sports = [int(s) for s in crew_data['crew_sports']]
+            self.crew_positions = {c: i for i, c in enumerate(self.crew_ids.tolist())}
+            self.n_crews = len(self.crew_ids)
+
+            member_users, member_crews = member_pairs(self.user_crews, self.crew_positions)
+            self.profiles = CrewProfileStore.from_members(self.sport_matrix, member_users, member_crews, len(self.crew_ids))
+            self.ready = True
+
+    # 사용자 i가 가입한 크루 위치 (인덱스에 있는 크루만)
+    def member_crews(self, i):
+        return [self.crew_positions[c] for c in self.user_crews[i] if c in self.crew_positions]
+
+    # 처음 나온 스포츠 ID면 열 추가
+    def extend_sports(self, sports):
+        extend_vocabulary(self.vocabulary, sports)
+        if self.sport_matrix.shape[1] < len(self.vocabulary):
+            self.sport_matrix.resize((self.sport_matrix.shape[0], len(self.vocabulary)))
+            for row in self.sport_updates.values():
+                row.resize((1, len(self.vocabulary)))
+            self.profiles.resize(self.n_crews, len(self.vocabulary))
+
+    # 사용자 i의 선호 스포츠 행 - upsert로 바뀐 / 추가된 행은 sport_updates에 모아 두었다가 한 번에 합친다.
+    def sport_row(self, i):
+        row = self.sport_updates.get(i)
+        return self.sport_matrix[i] if row is None else row
+
+    # sport_updates를 sport_matrix에 합치기 - 바뀐 행은 0으로 만들고 새 행을 제자리에 더한다. (행렬 곱 / 덧셈 1번씩, 행마다 vstack 하지 않음)
+    def merge_sports(self):
+        positions = sorted(self.sport_updates)
+        keep = np.ones(self.sport_matrix.shape[0])
+        keep[[p for p in positions if p < len(keep)]] = 0
+        merged = (sparse.diags(keep) @ self.sport_matrix).tocsr()
+        merged.resize((len(self.user_ids), len(self.vocabulary)))
+        placement = sparse.csr_matrix((np.ones(len(positions)), (positions, np.arange(len(positions)))),
+                                      shape=(len(self.user_ids), len(positions)))
+        merged = (merged + placement @ sparse.vstack([self.sport_updates[p] for p in positions], format='csr')).tocsr()
+        merged.eliminate_zeros()
+        self.sport_matrix, self.sport_updates = merged, {}
+
+    # 사용자 추가 - 점수 배열은 여유 행을 두고 2배씩 늘린다. (사용자마다 전체 복사하지 않음)
+    def append_user(self, user_id, raw_scores, features):
+        i = len(self.user_ids)
+        if i == len(self.user_raw):
+            self.user_raw, self.user_features = grow_rows(self.user_raw), grow_rows(self.user_features)
+        self.user_positions[user_id] = i
+        self.user_ids.append(user_id)
+        self.user_crews.append([])
+        self.user_raw[i], self.user_features[i] = raw_scores, features
+        return i
+
+    def upsert_user(self, user_id, raw_scores, favorite_sports, crew_list):
+        with self.lock:
+            features = self.scaler.transform(raw_scores)
+            self.extend_sports(favorite_sports)
+            if user_id in self.user_positions:
+                i = self.user_positions[user_id]
+                self.profiles.update(self.member_crews(i), self.sport_row(i), sign=-1)  # 이전 가입 크루 / 선호 스포츠 빼기
+                self.user_raw[i], self.user_features[i] = raw_scores, features
+            else:
+                i = self.append_user(user_id, raw_scores, features)
+            for c in self.user_crews[i]:
+                self.crew_members[c].discard(i)
+            self.sport_updates[i] = create_sport_matrix([favorite_sports], self.vocabulary)
+            self.user_crews[i] = sorted(set(crew_list))
+            for c in self.user_crews[i]:
+                self.crew_members.setdefault(c, set()).add(i)
+            self.profiles.update(self.member_crews(i), self.sport_updates[i])
+            if len(self.sport_updates) >= max(MERGE_ROWS, len(self.user_ids) // 16):
+                self.merge_sports()
+
+    # 크루 추가 - append_user와 같이 여유 행을 두고 2배씩 늘린다.
+    # 이미 이 크루 ID로 가입한 사용자는 crew_members에서 바로 찾아 한 번에 더한다. (사용자 전체를 돌지 않음)
+    def append_crew(self, crew_id, raw_scores, features, crew_sports):
+        j = self.n_crews
+        if j == len(self.crew_ids):
+            self.crew_ids, self.crew_raw, self.crew_features = grow_rows(self.crew_ids), grow_rows(self.crew_raw), grow_rows(self.crew_features)
+        self.crew_positions[crew_id] = j
+        self.crew_ids[j], self.crew_raw[j], self.crew_features[j] = crew_id, raw_scores, features
+        self.crew_sports.append(crew_sports)
+        self.n_crews += 1
+        self.profiles.resize(self.n_crews, len(self.vocabulary))
+        members = sorted(self.crew_members.get(crew_id, ()))
+        if members:
+            self.profiles.add_members(j, sparse.vstack([self.sport_row(u) for u in members], format='csr'))
+        return j
+
+    def upsert_crew(self, crew_id, raw_scores, crew_sports):
+        with self.lock:
+            features = self.scaler.transform(raw_scores)
+            self.extend_sports([crew_sports])
+            if crew_id in self.crew_positions:
+                i = self.crew_positions[crew_id]
+                self.crew_raw[i], self.crew_features[i] = raw_scores, features
+                self.crew_sports[i] = crew_sports
+            else:
+                self.append_crew(crew_id, raw_scores, features, crew_sports)
+
+    # 읽기도 lock 안에서 - upsert 중(행 추가, sport_updates 합치기)인 배열을 보지 않도록
+    def has_user(self, user_id):
+        with self.lock:
+            return user_id in self.user_positions
+
+    def rank(self, user_id, limit=None):
+        with self.lock:
+            i = self.user_positions[user_id]
+            return rank_crews(self.user_features[i], self.sport_row(i), self.user_crews[i], self.crew_ids[:self.n_crews],
+                              self.crew_features[:self.n_crews], self.profiles, limit)
+
+    def user_scores(self, user_id):
+        with self.lock:
+            raw = self.user_raw[self.user_positions[user_id]]
+            return {'basic_score': float(raw[3]), 'activity_score': float(raw[4]), 'intake_score': float(raw[5])}
+
+    def crew_scores(self, crew_id):
+        with self.lock:
+            raw = self.crew_raw[self.crew_positions[crew_id]]
+            return {'basic_score': float(raw[3]), 'activity_score': float(raw[4]), 'intake_score': float(raw[5])}
@@ -0,0 +1,36 @@
+import os
+import time
+import tempfile
+import argparse
+import numpy as np
+from bench_evaluate import make_dummy_user
+from distributed_train import parse_args, launch
+
+# 워커 수별 학습 처리량 측정 (같은 합성 데이터, 같은 per-worker batch)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=64)
+    parser.add_argument('--epochs', type=int, default=3)
+    parser.add_argument('--batch-size', type=int, default=128)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as csv_dir:
+        for sample_id in range(args.users):
+            make_dummy_user(rng).rename(columns={'calories': 'consumed_cal'}).to_csv(os.path.join(csv_dir, f'sample_{sample_id}.csv'), index=False)
+
+        results = []
+        for workers in range(1, args.max_workers + 1):
+            train_args = parse_args(['--csv-dir', csv_dir, '--weights', os.path.join(csv_dir, f'bench{workers}.weights.h5'),
+                                     '--workers', str(workers), '--epochs', str(args.epochs), '--batch-size', str(args.batch_size)])
+            start = time.perf_counter()
+            steps = launch(train_args)
+            elapsed = time.perf_counter() - start
+            samples = steps * args.batch_size * workers * args.epochs
+            results.append((workers, elapsed, samples / elapsed))
+
+        # 프로세스 시작 / 데이터 로딩 / tracing 시간까지 포함한 전체 시간 기준
+        print('\nworkers | wall time | samples/sec | speedup')
+        for workers, elapsed, throughput in results:
+            print(f'{workers:>7} | {elapsed:>8.1f}s | {throughput:>11.0f} | x{throughput / results[0][2]:.2f}')
@@ -0,0 +1,69 @@
+import time
+import numpy as np
+import pandas as pd
+from test_acc import build_model
+from evaluate import timesteps, forecast_steps, eval_columns, evaluate
+
+# 기존 calculate_accuracy 방식: 윈도우마다 df.iloc으로 (1, 7, 5) 배열을 만들고 model.predict 1번씩 호출
+def legacy_calculate_accuracy(df, model, limit=None):
+    correct_predictions = 0
+    total_predictions = 0
+    n_windows = len(df) - timesteps - forecast_steps
+    for i in range(n_windows if limit is None else min(limit, n_windows)):
+        X_test = df.iloc[i:i + timesteps][eval_columns].values.reshape(1, timesteps, len(eval_columns))
+        predictions = model.predict(X_test, verbose=0)
+        if abs(df.loc[i + timesteps + 29, 'weight'] - predictions[0][29]) <= 1:
+            correct_predictions += 1
+        if abs(df.loc[i + timesteps + 89, 'weight'] - predictions[0][89]) <= 1:
+            correct_predictions += 1
+        total_predictions += 2
+    return correct_predictions / total_predictions * 100
+
+# 정확도 비교용 - 윈도우 마지막 날 체중 + 노이즈를 90일 예측값으로 내보내는 모델
+class PersistenceModel:
+    def __init__(self, seed=0):
+        self.seed = seed
+
+    def predict(self, X, batch_size=None, verbose=0):
+        last_weight = X[:, -1, eval_columns.index('weight')][:, np.newaxis]
+        noise = np.random.default_rng(self.seed).normal(0, 1, (1, forecast_steps))
+        return np.repeat(last_weight, forecast_steps, axis=1) + noise
+
+# dummy_maker 출력과 같은 컬럼을 가진 합성 사용자 시계열
+def make_dummy_user(rng, days=980):
+    weight = 60 + np.cumsum(rng.normal(0, 0.1, days))
+    return pd.DataFrame({
+        'sex': rng.integers(1, 3),
+        'age': rng.integers(19, 80),
+        'BMI': weight / 1.7 ** 2,
+        'weight': weight,
+        'calories': rng.normal(250, 50, days),
+    })
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    model = build_model((timesteps, len(eval_columns)), forecast_steps)
+    n_users = 50
+    dfs = [make_dummy_user(rng) for _ in range(n_users)]
+    windows_per_user = len(dfs[0]) - timesteps - forecast_steps
+
+    # 1. 기존 방식 - 일부 윈도우만 측정 후 전체 시간 추정
+    sample_windows = 50
+    start = time.perf_counter()
+    legacy_calculate_accuracy(dfs[0], model, limit=sample_windows)
+    per_window = (time.perf_counter() - start) / sample_windows
+    legacy_total = per_window * windows_per_user * n_users
+    print(f'[legacy] {per_window * 1000:.1f} ms/window -> {n_users} users x {windows_per_user} windows ~ {legacy_total / 60:.1f} min')
+
+    # 2. 배치 방식 - 전체 윈도우
+    start = time.perf_counter()
+    scores = evaluate(model, dfs)
+    elapsed = time.perf_counter() - start
+    print(f'[batch] {n_users} users x {windows_per_user} windows : {elapsed:.2f} s (x{legacy_total / elapsed:.0f})')
+
+    # 3. 결과 일치 확인 (사용자별 정확도)
+    check_model = PersistenceModel()
+    legacy_accuracy = np.array([legacy_calculate_accuracy(df, check_model) for df in dfs[:5]])
+    batch_accuracy = evaluate(check_model, dfs[:5])['accuracy']
+    print('accuracy check - legacy:', np.round(legacy_accuracy, 2), 'batch:', np.round(batch_accuracy, 2))
+    assert np.allclose(legacy_accuracy, batch_accuracy)
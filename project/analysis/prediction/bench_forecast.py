@@ -0,0 +1,51 @@
+import time
+import numpy as np
+from main import build_model
+from forecast import timesteps, forecast_steps, weight_col, forecast_batch, forecast_autoregressive
+
+# 기존 predict_future 방식: 사용자 1명당 1스텝씩 model.predict를 90번 호출
+def legacy_predict_future(model, last_sequence, steps):
+    future_predictions = []
+    current_sequence = last_sequence.copy()
+
+    for _ in range(steps):
+        next_step = model.predict(current_sequence.reshape(1, timesteps, -1), verbose=0)
+        future_predictions.append(next_step[0, 0])
+
+        current_sequence = np.roll(current_sequence, -1, axis=0)
+        current_sequence[-1, weight_col] = next_step[0, 0]
+    return np.array(future_predictions)
+
+if __name__ == "__main__":
+    features = 5
+    model = build_model((timesteps, features), forecast_steps)
+
+    rng = np.random.default_rng(0)
+    legacy_users = 3  # 기존 방식은 너무 느려서 적은 인원으로 측정 후 1인당 시간으로 비교
+    batch_users = [1, 100, 1000, 10000]
+
+    # 1. 기존 방식 (사용자 x 90번 호출)
+    windows = rng.random((legacy_users, timesteps, features), dtype=np.float32)
+    start = time.perf_counter()
+    for window in windows:
+        legacy_predict_future(model, window, forecast_steps)
+    legacy_per_user = (time.perf_counter() - start) / legacy_users
+    print(f'[legacy] 90 sequential predict calls : {legacy_per_user * 1000:.1f} ms/user ({1 / legacy_per_user:.2f} users/sec)')
+
+    # 2. 배치 방식 (사용자 전체 1번 호출)
+    for n in batch_users:
+        windows = rng.random((n, timesteps, features), dtype=np.float32)
+        forecast_batch(model, windows)  # warm-up (입력 shape별 tracing 제외)
+        start = time.perf_counter()
+        forecast_batch(model, windows)
+        elapsed = time.perf_counter() - start
+        print(f'[batch] {n:>6} users, 90 days : {elapsed * 1000:.1f} ms ({n / elapsed:.0f} users/sec, x{legacy_per_user * n / elapsed:.0f})')
+
+    # 3. 180일 autoregressive (모든 사용자 lockstep)
+    for n in batch_users:
+        windows = rng.random((n, timesteps, features), dtype=np.float32)
+        forecast_autoregressive(model, windows, 180)
+        start = time.perf_counter()
+        forecast_autoregressive(model, windows, 180)
+        elapsed = time.perf_counter() - start
+        print(f'[autoregressive] {n:>6} users, 180 days : {elapsed * 1000:.1f} ms ({n / elapsed:.0f} users/sec)')
@@ -0,0 +1,36 @@
+import os
+import time
+import tempfile
+import argparse
+import numpy as np
+from bench_evaluate import make_dummy_user
+from test_acc import build_model
+from evaluate import timesteps, forecast_steps, eval_columns
+from parallel_eval import run_parallel_eval
+
+# 1 ~ N 코어 병렬 평가 스케일링 측정 (같은 구조의 모델을 초기 가중치로 저장해서 사용)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=64)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as csv_path:
+        for sample_id in range(args.users):
+            make_dummy_user(rng).to_csv(os.path.join(csv_path, f'sample_{sample_id}.csv'), index=False)
+        weights_path = os.path.join(csv_path, 'bench.weights.h5')
+        build_model((timesteps, len(eval_columns)), forecast_steps).save_weights(weights_path)
+
+        baseline = None
+        reports = set()
+        for workers in range(1, args.max_workers + 1):
+            start = time.perf_counter()
+            _, _, context = run_parallel_eval(csv_path, weights_path, workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            reports.add(context)
+            print(f'workers {workers:>2} : {elapsed:.2f} s ({args.users / elapsed:.1f} files/sec, speedup x{baseline / elapsed:.2f})')
+
+        # 워커 수와 상관 없이 같은 리포트가 나와야 한다.
+        print('deterministic report:', len(reports) == 1)
@@ -0,0 +1,36 @@
+import os
+import tempfile
+import argparse
+import numpy as np
+import pandas as pd
+from bench_evaluate import make_dummy_user
+from test_acc import build_model
+from evaluate import timesteps, forecast_steps, eval_columns, evaluate, load_csv_files, format_report
+from parallel_eval import run_parallel_eval
+
+# 병렬 평가 리포트가 순차 평가 (test_acc.py 방식) 리포트와 같은지 확인
+# 파티션 파일 10개 초과 (이름 순 part_10 < part_2), 파일마다 사용자 여러 명 (user_id 2, 10 ... - 문자열 순과 숫자 순이 다름)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=12)
+    parser.add_argument('--users-per-file', type=int, default=3)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 3, 4])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as csv_path:
+        user_ids = [2, 10] + list(range(11, 11 + args.users_per_file - 2))
+        for part in range(args.files):
+            frames = [make_dummy_user(rng, days=200).assign(user_id=part * 100 + user_id) for user_id in user_ids]
+            pd.concat(frames).to_csv(os.path.join(csv_path, f'part_{part}.csv'), index=False)
+        weights_path = os.path.join(csv_path, 'check.weights.h5')
+        model = build_model((timesteps, len(eval_columns)), forecast_steps)
+        model.save_weights(weights_path)
+
+        files, dfs = load_csv_files(csv_path)
+        sequential = format_report(files, evaluate(model, dfs))
+        for workers in args.workers:
+            parallel_files, _, parallel = run_parallel_eval(csv_path, weights_path, workers)
+            assert parallel_files == files, (workers, parallel_files[:5], files[:5])
+            assert parallel == sequential, workers
+        print(f'{len(files)} results from {args.files} partition files : parallel report == sequential report (workers {args.workers})')
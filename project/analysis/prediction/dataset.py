@@ -0,0 +1,89 @@
+import os
+import math
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from sklearn.preprocessing import MinMaxScaler
+from dummy.store import is_store, list_chunks, read_meta, iter_users, count_users
+
+# 주요 features 설정 (model.py 학습 설정과 동일)
+features = ['age', 'sex', 'BMI', 'weight', 'consumed_cal']
+weight_col = features.index('weight')
+timesteps = 7
+forecast_steps = 90
+
+# 학습용 csv 파일 목록 (이름 순 정렬 - 샤드 분배가 항상 같도록)
+# dummy/generate.py --format store 저장소 폴더면 chunk(.npz) 목록
+def list_csv_files(csv_dir):
+    if is_store(csv_dir):
+        return list_chunks(csv_dir)
+    return sorted(f for f in os.listdir(csv_dir) if f.endswith('.csv'))
+
+# 파일 목록을 n_shards개로 나눈 것 중 shard번째 (round-robin)
+def shard_files(files, shard=0, n_shards=1):
+    return files[shard::n_shards]
+
+# csv 불러오기 - dummy_maker 출력은 소모 칼로리 컬럼명이 calories
+def load_csv(path):
+    df = pd.read_csv(path)
+    if 'consumed_cal' not in df.columns and 'calories' in df.columns:
+        df = df.rename(columns={'calories': 'consumed_cal'})
+    return df
+
+# dummy/generate.py 출력처럼 사용자 여러 명이 들어있는 파티션 csv는 user_id 별로 나누기
+def split_users(df):
+    if 'user_id' not in df.columns or df['user_id'].nunique() <= 1:
+        return [df]
+    return [user_df.reset_index(drop=True) for _, user_df in df.groupby('user_id', sort=True)]
+
+# 파일 1개의 사용자별 DataFrame 목록 - 저장소 chunk는 학습에 쓰는 컬럼만 읽는다.
+def load_frames(csv_dir, file):
+    if file.endswith('.npz'):
+        return [df.rename(columns={'calories': 'consumed_cal'})
+                for _, _, df in iter_users(csv_dir, [file], columns=['age', 'sex', 'BMI', 'weight', 'calories'])]
+    return split_users(load_csv(os.path.join(csv_dir, file)))
+
+def load_csv_frames(csv_dir, shard=0, n_shards=1):
+    return [user_df for f in shard_files(list_csv_files(csv_dir), shard, n_shards) for user_df in load_frames(csv_dir, f)]
+
+# 시계열 데이터를 timesteps로 자르고, 다중 스텝 예측을 위해 여러 값을 y로 설정
+# 윈도우는 sliding_window_view로 한 번에 만든다. (반복문 없이)
+def create_multi_step_sequences(data, time_steps=timesteps, forecast_steps=forecast_steps, scaler=None):
+    scaler = scaler if scaler is not None else MinMaxScaler()
+    scaled_data = scaler.fit_transform(data[features]).astype(np.float32)
+
+    n_windows = len(scaled_data) - time_steps - forecast_steps
+    if n_windows <= 0:
+        return np.empty((0, time_steps, len(features)), np.float32), np.empty((0, forecast_steps), np.float32)
+
+    X = sliding_window_view(scaled_data, time_steps, axis=0)[:n_windows].transpose(0, 2, 1)
+    y = sliding_window_view(scaled_data[:, weight_col], forecast_steps)[time_steps:time_steps + n_windows]
+    return np.ascontiguousarray(X), np.ascontiguousarray(y)
+
+# 여러 사용자 데이터를 시퀀스로 만든 뒤 하나로 합치기
+def build_sequences(df_list, time_steps=timesteps, forecast_steps=forecast_steps, scaler=None):
+    all_X, all_y = [], []
+    for df in df_list:
+        X, y = create_multi_step_sequences(df, time_steps, forecast_steps, scaler)
+        all_X.append(X)
+        all_y.append(y)
+    if not all_X:
+        return np.empty((0, time_steps, len(features)), np.float32), np.empty((0, forecast_steps), np.float32)
+    return np.concatenate(all_X, axis=0), np.concatenate(all_y, axis=0)
+
+# 사용자별 행 수만 세서 만들어질 윈도우 수 계산 (user_id 컬럼만 읽어서 샤드 크기 파악)
+def count_windows(path, time_steps=timesteps, forecast_steps=forecast_steps):
+    if path.endswith('.npz'):
+        days = read_meta(os.path.dirname(path))['days']
+        return count_users(path) * max(days - time_steps - forecast_steps, 0)
+    header = pd.read_csv(path, nrows=0).columns
+    if 'user_id' in header:
+        rows = pd.read_csv(path, usecols=['user_id'])['user_id'].value_counts().to_numpy()
+    else:
+        rows = np.array([len(pd.read_csv(path, usecols=[0]))])
+    return int(np.maximum(rows - time_steps - forecast_steps, 0).sum())
+
+# model.fit(validation_split=...)과 같은 방식으로 train / val 나누기 (뒤쪽이 validation)
+def split_train_val(X, y, validation_split=0.2):
+    split_at = int(math.ceil(len(X) * (1.0 - validation_split)))
+    return (X[:split_at], y[:split_at]), (X[split_at:], y[split_at:])
@@ -0,0 +1,195 @@
+import os
+import sys
+import math
+import json
+import socket
+import argparse
+import subprocess
+from dataset import timesteps, forecast_steps, features, list_csv_files, shard_files, count_windows, load_csv_frames, build_sequences, split_train_val
+
+# 로컬 CPU 워커 프로세스 여러 개로 데이터 병렬 학습 (MultiWorkerMirroredStrategy)
+# - 부모 프로세스(launcher)가 csv 파일을 워커 수만큼 나누고, 워커마다 TF_CONFIG를 넣어 실행
+# - 워커는 자기 샤드만 읽어서 학습, 매 스텝 gradient를 all-reduce
+# - 가중치는 chief(0번 워커)만 ModelCheckpoint 경로에 저장 (서비스가 불러오는 .weights.h5 형식 그대로)
+
+validation_split = 0.2
+
+# 모델 구조 정의 - model.py와 같은 구조 (가중치 호환)
+def build_model(input_shape, forecast_steps):
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Input, LSTM, Dense
+    model = Sequential()
+    model.add(Input(shape=input_shape))
+    model.add(LSTM(units=32, dropout=0.3, return_sequences=True))
+    model.add(LSTM(units=32, dropout=0.3))
+    model.add(Dense(64))
+    model.add(Dense(units=forecast_steps, dtype='float32'))
+    return model
+
+# 비어있는 로컬 포트 찾기
+def free_ports(n):
+    sockets = [socket.socket() for _ in range(n)]
+    for s in sockets:
+        s.bind(('localhost', 0))
+    ports = [s.getsockname()[1] for s in sockets]
+    for s in sockets:
+        s.close()
+    return ports
+
+# 워커마다 같은 step 수로 학습해야 all-reduce가 멈추지 않는다.
+# csv 행 수로 샤드별 train / val 윈도우 수를 계산하고, 가장 작은 샤드 기준으로 step 수를 정한다.
+def plan_steps(csv_dir, workers, per_worker_batch):
+    files = list_csv_files(csv_dir)
+    train_steps, val_steps = [], []
+    for shard in range(workers):
+        n = sum(count_windows(os.path.join(csv_dir, f)) for f in shard_files(files, shard, workers))
+        n_val = n - int(math.ceil(n * (1.0 - validation_split)))
+        train_steps.append((n - n_val) // per_worker_batch)
+        val_steps.append(n_val // per_worker_batch)
+    return min(train_steps), min(val_steps)
+
+# 워커 프로세스 - TF_CONFIG 환경 변수 기준으로 자기 샤드 학습
+# Keras 3의 model.fit은 MultiWorkerMirroredStrategy에서 첫 배치를 reduce 하다가 실패해서,
+# strategy.run 기반 학습 루프로 돌리고 ModelCheckpoint / EarlyStopping 동작을 그대로 따라간다.
+def run_worker(args):
+    import time
+    import tensorflow as tf
+    from tensorflow.keras.optimizers import Adam
+    from train_profile import get_profile, apply_profile
+
+    task = json.loads(os.environ['TF_CONFIG'])['task']
+    index = task['index']
+    is_chief = index == 0
+
+    # 코어를 워커 수만큼 나눠서 사용
+    profile = get_profile(args.profile)
+    profile['intra_op_threads'] = max(1, (os.cpu_count() or 1) // args.workers)
+    profile['inter_op_threads'] = 1
+    profile = apply_profile(profile)
+
+    strategy = tf.distribute.MultiWorkerMirroredStrategy()
+
+    # 1. 자기 샤드만 불러와 시퀀스 생성
+    X, y = build_sequences(load_csv_frames(args.csv_dir, index, args.workers))
+    (X_train, y_train), (X_val, y_val) = split_train_val(X, y, validation_split)
+
+    # 2. tf.data 구성 - 이미 파일 단위로 나눴으므로 auto shard는 끔
+    # 각 워커의 dataset은 global batch로 묶고, strategy가 워커별 per_worker_batch로 다시 나눈다.
+    global_batch = args.batch_size * args.workers
+    options = tf.data.Options()
+    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.OFF
+
+    def make_dataset(X, y, shuffle):
+        ds = tf.data.Dataset.from_tensor_slices((X, y))
+        if shuffle:
+            ds = ds.shuffle(min(len(X), 100000), seed=index)
+        ds = ds.repeat().batch(global_batch, drop_remainder=True).prefetch(tf.data.AUTOTUNE).with_options(options)
+        return iter(strategy.experimental_distribute_dataset(ds))
+
+    # 3. 모델 / 옵티마이저 생성은 strategy scope 안에서
+    with strategy.scope():
+        model = build_model((timesteps, len(features)), forecast_steps)
+        optimizer = Adam(learning_rate=profile['learning_rate'])
+
+    # 샘플별 mse를 global batch 기준으로 평균 (워커 합산 시 전체 평균이 되도록)
+    def batch_loss(x, y, training):
+        pred = model(x, training=training)
+        return tf.reduce_sum(tf.reduce_mean(tf.square(y - pred), axis=1)) / global_batch
+
+    # all-reduce가 들어간 step이라 XLA(jit_compile)는 적용하지 않는다.
+    @tf.function
+    def train_step(iterator):
+        def step_fn(x, y):
+            with tf.GradientTape() as tape:
+                loss = batch_loss(x, y, True)
+            grads = tape.gradient(loss, model.trainable_variables)
+            optimizer.apply_gradients(zip(grads, model.trainable_variables))  # gradient all-reduce
+            return loss
+        return strategy.reduce(tf.distribute.ReduceOp.SUM, strategy.run(step_fn, args=next(iterator)), axis=None)
+
+    @tf.function
+    def val_step(iterator):
+        return strategy.reduce(tf.distribute.ReduceOp.SUM, strategy.run(lambda x, y: batch_loss(x, y, False), args=next(iterator)), axis=None)
+
+    train_iter = make_dataset(X_train, y_train, True)
+    val_iter = make_dataset(X_val, y_val, False) if args.val_steps > 0 else None
+
+    # 4. 학습 루프 - chief만 실제 경로에 저장 (ModelCheckpoint(save_best_only, save_weights_only)와 같은 형식)
+    best_saved, best_loss, best_weights, wait = float('inf'), float('inf'), None, 0
+    samples_per_epoch = args.steps * global_batch
+    epoch_times = []
+    for epoch in range(args.epochs):
+        start = time.perf_counter()
+        train_loss = sum(float(train_step(train_iter)) for _ in range(args.steps)) / args.steps
+        elapsed = time.perf_counter() - start
+        epoch_times.append(elapsed)
+
+        # val_loss는 all-reduce된 값이라 모든 워커가 같은 값으로 같은 결정을 내린다.
+        val_loss = sum(float(val_step(val_iter)) for _ in range(args.val_steps)) / args.val_steps if val_iter else train_loss
+        if is_chief:
+            print(f'Epoch {epoch + 1}/{args.epochs} - loss: {train_loss:.4f} - val_loss: {val_loss:.4f} '
+                  f'- {elapsed:.2f} s, {samples_per_epoch / elapsed:.0f} samples/sec')
+
+        # ModelCheckpoint(save_best_only=True, save_weights_only=True)
+        if val_loss < best_saved:
+            if is_chief:
+                model.save_weights(args.weights)
+                print(f'Epoch {epoch + 1}: val_loss improved from {best_saved:.5f} to {val_loss:.5f}, saving model to {args.weights}')
+            best_saved = val_loss
+
+        # EarlyStopping(min_delta=0.01, patience=10, restore_best_weights=True)
+        if best_loss - val_loss > 0.01:
+            best_loss, best_weights, wait = val_loss, model.get_weights(), 0
+        else:
+            wait += 1
+            if wait >= 10:
+                break
+
+    if best_weights is not None:
+        model.set_weights(best_weights)
+    if is_chief:
+        steady = epoch_times[1:] or epoch_times
+        print(f'Average epoch time: {sum(steady) / len(steady):.2f} s, {samples_per_epoch * len(steady) / sum(steady):.0f} samples/sec')
+    return model
+
+# launcher - 워커 프로세스 실행 후 종료 대기
+def launch(args):
+    steps, val_steps = plan_steps(args.csv_dir, args.workers, args.batch_size)
+    if steps == 0:
+        raise ValueError('샤드별 학습 데이터가 batch_size보다 적습니다. --batch-size 또는 --workers를 줄여주세요.')
+    if val_steps == 0:
+        print('validation 데이터가 batch_size보다 적어서 val_loss 없이 학습합니다.')
+
+    cluster = {'worker': [f'localhost:{port}' for port in free_ports(args.workers)]}
+    processes = []
+    for index in range(args.workers):
+        env = dict(os.environ, TF_CONFIG=json.dumps({'cluster': cluster, 'task': {'type': 'worker', 'index': index}}))
+        command = [sys.executable, os.path.abspath(__file__), '--worker', '--steps', str(steps), '--val-steps', str(val_steps),
+                   '--csv-dir', args.csv_dir, '--weights', args.weights, '--workers', str(args.workers),
+                   '--epochs', str(args.epochs), '--batch-size', str(args.batch_size), '--profile', args.profile]
+        processes.append(subprocess.Popen(command, env=env))
+
+    codes = [p.wait() for p in processes]
+    if any(codes):
+        raise RuntimeError(f'worker exit codes: {codes}')
+    return steps
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='LSTM 체중 예측 모델 데이터 병렬 학습')
+    parser.add_argument('--csv-dir', default='./dummy/outputs/csv')
+    parser.add_argument('--weights', default='./models/modelv1.weights.h5')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--epochs', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=128, help='워커 1개당 배치 크기')
+    parser.add_argument('--profile', default='cpu')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--steps', type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument('--val-steps', type=int, default=0, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.worker:
+        run_worker(args)
+    else:
+        launch(args)
@@ -0,0 +1,58 @@
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import render
+from render import plt, monthly_weight, draw_monthly, render_dir
+from simulation import simulate_users
+from generate import shard_frame
+from bench_simulation import make_people
+
+# 차트 그리기 속도 비교 (charts/sec)
+# - legacy : 기존 make_graph 처럼 사용자마다 plt.figure 새로 생성
+# - reuse  : render.py 워커처럼 figure 1개를 재사용 (프로세스 1개)
+# - pool   : render_dir (워커 여러 개)
+
+users = 40
+
+def legacy_make_graph(df, png_file):
+    monthly = monthly_weight(df)
+    plt.figure(figsize=(10, 6))
+    draw_monthly(plt.gca(), monthly, df['sex'].iloc[0])
+    plt.title('Monthly Average Weight Trend', fontsize=16)
+    plt.xlabel('Month', fontsize=12)
+    plt.ylabel('Average Weight (kg)', fontsize=12)
+    plt.grid(True)
+    plt.savefig(png_file)
+    plt.close()
+
+if __name__ == "__main__":
+    work_dir = tempfile.mkdtemp()
+    csv_path = os.path.join(work_dir, 'csv')
+    os.makedirs(csv_path)
+    result = simulate_users(make_people(np.random.default_rng(0), users), np.random.default_rng(1))
+    shard_frame(result).to_csv(os.path.join(csv_path, 'part-00000.csv'), index=False)
+    df = pd.read_csv(os.path.join(csv_path, 'part-00000.csv'), usecols=render.chart_columns, parse_dates=['date'])
+    user_dfs = [user_df for _, user_df in df.groupby('user_id')]
+
+    start = time.perf_counter()
+    for k, user_df in enumerate(user_dfs):
+        legacy_make_graph(user_df, os.path.join(work_dir, f'legacy_{k}.png'))
+    legacy_time = time.perf_counter() - start
+
+    render.init_worker()
+    start = time.perf_counter()
+    for k, user_df in enumerate(user_dfs):
+        render.render_user(user_df, f'reuse_{k}', work_dir, 'monthly')
+    reuse_time = time.perf_counter() - start
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        render_dir(csv_path, os.path.join(work_dir, f'pool_{workers}'), workers=workers)
+        print(f'pool   ({workers} workers): {users / (time.perf_counter() - start):6.1f} charts/sec (process start 포함)')
+
+    print(f'legacy (new figure): {users / legacy_time:6.1f} charts/sec')
+    print(f'reuse  (1 figure)  : {users / reuse_time:6.1f} charts/sec')
+    shutil.rmtree(work_dir)
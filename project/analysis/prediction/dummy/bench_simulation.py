@@ -0,0 +1,161 @@
+import time
+import numpy as np
+import pandas as pd
+from simulation import days, user_types, pattern_probs, generate_calories, generate_weight_change_effect, simulate_weights, simulate_users
+
+# dummy_maker.py 체중 시뮬레이션 속도 비교 (users/sec)
+# - legacy : 사용자 1명씩 df.loc 스칼라 읽기/쓰기 + 매 반복마다 BMI 전체 재계산
+# - vector : simulation.simulate_weights (사용자 방향 벡터 연산, 날짜만 반복)
+# 같은 난수 입력(칼로리, 패턴, fluctuation)을 넣어서 결과가 같은지도 확인한다.
+
+legacy_users = 5
+vector_users = 5000
+
+# df_bmi.py 결과(updated_test.csv)와 같은 컬럼의 가짜 사용자
+def make_people(rng, n):
+    sex = rng.integers(1, 3, n)
+    age = rng.integers(20, 70, n)
+    height = np.round(np.where(sex == 1, rng.normal(172, 6, n), rng.normal(159, 5, n)), 2)
+    bmi = np.round(rng.uniform(17, 35, n), 2)
+    weight = np.round(bmi * (height / 100) ** 2, 2)
+    bmr = (10 * weight) + (6.25 * height) - (5 * age) + np.where(sex == 1, 5, -161)
+    return pd.DataFrame({
+        'sex': sex, 'age': age, 'height': height, 'weight': weight, 'BMI': bmi,
+        'fat': np.round(rng.uniform(10, 35, n), 2), 'muscle': np.round(rng.uniform(20, 40, n), 2),
+        'consumed_cal': rng.integers(100, 700, n), 'BMR': np.round(bmr, 2),
+    })
+
+# 기존 dummy_maker.py의 체중 시계열 루프 (사용자 1명)
+def legacy_simulate(person, calories, intake_cal, effect, fluctuation):
+    df = pd.DataFrame({
+        'date': pd.date_range(start='2022-01-01', periods=days, freq='D'),
+        'sex': person['sex'], 'age': person['age'], 'weight': person['weight'], 'height': person['height'],
+        'BMI': person['BMI'], 'calories': calories, 'intake_cal': intake_cal, 'BMR': person['BMR'],
+        'day_variable': 0.0, 'est_weight': np.zeros(days), 'weight_change_effect': effect,
+    })
+    df['BMR'] = df['BMR'].astype(float)
+    df['weight'] = df['weight'].astype(float)
+    df.loc[0, 'day_variable'] = float(round((df.loc[0, 'intake_cal'] - (df.loc[0, 'BMR'] + df.loc[0, 'calories'])) / 7700, 2))
+    df.loc[0, 'est_weight'] = df.loc[0, 'weight'] + df.loc[0, 'day_variable']
+
+    for i in range(1, len(df)):
+        df.loc[i, 'weight'] = df.loc[i-1, 'est_weight'] + fluctuation[i]
+        equation = (10 * df.loc[i, 'weight']) + (6.25 * df.loc[i, 'height']) - (5 * df.loc[i, 'age'])
+        df.loc[i, 'BMR'] = np.where(df.loc[i, 'sex'] == 1, equation + 5, equation - 161)
+        df.loc[i, 'day_variable'] = round((df.loc[i, 'intake_cal'] - (df.loc[i, 'BMR'] + df.loc[i, 'calories'])) / 7700, 2) - 0.05
+        df.loc[i, 'est_weight'] = (df.loc[i-1, 'weight'] + df.loc[i, 'weight']) / 2 + (df.loc[i, 'weight_change_effect'] if abs(df.loc[i, 'weight_change_effect']) < 1 else df.loc[i, 'day_variable'])
+        df['BMI'] = round(df['weight'] / ((df['height']/100) ** 2), 2)
+    return df
+
+# 기존 dummy_maker.py의 패턴 생성 + 적용 (사용자 1명, DataFrame 없이 같은 규칙)
+def legacy_effect(exercise_habit, rng):
+    user_type = rng.choice(user_types, p=[0.2, 0.2, 0.6] if exercise_habit else [0.25, 0.25, 0.5])
+    effect = np.zeros(days)
+    start = 0
+    while start < days:
+        length = rng.integers(14, 31)
+        end = min(start + length, days)
+        pattern_type = rng.choice(user_types, p=pattern_probs[user_type])
+        n = end - start
+        if pattern_type == 'increase':
+            effect[start:end] += np.linspace(0.01, n, n) + rng.uniform(-0.1, 0.1, n)
+        elif pattern_type == 'decrease':
+            effect[start:end] -= np.linspace(0.01, n, n) + rng.uniform(-0.1, 0.1, n)
+        else:
+            effect[start:end] += rng.uniform(-0.05, 0.05, n)
+        start += length
+    return user_type, effect
+
+# 기존 dummy_maker.py의 7일 단위 칼로리 패턴 140주 생성 + 섞기 (사용자 1명)
+def legacy_calories(flag, rng):
+    all_patterns = []
+    for _ in range(days // 7):
+        num_exercise_days = rng.integers(3, 8) if flag else rng.integers(0, 4)
+        exercise_days = rng.choice(range(7), size=num_exercise_days, replace=False)
+        weekly_pattern = []
+        for day in range(7):
+            if day in exercise_days:
+                calories = 450 + round(rng.normal(100, 75), 2) if flag else 250 + round(rng.normal(100, 25), 2)
+            else:
+                calories = 100 + round(rng.normal(100, 50), 2)
+            weekly_pattern.append(calories)
+        all_patterns.append(weekly_pattern)
+    rng.shuffle(all_patterns)
+    return [cal for weekly_pattern in all_patterns for cal in weekly_pattern]
+
+def calorie_stats(habit, calories):
+    weekly = calories.reshape(len(habit), -1, 7)
+    return {
+        'habit mean cal': calories[habit].mean(),
+        'habit std cal': calories[habit].std(),
+        'habit weekly sum': weekly[habit].sum(axis=2).mean(),
+        'no habit mean cal': calories[~habit].mean(),
+        'no habit std cal': calories[~habit].std(),
+        'no habit weekly sum': weekly[~habit].sum(axis=2).mean(),
+    }
+
+def print_stats(legacy_stats, vector_stats):
+    print(f"\n{'stat':<30}{'legacy':>10}{'vector':>10}")
+    for name in legacy_stats:
+        print(f'{name:<30}{legacy_stats[name]:>10.3f}{vector_stats[name]:>10.3f}')
+
+def effect_stats(types, effect):
+    return {
+        'maintain users': np.mean(types == 'maintain'),
+        'mean |effect|': np.abs(effect).mean(),
+        'pattern days (|effect| < 1)': np.mean(np.abs(effect) < 1),
+        'increase days': np.mean(effect >= 1),
+        'decrease days': np.mean(effect <= -1),
+    }
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    people = make_people(rng, legacy_users)
+
+    # 1. 같은 입력으로 legacy / vector 결과 비교
+    result = simulate_users(people, np.random.default_rng(1))
+    fluctuation = np.random.default_rng(2).uniform(-0.1, 0.1, size=(legacy_users, days))
+    weight, bmr, day_variable, est_weight, bmi = simulate_weights(
+        people['weight'].to_numpy(float), people['height'].to_numpy(float), people['age'].to_numpy(float),
+        people['sex'].to_numpy(), people['BMR'].to_numpy(float),
+        result['intake_cal'], result['calories'], result['weight_change_effect'], fluctuation)
+
+    start = time.perf_counter()
+    legacy = [legacy_simulate(people.iloc[k], result['calories'][k], result['intake_cal'][k],
+                              result['weight_change_effect'][k], fluctuation[k]) for k in range(legacy_users)]
+    legacy_time = time.perf_counter() - start
+
+    for k, df in enumerate(legacy):
+        assert np.allclose(df['weight'], weight[k]), k
+        assert np.allclose(df['BMR'], bmr[k]), k
+        assert np.allclose(df['day_variable'], day_variable[k]), k
+        assert np.allclose(df['est_weight'], est_weight[k]), k
+        assert np.allclose(df['BMI'], bmi[k]), k
+    print(f'legacy == vector for {legacy_users} users: True')
+
+    # 2. 속도 비교 (vector는 패턴 생성까지 포함한 전체 시뮬레이션)
+    people = make_people(rng, vector_users)
+    start = time.perf_counter()
+    simulate_users(people, np.random.default_rng(3))
+    vector_time = time.perf_counter() - start
+    print(f'legacy: {legacy_users / legacy_time:8.2f} users/sec (weight loop only)')
+    print(f'vector: {vector_users / vector_time:8.2f} users/sec (full simulation, {vector_users} users)')
+    print(f'speedup: {(vector_users / vector_time) / (legacy_users / legacy_time):.0f}x')
+
+    # 3. 체중 변화 패턴 분포 비교 (legacy 규칙 vs 벡터화)
+    habit = people['consumed_cal'].to_numpy()[:1000] >= 400
+    pattern_rng = np.random.default_rng(4)
+    legacy_patterns = [legacy_effect(h, pattern_rng) for h in habit]
+    legacy_stats = effect_stats(np.array([t for t, _ in legacy_patterns]), np.array([e for _, e in legacy_patterns]))
+    vector_stats = effect_stats(*generate_weight_change_effect(habit, np.random.default_rng(5)))
+    print_stats(legacy_stats, vector_stats)
+
+    # 4. 주간 칼로리 패턴 (사용자별 반복문 vs (사용자 수, 140, 7) 배열)
+    start = time.perf_counter()
+    legacy_cal = np.array([legacy_calories(h, pattern_rng) for h in habit])
+    legacy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    vector_cal = generate_calories(habit, np.random.default_rng(6))
+    vector_time = time.perf_counter() - start
+    print(f'\ncalorie patterns for {len(habit)} users - legacy: {legacy_time:.2f} s, vector: {vector_time:.3f} s ({legacy_time / vector_time:.0f}x)')
+    print_stats(calorie_stats(habit, legacy_cal), calorie_stats(habit, vector_cal))
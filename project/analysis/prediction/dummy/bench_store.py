@@ -0,0 +1,71 @@
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from simulation import days, start_date, simulate_users
+from generate import shard_frame
+from store import write_meta, write_chunk, read_chunk, iter_users
+from bench_simulation import make_people
+
+# 생성 결과 저장 형식 비교 - csv 파티션 vs 컬럼 저장소 (store.py)
+# 디스크 크기, 쓰기 시간, 읽기 시간 (학습에 쓰는 컬럼으로 사용자별 DataFrame 만들기 / 배열 그대로)
+
+users = 2000
+chunk_size = 500
+train_columns = ['age', 'sex', 'BMI', 'weight', 'calories']
+
+def dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+if __name__ == "__main__":
+    work_dir = tempfile.mkdtemp()
+    csv_dir, store_dir = os.path.join(work_dir, 'csv'), os.path.join(work_dir, 'store')
+    os.makedirs(csv_dir)
+    write_meta(store_dir, start_date, days)
+
+    people = make_people(np.random.default_rng(0), users)
+    results = [simulate_users(people.iloc[s:s + chunk_size], np.random.default_rng(s), user_ids=np.arange(s, min(s + chunk_size, users)))
+               for s in range(0, users, chunk_size)]
+
+    # 1. 쓰기
+    start = time.perf_counter()
+    for k, result in enumerate(results):
+        shard_frame(result).to_csv(os.path.join(csv_dir, f'part-{k:05d}.csv'), index=False)
+    csv_write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for k, result in enumerate(results):
+        write_chunk(os.path.join(store_dir, f'part-{k:05d}.npz'), result)
+    store_write = time.perf_counter() - start
+
+    # 2. 읽기 - 사용자별 DataFrame (dataset.load_csv_frames와 같은 방식)
+    start = time.perf_counter()
+    csv_frames = [user_df for f in sorted(os.listdir(csv_dir))
+                  for _, user_df in pd.read_csv(os.path.join(csv_dir, f)).groupby('user_id')]
+    csv_read = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store_frames = [df for _, _, df in iter_users(store_dir, columns=train_columns)]
+    store_read = time.perf_counter() - start
+
+    # 배열 그대로 (DataFrame 없이)
+    start = time.perf_counter()
+    arrays = [read_chunk(os.path.join(store_dir, f), train_columns) for f in sorted(os.listdir(store_dir)) if f.endswith('.npz')]
+    array_read = time.perf_counter() - start
+
+    # 같은 값인지 확인 (float32 저장이라 허용 오차 내)
+    assert len(csv_frames) == len(store_frames) == users
+    for csv_df, store_df in zip(csv_frames[:50], store_frames[:50]):
+        for column in train_columns:
+            assert np.allclose(csv_df[column].to_numpy(), store_df[column].to_numpy(), atol=1e-3), column
+
+    csv_size, store_size = dir_size(csv_dir), dir_size(store_dir)
+    print(f'{users} users x {days} days')
+    print(f"{'':<8}{'size (MB)':>12}{'write (s)':>12}{'read frames (s)':>18}")
+    print(f"{'csv':<8}{csv_size / 1e6:>12.1f}{csv_write:>12.2f}{csv_read:>18.2f}")
+    print(f"{'store':<8}{store_size / 1e6:>12.1f}{store_write:>12.2f}{store_read:>18.2f}")
+    print(f'store arrays only: {array_read:.3f} s')
+    print(f'size {csv_size / store_size:.1f}x smaller, write {csv_write / store_write:.0f}x, read frames {csv_read / store_read:.1f}x, read arrays {csv_read / array_read:.0f}x faster')
+    shutil.rmtree(work_dir)
@@ -0,0 +1,134 @@
+import os
+import json
+import time
+import hashlib
+import argparse
+import multiprocessing as mp
+import numpy as np
+import pandas as pd
+from simulation import days, start_date, output_columns, simulate_users
+from store import write_meta, write_chunk, meta_name
+
+# 가상 사용자 데이터 병렬 생성기
+# - 사용자를 shard_size명씩 샤드로 나누고, 워커 프로세스가 샤드 단위로 시뮬레이션
+# - 샤드마다 np.random.default_rng([seed, shard]) 로 독립 난수 생성 -> 워커 수와 상관없이 같은 결과
+# - 샤드 결과는 part-XXXXX.csv 파티션 1개 (임시 파일에 쓰고 rename 하므로 파일이 있으면 완료된 샤드)
+#   --format store 이면 store.py 컬럼 저장소의 part-XXXXX.npz (사용자 정보 1번 + 시계열 float32 배열)
+# - 중간에 멈춰도 다시 실행하면 완료된 샤드는 건너뛰고 이어서 생성
+
+manifest_name = '_manifest.json'
+
+def shard_path(out_dir, shard, output_format='csv'):
+    return os.path.join(out_dir, f'part-{shard:05d}.{"npz" if output_format == "store" else "csv"}')
+
+# 사용자 구간 나누기 - [(shard, start, end), ...]
+def plan_shards(n_users, shard_size):
+    return [(shard, start, min(start + shard_size, n_users)) for shard, start in enumerate(range(0, n_users, shard_size))]
+
+# 기본 사용자 정보 (df_bmi.py 결과) - users가 더 많으면 seed 기준으로 복원 추출
+def load_people(people_path, users=None, seed=0):
+    people = pd.read_csv(people_path)
+    if users is None or users == len(people):
+        return people
+    rows = np.random.default_rng([seed, users]).integers(0, len(people), users)
+    return people.iloc[rows].reset_index(drop=True)
+
+# 시뮬레이션 결과 전체를 한 번에 long format DataFrame으로 (user_frame을 사용자 수만큼 concat 하지 않음)
+def shard_frame(result):
+    n_users = len(result['user_id'])
+    frame = {
+        'date': np.tile(pd.date_range(start=start_date, periods=days, freq='D').to_numpy(), n_users),
+        'user_id': np.repeat(result['user_id'], days),
+    }
+    for column in ['sex', 'age', 'height', 'fat', 'muscle']:
+        frame[column] = np.repeat(result['static'][column].to_numpy(), days)
+    for column in ['weight', 'BMI', 'calories', 'intake_cal', 'BMR', 'day_variable', 'est_weight', 'weight_change_effect']:
+        frame[column] = result[column].ravel()
+    return pd.DataFrame(frame)[output_columns]
+
+# 워커 - 샤드 1개 생성 후 파티션 저장
+def generate_shard(task):
+    shard, user_ids, people, out_dir, seed, output_format = task
+    start = time.perf_counter()
+    rng = np.random.default_rng([seed, shard])
+    result = simulate_users(people, rng, user_ids=user_ids)
+
+    path = shard_path(out_dir, shard, output_format)
+    if output_format == 'store':
+        write_chunk(path, result)
+    else:
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        shard_frame(result).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    return shard, len(user_ids), time.perf_counter() - start
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# 같은 출력 폴더에 다른 설정으로 이어서 생성하면 샤드끼리 섞이므로 설정을 기록해두고 비교
+def check_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, manifest_name)
+    if os.path.exists(path):
+        with open(path) as f:
+            saved = json.load(f)
+        if saved != manifest:
+            raise ValueError(f'{out_dir} 에 다른 설정으로 생성된 데이터가 있습니다: {saved} (--overwrite 로 새로 생성)')
+    else:
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+def run(args):
+    people = load_people(args.people, args.users, args.seed)
+    # people csv 내용이 바뀌면 기존 샤드는 이어서 쓰면 안 되므로 내용 hash도 기록
+    manifest = {'people': os.path.abspath(args.people), 'people_sha256': file_sha256(args.people),
+                'users': len(people), 'seed': args.seed, 'shard_size': args.shard_size, 'format': args.format}
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    if args.overwrite:
+        for f in os.listdir(args.out_dir):
+            if f.startswith('part-') or f in (manifest_name, meta_name):
+                os.remove(os.path.join(args.out_dir, f))
+    check_manifest(args.out_dir, manifest)
+    if args.format == 'store':
+        write_meta(args.out_dir, start_date, days)
+
+    # 중단된 실행이 남긴 임시 파일 정리
+    for f in os.listdir(args.out_dir):
+        if f.endswith('.tmp'):
+            os.remove(os.path.join(args.out_dir, f))
+
+    shards = plan_shards(len(people), args.shard_size)
+    pending = [s for s in shards if not os.path.exists(shard_path(args.out_dir, s[0], args.format))]
+    print(f'{len(people)} users, {len(shards)} shards ({len(shards) - len(pending)} done, {len(pending)} to generate), {args.workers} workers')
+
+    tasks = [(shard, np.arange(start, end), people.iloc[start:end], args.out_dir, args.seed, args.format) for shard, start, end in pending]
+    start = time.perf_counter()
+    generated = 0
+    with mp.get_context('spawn').Pool(processes=args.workers) as pool:
+        for shard, n_users, elapsed in pool.imap_unordered(generate_shard, tasks):
+            generated += n_users
+            print(f'{os.path.basename(shard_path(args.out_dir, shard, args.format))} saved! ({n_users} users, {elapsed:.1f} s)')
+
+    total = time.perf_counter() - start
+    if generated:
+        print(f'Generated {generated} users in {total:.1f} s ({generated / total:.1f} users/sec)')
+    return generated
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='가상 사용자 980일 데이터 병렬 생성')
+    parser.add_argument('--people', default='../statistics/korean_health_stats/updated_test.csv', help='df_bmi.py 결과 csv')
+    parser.add_argument('--out-dir', default='./outputs/shards')
+    parser.add_argument('--users', type=int, default=None, help='생성할 사용자 수 (기본: people csv 전체)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shard-size', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--format', choices=['csv', 'store'], default='csv', help='csv 파티션 또는 컬럼 저장소 (store.py)')
+    parser.add_argument('--overwrite', action='store_true')
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    run(parse_args())
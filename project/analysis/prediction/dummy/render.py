@@ -0,0 +1,143 @@
+import os
+import time
+import argparse
+import multiprocessing as mp
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # 화면 없이 png만 저장
+import matplotlib.pyplot as plt
+from store import is_store, list_chunks, iter_users
+
+# 생성된 csv (sample_*.csv 또는 generate.py 파티션) 또는 store.py 저장소에서 차트만 따로 그리는 단계
+# - monthly : dummy_maker.py 차트 (월 평균 체중, y축 35 ~ 105 고정)
+# - details : dummy_compiler.py 차트 (max / min / 월별 최대 차이 표시, y축은 체중 범위)
+# - 워커마다 figure 1개를 만들어두고 사용자마다 axes만 지우고 다시 그린다.
+# - sample 비율이나 user id를 지정하면 일부 사용자만 그린다. (seed 기준으로 항상 같은 사용자)
+
+chart_columns = ['date', 'user_id', 'sex', 'weight']
+
+# 워커 프로세스마다 1번만 만드는 figure
+worker_figure = None
+worker_axes = None
+
+def init_worker():
+    global worker_figure, worker_axes
+    worker_figure, worker_axes = plt.subplots(figsize=(10, 6))
+
+# 월 단위 평균 체중 (결측치가 있으면 앞의 값으로 채움)
+def monthly_weight(df):
+    return df.set_index('date')['weight'].resample('ME').mean().ffill()
+
+def draw_monthly(ax, monthly, sex):
+    color = 'b' if sex == 1 else 'r'  # 성별에 따른 색상 선택
+    marker = 'o' if sex == 1 else 'x'  # 성별에 따른 마커 선택
+    ax.plot(monthly.index, monthly.values, marker=marker, linestyle='-', color=color)
+
+    # 데이터 포인트 위에 수치 표시
+    for x, y in zip(monthly.index, monthly.values):
+        ax.text(x, y, f'{y:.1f}', ha='center', va='bottom', fontsize=8, color=color)
+    ax.set_ylim(35, 105)
+
+def draw_details(ax, monthly, sex, weight_min, weight_max):
+    color = 'b' if sex == 1 else 'r'
+    marker = 'o' if sex == 1 else 'x'
+    ax.plot(monthly.index, monthly.values, marker=marker, linestyle='-', color=color)
+    for x, y in zip(monthly.index, monthly.values):
+        ax.text(x, y, f'{y:.1f}', ha='center', va='bottom', fontsize=8, color=color)
+
+    # max, min 값 표시
+    if monthly.notna().any():
+        max_index, min_index = monthly.idxmax(), monthly.idxmin()
+        ax.text(max_index, monthly[max_index], f'Max: {monthly.max():.1f}kg', ha='left', va='bottom', fontsize=10, color='green')
+        ax.text(min_index, monthly[min_index], f'Min: {monthly.min():.1f}kg', ha='left', va='top', fontsize=10, color='red')
+
+    # 월 별 최대 차이값 표시
+    diff = monthly.diff().abs()
+    if diff.notna().any():
+        max_diff_index = diff.idxmax()
+        ax.text(max_diff_index, monthly[max_diff_index], f'Biggest diff: {diff.max():.1f}kg', ha='left', va='bottom', fontsize=10, color='purple')
+    ax.set_ylim(weight_min, weight_max)
+
+# 사용자 1명 차트 저장 - figure는 재사용
+def render_user(df, name, chart_dir, mode):
+    monthly = monthly_weight(df)
+    sex = df['sex'].iloc[0]
+    paths = []
+    for kind in (['monthly', 'details'] if mode == 'both' else [mode]):
+        worker_axes.clear()
+        if kind == 'monthly':
+            draw_monthly(worker_axes, monthly, sex)
+            png_file = os.path.join(chart_dir, f'{name}.png')
+        else:
+            draw_details(worker_axes, monthly, sex, df['weight'].min(), df['weight'].max())
+            png_file = os.path.join(chart_dir, 'details', f'{name}.png')
+
+        # 그래프 제목과 축 레이블, 그리드
+        worker_axes.set_title('Monthly Average Weight Trend', fontsize=16)
+        worker_axes.set_xlabel('Month', fontsize=12)
+        worker_axes.set_ylabel('Average Weight (kg)', fontsize=12)
+        worker_axes.grid(True)
+        worker_figure.savefig(png_file)
+        paths.append(png_file)
+    return paths
+
+# sample 비율만큼 사용자 고르기 - user_id와 seed로 정해지므로 워커 / 파일 나누기와 상관없이 같은 사용자
+def is_selected(user_id, sample, seed, user_ids):
+    if user_ids is not None:
+        return user_id in user_ids
+    return sample >= 1.0 or np.random.default_rng([seed, user_id]).random() < sample
+
+# 워커 - csv 1개 (사용자 1명 또는 파티션) 또는 저장소 chunk 1개의 선택된 사용자 차트 그리기
+def render_file(task):
+    csv_path, file, chart_dir, mode, sample, seed, user_ids = task
+    if file.endswith('.npz'):
+        users = [(user_id, df) for _, user_id, df in iter_users(csv_path, [file], columns=chart_columns)]
+    else:
+        df = pd.read_csv(os.path.join(csv_path, file), usecols=chart_columns, parse_dates=['date'])
+        users = list(df.groupby('user_id', sort=True))
+    rendered = []
+    for user_id, user_df in users:
+        if not is_selected(int(user_id), sample, seed, user_ids):
+            continue
+        # sample_*.csv는 파일 이름 그대로, 파티션은 사용자별 sample_{user_id}
+        name = file[:-4] if len(users) == 1 and file.endswith('.csv') else f'sample_{int(user_id)}'
+        rendered.extend(render_user(user_df, name, chart_dir, mode))
+    return rendered
+
+def render_dir(csv_path, chart_dir, mode='monthly', workers=None, sample=1.0, seed=0, user_ids=None):
+    os.makedirs(chart_dir, exist_ok=True)
+    if mode in ('details', 'both'):
+        os.makedirs(os.path.join(chart_dir, 'details'), exist_ok=True)
+
+    files = list_chunks(csv_path) if is_store(csv_path) else sorted(f for f in os.listdir(csv_path) if f.endswith('.csv'))
+    user_ids = set(user_ids) if user_ids else None
+    tasks = [(csv_path, f, chart_dir, mode, sample, seed, user_ids) for f in files]
+
+    start = time.perf_counter()
+    count = 0
+    with mp.get_context('spawn').Pool(processes=workers or os.cpu_count(), initializer=init_worker) as pool:
+        for rendered in pool.imap_unordered(render_file, tasks):
+            for png_file in rendered:
+                print(f'{os.path.basename(png_file)} Saved!')
+            count += len(rendered)
+
+    elapsed = time.perf_counter() - start
+    if count:
+        print(f'Rendered {count} charts in {elapsed:.1f} s ({count / elapsed:.1f} charts/sec)')
+    return count
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='생성된 사용자 데이터 차트 그리기')
+    parser.add_argument('--csv-path', default='./outputs/test/csv')
+    parser.add_argument('--chart-dir', default='./outputs/test/chart')
+    parser.add_argument('--mode', choices=['monthly', 'details', 'both'], default='monthly')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--sample', type=float, default=1.0, help='차트를 그릴 사용자 비율 (0 ~ 1)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--user-ids', type=int, nargs='*', default=None, help='지정한 사용자만 그리기')
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    render_dir(args.csv_path, args.chart_dir, args.mode, args.workers, args.sample, args.seed, args.user_ids)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+# 1인 980일에 대한 데이터 만들기 (22년 1월 1일부터 24년 9월 6일까지의 기록)
+days = 980
+start_date = '2022-01-01'
+user_types = np.array(['increase', 'decrease', 'maintain'])
+
+# dummy_maker.py 출력 csv 컬럼 순서
+output_columns = ['date', 'user_id', 'sex', 'age', 'weight', 'height', 'BMI', 'fat', 'muscle', 'calories',
+                  'intake_cal', 'BMR', 'day_variable', 'est_weight', 'weight_change_effect']
+
+### 칼로리 분배 - 사용자 전체의 140주 x 7일 패턴을 (사용자 수, 140, 7) 배열로 한 번에 생성
+def generate_calories(exercise_habit, rng):
+    exercise_habit = np.asarray(exercise_habit, dtype=bool)
+    n_users = len(exercise_habit)
+    weeks = days // 7
+    habit = exercise_habit[:, np.newaxis, np.newaxis]
+
+    # 1. 주마다 몇 번 운동할지 (운동 습관이 있으면 3 ~ 7번, 없으면 0 ~ 3번)
+    low = np.where(exercise_habit, 3, 0)[:, np.newaxis]
+    high = np.where(exercise_habit, 8, 4)[:, np.newaxis]
+    num_exercise_days = rng.integers(low, high, size=(n_users, weeks))
+
+    # 2. 운동하는 날 - 요일마다 난수 순위를 매겨 순위가 운동 횟수보다 작은 날 (중복 없이 고르기와 같은 분포)
+    rank = rng.random((n_users, weeks, 7)).argsort(axis=2).argsort(axis=2)
+    exercise_days = rank < num_exercise_days[:, :, np.newaxis]
+
+    # 3. 칼로리 - 운동량이 높은 날 450 + N(100, 75), 낮은 날 250 + N(100, 25), 운동안할 때 기본 활동량 100 + N(100, 50)
+    base = np.where(exercise_days, np.where(habit, 450, 250), 100)
+    scale = np.where(exercise_days, np.where(habit, 75, 25), 50)
+    calories = base + np.round(100 + scale * rng.standard_normal((n_users, weeks, 7)), 2)
+
+    # 4. 980일로 펼치기 - 주마다 독립적으로 뽑았으므로 주 단위 섞기는 하지 않아도 분포가 같다.
+    return calories.reshape(n_users, weeks * 7)
+
+### 식습관 반영 - 성별에 따라 섭취 칼로리 분포가 다름 (사용자 수, 980)
+def generate_intake(sex, rng):
+    p = [0.15, 0.3, 0.4, 0.1, 0.05]
+    male = rng.choice([1600, 2100, 2600, 3100, 3600], size=(len(sex), days), p=p)
+    female = rng.choice([1300, 1700, 2100, 2500, 2900], size=(len(sex), days), p=p)
+    return np.where(np.asarray(sex)[:, np.newaxis] == 1, male, female)
+
+### 체중 변화 패턴
+'''
+유저 타입
+- 장기간 감소 / 장기간 증가 / 유지
+
+패턴 타입 (14 ~ 30일 단위)
+- 증가 패턴 / 감소 패턴 / 유지 패턴
+'''
+# 유저 타입별 패턴 타입 확률 (increase, decrease, maintain)
+pattern_probs = {
+    'increase': [0.2, 0.1, 0.7],  # 증가형, 증가를 많이 가져가게
+    'decrease': [0.1, 0.2, 0.7],  # 감소형, 감소를 많이 가져가게
+    'maintain': [0.15, 0.15, 0.7],  # 유지형, 증가-감소를 가져가고, 유지가 더 많이
+}
+
+# 사용자 전체의 패턴을 한 번에 만들어 weight_change_effect (사용자 수, 980) 계산
+def generate_weight_change_effect(exercise_habit, rng):
+    exercise_habit = np.asarray(exercise_habit, dtype=bool)
+    n_users = len(exercise_habit)
+
+    # 1. 유저 타입 - 운동 습관이 있으면 유지형 비율이 높다.
+    habit_probs = np.where(exercise_habit[:, np.newaxis], [0.2, 0.2, 0.6], [0.25, 0.25, 0.5])
+    user_type = (rng.random((n_users, 1)) > habit_probs.cumsum(axis=1)).sum(axis=1)
+
+    # 2. 패턴 길이 (14 ~ 30일)와 시작/끝 지점 - 최소 길이 14일이라 최대 70개면 980일을 채운다.
+    max_patterns = -(-days // 14)
+    lengths = rng.integers(14, 31, size=(n_users, max_patterns))
+    ends = np.minimum(lengths.cumsum(axis=1), days)
+    starts = np.concatenate([np.zeros((n_users, 1), dtype=ends.dtype), ends[:, :-1]], axis=1)
+
+    # 3. 패턴 타입 - 유저 타입별 확률로 패턴마다 뽑기
+    type_probs = np.array([pattern_probs[t] for t in user_types])[user_type]  # (사용자 수, 3)
+    pattern_type = (rng.random((n_users, max_patterns, 1)) > type_probs.cumsum(axis=1)[:, np.newaxis, :]).sum(axis=2)
+
+    # 4. 날짜별로 속한 패턴 찾기
+    # 사용자마다 offset을 더해 한 줄로 펴고 searchsorted 1번으로 처리
+    day_index = np.arange(days)
+    rows = np.arange(n_users)[:, np.newaxis]
+    offset = rows * (days + 1)
+    pattern_index = np.searchsorted((ends + offset).ravel(), (day_index + offset).ravel(), side='right').reshape(n_users, days)
+    pattern_index -= rows * max_patterns  # (사용자 수, 980)
+    pattern_start = starts[rows, pattern_index]
+    pattern_days = ends[rows, pattern_index] - pattern_start
+    day_type = pattern_type[rows, pattern_index]
+
+    # 5. 증가/감소 패턴: linspace(0.01, 패턴 길이, 패턴 길이) + uniform(-0.1, 0.1), 유지 패턴: uniform(-0.05, 0.05)
+    position = day_index[np.newaxis, :] - pattern_start
+    step = np.where(pattern_days > 1, (pattern_days - 0.01) / np.maximum(pattern_days - 1, 1), 0.0)
+    trend = 0.01 + position * step + rng.uniform(-0.1, 0.1, size=(n_users, days))
+    maintain = rng.uniform(-0.05, 0.05, size=(n_users, days))
+
+    effect = np.select([day_type == 0, day_type == 1], [trend, -trend], maintain)
+    return user_types[user_type], effect
+
+### 체중 시계열 - 사용자 전체를 배열로 두고 하루씩 진행 (사용자 방향은 벡터 연산)
+def simulate_weights(weight, height, age, sex, bmr, intake_cal, calories, effect, fluctuation):
+    n_users = len(weight)
+    weight_series = np.zeros((n_users, days))
+    bmr_series = np.zeros((n_users, days))
+    day_variable = np.zeros((n_users, days))
+    est_weight = np.zeros((n_users, days))
+
+    # 첫째날 하루의 몸무게 변화 = (먹었던 것 - (기초 대사 + 활동 대사)) / 7700
+    weight_series[:, 0] = weight
+    bmr_series[:, 0] = bmr
+    day_variable[:, 0] = np.round((intake_cal[:, 0] - (bmr + calories[:, 0])) / 7700, 2)
+    est_weight[:, 0] = weight + day_variable[:, 0]
+
+    # BMR 중 체중과 무관한 부분은 미리 계산 (남성 +5, 여성 -161)
+    bmr_base = (6.25 * height) - (5 * age) + np.where(sex == 1, 5, -161)
+    use_effect = np.abs(effect) < 1
+
+    for i in range(1, days):
+        # 1. 기존 체중(weight)을 예상 체중으로 덮어 씌우기
+        weight_series[:, i] = est_weight[:, i - 1] + fluctuation[:, i]
+
+        # 2. 오늘 하루 BMR 반영
+        bmr_series[:, i] = (10 * weight_series[:, i]) + bmr_base
+
+        # 3. 하루의 체중 변화량 = (섭취한 칼로리 - (BMR + 소모된 칼로리)) / 7700
+        day_variable[:, i] = np.round((intake_cal[:, i] - (bmr_series[:, i] + calories[:, i])) / 7700, 2) - 0.05
+
+        # 4. 오늘의 est_weight 계산 (어제, 오늘 몸무게 평균 + 패턴 변화량이 작으면 패턴, 크면 연산 변화량)
+        est_weight[:, i] = (weight_series[:, i - 1] + weight_series[:, i]) / 2 + np.where(use_effect[:, i], effect[:, i], day_variable[:, i])
+
+    # 5. 변화하는 BMI 계산 (매 반복마다 전체를 다시 계산하지 않고 루프 밖에서 1번만)
+    bmi = np.round(weight_series / ((height[:, np.newaxis] / 100) ** 2), 2)
+    return weight_series, bmr_series, day_variable, est_weight, bmi
+
+# people_data (df_bmi.py 결과) 여러 명을 한 번에 시뮬레이션
+def simulate_users(people, rng, user_ids=None):
+    n_users = len(people)
+    sex = people['sex'].to_numpy()
+    height = people['height'].to_numpy(dtype=np.float64)
+    age = people['age'].to_numpy(dtype=np.float64)
+
+    # 1. 사용자 운동 습관 분석 (하루 소모 칼로리 400 이상)
+    exercise_habit = people['consumed_cal'].to_numpy() >= 400
+
+    # 2. 활동 칼로리, 섭취 칼로리, 체중 변화 패턴
+    calories = generate_calories(exercise_habit, rng)
+    intake_cal = generate_intake(sex, rng)
+    user_type, effect = generate_weight_change_effect(exercise_habit, rng)
+
+    # 3. 체중 시계열
+    fluctuation = rng.uniform(-0.1, 0.1, size=(n_users, days))
+    weight, bmr, day_variable, est_weight, bmi = simulate_weights(
+        people['weight'].to_numpy(dtype=np.float64), height, age, sex, people['BMR'].to_numpy(dtype=np.float64),
+        intake_cal, calories, effect, fluctuation)
+
+    return {
+        'user_id': np.arange(n_users) if user_ids is None else np.asarray(user_ids),
+        'user_type': user_type,
+        'static': people[['sex', 'age', 'height', 'fat', 'muscle']].reset_index(drop=True),
+        'weight': weight,
+        'BMI': bmi,
+        'calories': calories,
+        'intake_cal': intake_cal,
+        'BMR': bmr,
+        'day_variable': day_variable,
+        'est_weight': est_weight,
+        'weight_change_effect': effect,
+    }
+
+# 시뮬레이션 결과에서 k번째 사용자를 기존 csv 형식의 DataFrame으로
+def user_frame(result, k):
+    static = result['static'].iloc[k]
+    df = pd.DataFrame({'date': pd.date_range(start=start_date, periods=days, freq='D'), 'user_id': result['user_id'][k]})
+    for column in ['sex', 'age', 'height', 'fat', 'muscle']:
+        df[column] = static[column]
+    for column in ['weight', 'BMI', 'calories', 'intake_cal', 'BMR', 'day_variable', 'est_weight', 'weight_change_effect']:
+        df[column] = result[column][k]
+    return df[output_columns]
@@ -0,0 +1,88 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# 생성된 시계열을 컬럼 단위 배열로 저장하는 저장소 (csv 대신)
+# - 폴더 1개 = 저장소, _store.json에 날짜 범위 / 컬럼 정보
+# - 샤드(사용자 묶음)마다 part-XXXXX.npz 1개
+#   - 사용자 테이블 : user_id, sex, age, height, fat, muscle (사용자당 1번만 저장)
+#   - 시계열 테이블 : 날짜마다 바뀌는 컬럼만 (사용자 수, 980) 배열, float32
+# - date는 저장하지 않고 start_date + days로 다시 만든다.
+# 이 파일은 prediction 폴더(dataset.py, evaluate.py)에서도 불러오므로 dummy 모듈을 import 하지 않는다.
+
+meta_name = '_store.json'
+chunk_suffix = '.npz'
+
+static_columns = ['sex', 'age', 'height', 'fat', 'muscle']
+series_dtypes = {
+    'weight': np.float32,
+    'BMI': np.float32,
+    'calories': np.float32,
+    'intake_cal': np.int16,
+    'BMR': np.float32,
+    'day_variable': np.float32,
+    'est_weight': np.float32,
+    'weight_change_effect': np.float32,
+}
+
+# dummy_maker.py 출력 csv와 같은 컬럼 순서
+frame_columns = ['date', 'user_id', 'sex', 'age', 'weight', 'height', 'BMI', 'fat', 'muscle', 'calories',
+                 'intake_cal', 'BMR', 'day_variable', 'est_weight', 'weight_change_effect']
+
+def is_store(path):
+    return os.path.isfile(os.path.join(path, meta_name))
+
+def write_meta(store_dir, start_date, days):
+    os.makedirs(store_dir, exist_ok=True)
+    meta = {'start_date': start_date, 'days': days, 'static_columns': static_columns, 'series_columns': list(series_dtypes)}
+    with open(os.path.join(store_dir, meta_name), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+def read_meta(store_dir):
+    with open(os.path.join(store_dir, meta_name)) as f:
+        return json.load(f)
+
+def list_chunks(store_dir):
+    return sorted(f for f in os.listdir(store_dir) if f.endswith(chunk_suffix))
+
+# simulation.simulate_users 결과 1묶음 저장 - 임시 파일에 쓰고 rename (파일이 있으면 완성된 chunk)
+def write_chunk(path, result):
+    arrays = {'user_id': np.asarray(result['user_id'], dtype=np.int64)}
+    for column in static_columns:
+        arrays[column] = result['static'][column].to_numpy()
+    for column, dtype in series_dtypes.items():
+        arrays[column] = np.asarray(result[column]).astype(dtype)
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+# chunk 1개를 배열 dict로 - columns를 주면 그 컬럼만 읽는다. (npz는 컬럼별로 따로 읽을 수 있음)
+def read_chunk(path, columns=None):
+    with np.load(path) as chunk:
+        names = chunk.files if columns is None else ['user_id'] + [c for c in columns if c != 'user_id' and c in chunk.files]
+        return {name: chunk[name] for name in names}
+
+# 배열 dict에서 사용자 k의 DataFrame (기존 csv와 같은 형식)
+def user_frame(arrays, k, dates):
+    frame = {'date': dates, 'user_id': arrays['user_id'][k]}
+    for column in frame_columns[2:]:
+        if column in arrays:
+            frame[column] = arrays[column][k]
+    return pd.DataFrame(frame)
+
+# 저장소 전체 (또는 files에 있는 chunk만)를 사용자 단위로 - (chunk 이름, user_id, DataFrame)
+def iter_users(store_dir, files=None, columns=None):
+    meta = read_meta(store_dir)
+    dates = pd.date_range(start=meta['start_date'], periods=meta['days'], freq='D')
+    for file in (files if files is not None else list_chunks(store_dir)):
+        arrays = read_chunk(os.path.join(store_dir, file), columns)
+        for k, user_id in enumerate(arrays['user_id']):
+            yield file, int(user_id), user_frame(arrays, k, dates)
+
+# chunk 안 사용자 수 (user_id 배열만 읽음)
+def count_users(path):
+    with np.load(path) as chunk:
+        return len(chunk['user_id'])
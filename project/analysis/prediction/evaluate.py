@@ -0,0 +1,113 @@
+import os
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from dataset import split_users
+from dummy.store import is_store, list_chunks, iter_users
+
+# 평가 기본 설정 (test_acc.py와 동일)
+timesteps = 7
+forecast_steps = 90
+eval_columns = ['sex', 'age', 'BMI', 'weight', 'calories']
+horizons = (30, 90)  # 30일, 90일 뒤 예측값 비교
+tolerance = 1.0  # 1kg 이내의 오차는 정확한 예측으로 간주
+
+# 한 사용자의 시계열에서 모든 시작 지점의 (timesteps, features) 윈도우를 복사 없이 만들기
+# return shape: (윈도우 수, timesteps, features) - strided view
+def make_windows(values, timesteps=timesteps, forecast_steps=forecast_steps):
+    n_windows = max(len(values) - timesteps - forecast_steps, 0)
+    if n_windows == 0:
+        return np.empty((0, timesteps, values.shape[1]), dtype=values.dtype)
+    windows = sliding_window_view(values, timesteps, axis=0)  # (len - timesteps + 1, features, timesteps)
+    return windows[:n_windows].transpose(0, 2, 1)
+
+# 각 윈도우의 horizon일 뒤 실제 체중 (윈도우 i -> i + timesteps + horizon - 1)
+def make_targets(weights, n_windows, timesteps=timesteps, horizons=horizons):
+    return np.stack([weights[timesteps + h - 1: timesteps + h - 1 + n_windows] for h in horizons], axis=1)
+
+# 전체 사용자의 윈도우/정답을 하나의 배열로 모으기
+# offsets: 사용자별 윈도우 시작 위치 (np.add.reduceat 으로 사용자별 집계에 사용)
+def build_eval_set(dfs, timesteps=timesteps, forecast_steps=forecast_steps, horizons=horizons):
+    X_list, y_list, counts = [], [], []
+    for df in dfs:
+        values = df[eval_columns].to_numpy(dtype=np.float32)
+        windows = make_windows(values, timesteps, forecast_steps)
+        X_list.append(windows)
+        y_list.append(make_targets(values[:, eval_columns.index('weight')], len(windows), timesteps, horizons))
+        counts.append(len(windows))
+
+    counts = np.array(counts)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    X = np.concatenate(X_list, axis=0) if X_list else np.empty((0, timesteps, len(eval_columns)), np.float32)
+    y = np.concatenate(y_list, axis=0) if y_list else np.empty((0, len(horizons)), np.float32)
+    return X, y, offsets, counts
+
+# 예측값과 실제값 비교 - 사용자별 정확도, MAE, RMSE (horizon 별)
+def score_predictions(predicted, real, offsets, counts):
+    error = predicted - real
+    valid = counts > 0
+    starts = offsets[valid]
+
+    # 사용자별 합계를 한 번에 계산
+    hits = np.zeros((len(counts), error.shape[1]))
+    abs_sum = np.zeros_like(hits)
+    sq_sum = np.zeros_like(hits)
+    hits[valid] = np.add.reduceat((np.abs(error) <= tolerance).astype(np.float64), starts, axis=0)
+    abs_sum[valid] = np.add.reduceat(np.abs(error), starts, axis=0)
+    sq_sum[valid] = np.add.reduceat(error ** 2, starts, axis=0)
+
+    n = np.maximum(counts, 1)[:, np.newaxis]
+    return {
+        'count': counts,
+        'accuracy': hits.sum(axis=1) / (n[:, 0] * error.shape[1]) * 100,  # 30일, 90일 예측 각각 1개씩
+        'mae': abs_sum / n,
+        'rmse': np.sqrt(sq_sum / n),
+    }
+
+# 모델로 전체 윈도우 예측 후, horizon 위치의 값만 뽑아 비교
+def evaluate(model, dfs, batch_size=8192, timesteps=timesteps, forecast_steps=forecast_steps, horizons=horizons):
+    X, y, offsets, counts = build_eval_set(dfs, timesteps, forecast_steps, horizons)
+    if len(X) == 0:
+        return score_predictions(np.empty_like(y), y, offsets, counts)
+
+    predictions = model.predict(X, batch_size=batch_size, verbose=0)
+    predicted = predictions[:, [h - 1 for h in horizons]]
+    return score_predictions(predicted, y, offsets, counts)
+
+# 폴더 안 CSV 파일을 이름 순으로 불러오기
+def load_csv_files(csv_path, files=None):
+    # dummy/generate.py --format store 저장소면 chunk(.npz) 단위, 사용자 이름은 'chunk:user_id'
+    if is_store(csv_path):
+        users = list(iter_users(csv_path, files, columns=eval_columns))
+        return [f'{f}:{user_id}' for f, user_id, _ in users], [df for _, _, df in users]
+    if files is None:
+        files = sorted(f for f in os.listdir(csv_path) if f.endswith('.csv'))
+    # 파티션 csv (사용자 여러 명)는 '파일명:user_id' 이름으로 사용자마다 따로 평가
+    names, dfs = [], []
+    for f in files:
+        users = split_users(pd.read_csv(os.path.join(csv_path, f)))
+        names.extend([f] if len(users) == 1 else [f'{f}:{int(df["user_id"].iloc[0])}' for df in users])
+        dfs.extend(users)
+    return names, dfs
+
+# 파일별 결과를 한 줄씩 (test_acc.py 리포트 형식)
+def file_result_line(file, accuracy, mae, rmse, horizons=horizons):
+    detail = ', '.join(f'{h}d MAE {m:.2f} / RMSE {r:.2f}' for h, m, r in zip(horizons, mae, rmse))
+    return f'Accuracy for file {file}: {accuracy:.2f}% ({detail})'
+
+# 정확도 리포트 만들기 - 파일별 결과 + 평균 정확도 + 전체 윈도우 기준 MAE / RMSE
+def format_report(files, scores, horizons=horizons):
+    lines = [file_result_line(f, scores['accuracy'][i], scores['mae'][i], scores['rmse'][i], horizons)
+             for i, f in enumerate(files)]
+
+    counts = scores['count'][:, np.newaxis]
+    total = max(counts.sum(), 1)
+    avg_accuracy = scores['accuracy'].mean() if len(files) else 0.0
+    mae = (scores['mae'] * counts).sum(axis=0) / total
+    rmse = np.sqrt(((scores['rmse'] ** 2) * counts).sum(axis=0) / total)
+
+    context = '\n'.join(lines) + '\n'
+    context += f'\nAverage accuracy across all samples: {avg_accuracy:.2f}%\n'
+    for h, m, r in zip(horizons, mae, rmse):
+        context += f'Day {h} MAE: {m:.3f} kg, RMSE: {r:.3f} kg\n'
+    return context
@@ -0,0 +1,62 @@
+import numpy as np
+
+# 예측 기본 설정 (model.py 학습 설정과 동일)
+timesteps = 7
+forecast_steps = 90
+weight_col = 3  # features = ['age', 'sex', 'BMI', 'weight', 'consumed_cal'] 중 weight 위치
+
+# 스케일된 체중 예측값을 원래 스케일(kg)로 역변환
+# MinMaxScaler.inverse_transform과 같은 연산을 weight 열에만 적용 (나머지 열을 0으로 채워 hstack 할 필요 없음)
+# scaler가 목록이면 행(사용자)마다 자기 scaler로 역변환 (사용자별로 fit한 scaler)
+def inverse_weight(predictions, scaler, col=weight_col):
+    if scaler is None:
+        return predictions
+    if isinstance(scaler, (list, tuple)):
+        if len(scaler) != len(predictions):
+            raise ValueError(f'scaler 수({len(scaler)})와 예측 행 수({len(predictions)})가 다름')
+        low = np.array([s.min_[col] for s in scaler])[:, np.newaxis]
+        scale = np.array([s.scale_[col] for s in scaler])[:, np.newaxis]
+        return (predictions - low) / scale
+    return (predictions - scaler.min_[col]) / scaler.scale_[col]
+
+# 입력 윈도우를 (사용자 수, timesteps, features) 형태로 맞추기
+def to_batch(windows):
+    windows = np.asarray(windows, dtype=np.float32)
+    if windows.ndim == 2:  # 사용자 1명의 (timesteps, features) 윈도우
+        windows = windows[np.newaxis]
+    return windows
+
+# 배치 예측 수행 - 한 배치로 끝나는 경우 predict_on_batch로 predict의 오버헤드를 줄인다.
+def predict_batch(model, windows, batch_size=1024):
+    if len(windows) <= batch_size:
+        return np.asarray(model.predict_on_batch(windows))
+    return model.predict(windows, batch_size=batch_size, verbose=0)
+
+# 여러 사용자의 마지막 7일 윈도우 -> 한 번의 forward pass로 90일 예측 전체를 반환
+# return shape: (사용자 수, forecast_steps), scaler는 1개 (모두 같은 기준) 또는 사용자별 목록
+def forecast_batch(model, windows, scaler=None, col=weight_col, batch_size=1024):
+    windows = to_batch(windows)
+    predictions = predict_batch(model, windows, batch_size)
+    return inverse_weight(predictions, scaler, col)
+
+# 90일보다 긴 기간 예측 - 모든 사용자를 같은 스텝으로 함께 진행 (autoregressive)
+# 한 번의 예측 결과(90일) 중 마지막 timesteps일의 체중을 다음 입력 윈도우의 weight 열로 사용하고,
+# 나머지 피처(나이, 성별, BMI, 칼로리)는 마지막 관측일 값을 유지한다.
+def forecast_autoregressive(model, windows, horizon, scaler=None, col=weight_col, batch_size=1024):
+    current = to_batch(windows).copy()
+    n_steps = current.shape[1]
+
+    outputs = []
+    produced = 0
+    while produced < horizon:
+        predictions = predict_batch(model, current, batch_size)  # (사용자 수, forecast_steps), 스케일된 값
+        outputs.append(predictions)
+        produced += predictions.shape[1]
+
+        # 다음 윈도우 만들기 (모든 사용자 동시에)
+        next_window = np.repeat(current[:, -1:, :], n_steps, axis=1)
+        next_window[:, :, col] = predictions[:, -n_steps:]
+        current = next_window
+
+    scaled = np.concatenate(outputs, axis=1)[:, :horizon]
+    return inverse_weight(scaled, scaler, col)
@@ -9,51 +9,32 @@ from tensorflow.keras.layers import Input, GRU, LSTM, Dense, Dropout
 from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
 from sklearn.preprocessing import MinMaxScaler
 import matplotlib.pyplot as plt
+from forecast import forecast_batch, forecast_autoregressive
+from dataset import features, timesteps, forecast_steps, load_csv_frames, create_multi_step_sequences
+from train_profile import get_profile, apply_profile, train_sample_count, ThroughputLogger
 
-print("Num GPUs Available: ", len(tf.config.experimental.list_physical_devices('GPU')))
-tf.test.gpu_device_name()
+# 학습 프로필 적용 (CPU 스레드, XLA, bfloat16, 배치 크기) - TF 연산 실행 전에 적용해야 한다.
+profile = apply_profile(get_profile())
 
-# csv를 불러와
+# csv를 불러와 (dataset 모듈에서 로드 / 시퀀스 생성)
 csv_dir = './dummy/outputs/csv'
-df_list = []
-
-for csv_file in os.listdir(csv_dir):
-    if csv_file.endswith('.csv'):
-        df = pd.read_csv(os.path.join(csv_dir, csv_file))
-        df_list.append(df)
+df_list = load_csv_frames(csv_dir)
 
 # 사용자별로 데이터를 나누어 처리
 all_X, all_y = [], []
 # print('DF_LIST_LENGTH', len(df_list))
 
-# 주요 features 설정
-features = ['age', 'sex', 'BMI', 'weight', 'consumed_cal'] # 체중, 체중 연산 변경치 (기초 대사 + 활동 대사 > 섭취 칼로리 = 체중 증가)
-
-# 타임스텝 설정, 앞선 타임스텝을 가지고, 90일까지의 예측을 진행할 예정...
-timesteps = 7
-forecast_steps = 90
-
-scaler = MinMaxScaler()
-
-# 시계열 데이터를 timesteps로 자르고, 다중 스텝 예측을 위해 여러 값을 y로 설정
-def create_multi_step_sequences(data, time_steps, forecast_steps):
-    global scaler
-    X, y = [], []
-
-    # 필요한 피처만 선택
-    data = data[features].copy()  # features 리스트에 있는 피처만 사용
-
-    scaled_data = scaler.fit_transform(data)
+# 주요 features, 타임스텝 설정은 dataset.py 참고
+# features = ['age', 'sex', 'BMI', 'weight', 'consumed_cal'], timesteps = 7, forecast_steps = 90
 
-    for i in range(len(scaled_data) - time_steps - forecast_steps):
-        X.append(scaled_data[i:i + time_steps].values)
-        y.append(scaled_data[i + time_steps:i + forecast_steps + time_steps, 3])  # DataFrame에서의 col index = 3
-    return np.array(X), np.array(y)
+# 사용자마다 따로 fit한 scaler (예측값을 kg으로 되돌릴 때 같은 사용자의 scaler를 써야 한다)
+scalers = []
 
 # 사용자별 데이터 전처리 및 시계열 분할
 for df in df_list:
     # 시계열 데이터를 자르고, 각각의 데이터를 리스트에 저장
-    X, y = create_multi_step_sequences(df, timesteps, forecast_steps)
+    scalers.append(MinMaxScaler())
+    X, y = create_multi_step_sequences(df, timesteps, forecast_steps, scalers[-1])
     all_X.append(X)
     all_y.append(y)
 
@@ -73,12 +54,12 @@ model.add(LSTM(units=32, dropout=0.3, return_sequences=True)) # 모델 GRU 레
 model.add(LSTM(units=32, dropout=0.3)) # 모델 GRU 레이어 통과
 # model.add(Dropout(0.2)) # 편향 방지 : 드랍 아웃 결정
 model.add(Dense(64)) # Fully-Connected DL
-model.add(Dense(units=forecast_steps)) # 모델 Dense 레이어 통과 이후, 1차원으로 90개 출력 데이터
+model.add(Dense(units=forecast_steps, dtype='float32')) # 모델 Dense 레이어 통과 이후, 1차원으로 90개 출력 데이터 (mixed precision이어도 출력은 float32)
 
 # 모델 컴파일 - 회귀 모델에 적합한 MSE 선택, mae, mse 같이 확인
-opt = Adam(learning_rate=0.001)
+opt = Adam(learning_rate=profile['learning_rate'])
 
-model.compile(optimizer = opt, loss='mse', metrics=['mae', 'mse'])
+model.compile(optimizer = opt, loss='mse', metrics=['mae', 'mse'], jit_compile=profile['jit_compile'])
 
 # model Summary
 model.summary()
@@ -90,7 +71,8 @@ checkpoint = ModelCheckpoint("./models/modelv1.weights.h5", monitor='val_loss',
 early_stopping = EarlyStopping(monitor='val_loss', min_delta=0.01, patience=10, restore_best_weights=True)
 
 # 모델 학습 | train : val = 8 : 2 (user 12000; 9600 : 2400)
-hist = model.fit(X_combined, y_combined, epochs=200, batch_size=128, validation_split=0.2, callbacks=[early_stopping, checkpoint])
+throughput = ThroughputLogger(train_sample_count(len(X_combined), validation_split=0.2))
+hist = model.fit(X_combined, y_combined, epochs=200, batch_size=profile['batch_size'], validation_split=0.2, callbacks=[early_stopping, checkpoint, throughput])
 
 # 학습 결과 출력
 print("모델 학습 완료!")
@@ -121,30 +103,23 @@ png_file = os.path.join('./models/', f'model_ver.png')
 plt.savefig(png_file)
 
 ### 예측 파트
+# 90일 예측은 모델이 한 번에 출력하므로, 1스텝씩 model.predict를 90번 호출하지 않고 forecast 모듈의 배치 예측을 사용
 def predict_future(model, last_sequence, steps, scaler):
-    future_predictions = []
-    current_sequence = last_sequence.copy()
-    
-    for _ in range(steps):
-        # 현재 시퀀스로 다음 스텝 예측
-        next_step = model.predict(current_sequence.reshape(1, timesteps, -1))
-        
-        # 예측된 값(체중)을 future_predictions에 추가
-        future_predictions.append(next_step[0, 0])
-        
-        # 현재 시퀀스 업데이트
-        current_sequence = np.roll(current_sequence, -1, axis=0)
-        current_sequence[-1] = next_step[0]
-    
-    # 예측된 값들을 원래 스케일로 변환
-    future_predictions = np.array(future_predictions).reshape(-1, 1)
-    original_scale_predictions = scaler.inverse_transform(np.hstack([np.zeros((len(future_predictions), 3)), future_predictions, np.zeros((len(future_predictions), 1))]))[:, 3]
-    
-    return original_scale_predictions
-
-# 예측 실행 및 결과 출력
-last_sequence = X_combined[-1]
-future_predictions = predict_future(model, last_sequence, forecast_steps, scaler)
+    if steps <= forecast_steps:
+        return forecast_batch(model, last_sequence, scaler)[0, :steps]
+    # 90일보다 긴 예측은 autoregressive 모드
+    return forecast_autoregressive(model, last_sequence, steps, scaler)[0]
+
+# 예측 실행 및 결과 출력 (윈도우가 있는 마지막 사용자, 그 사용자의 scaler로 역변환)
+users_with_windows = [k for k, X in enumerate(all_X) if len(X)]
+last_user = users_with_windows[-1]
+last_sequence = all_X[last_user][-1]
+future_predictions = predict_future(model, last_sequence, forecast_steps, scalers[last_user])
+
+# 사용자 전체의 마지막 윈도우도 한 번의 forward pass로 예측 가능 (행마다 자기 scaler로 역변환)
+last_sequences = np.stack([all_X[k][-1] for k in users_with_windows])
+all_user_predictions = forecast_batch(model, last_sequences, [scalers[k] for k in users_with_windows])
+print("All users forecast shape:", all_user_predictions.shape)  # (사용자 수, 90)
 
 print("Future weight predictions:")
 for i, pred in enumerate(future_predictions):
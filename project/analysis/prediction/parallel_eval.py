@@ -0,0 +1,82 @@
+import os
+import argparse
+import multiprocessing as mp
+import numpy as np
+from dataset import list_csv_files
+from evaluate import timesteps, forecast_steps, eval_columns, evaluate, load_csv_files, format_report
+
+# 워커 프로세스마다 1번만 만드는 모델 (initializer에서 생성)
+worker_model = None
+
+# 파일 목록을 워커 수만큼 나누기 - list_csv_files 순서(순차 평가와 같은 순서)의 위치를 같이 넘기고 round-robin
+# return : 샤드별 [(파일 위치, 파일 이름), ...]
+def shard_files(files, n_shards):
+    indexed = list(enumerate(files))
+    return [indexed[shard::n_shards] for shard in range(n_shards)]
+
+# 워커 초기화 - 모델 생성, 가중치 로드를 워커당 1번만 수행
+def init_worker(weights_path, threads):
+    global worker_model
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    from test_acc import build_model, load_model_weights
+    worker_model = build_model((timesteps, len(eval_columns)), forecast_steps)
+    if weights_path:
+        worker_model = load_model_weights(worker_model, weights_path)
+
+# 워커에서 샤드 하나 평가 - 결과 이름(파티션 파일은 사용자마다 1개)별 파일 위치, 이름, 점수 반환
+def evaluate_shard(args):
+    csv_path, indexed_files = args
+    positions, names, dfs = [], [], []
+    for position, file in indexed_files:
+        file_names, file_dfs = load_csv_files(csv_path, [file])
+        positions.extend([position] * len(file_names))
+        names.extend(file_names)
+        dfs.extend(file_dfs)
+    return positions, names, evaluate(worker_model, dfs)
+
+# 샤드별 결과를 원래 파일 위치 순으로 합치기 (이름 문자열 순이 아님 - 'p.csv:10'이 'p.csv:2'보다 앞에 오지 않도록)
+# 파일 1개는 샤드 1개 안에만 있으므로 stable 정렬이면 파일 안 사용자 순서도 순차 평가와 같다.
+def merge_scores(results):
+    positions = [p for shard_positions, _, _ in results for p in shard_positions]
+    names = [f for _, shard_names, _ in results for f in shard_names]
+    order = np.argsort(positions, kind='stable')
+    merged = {}
+    for key in results[0][2]:
+        merged[key] = np.concatenate([scores[key] for _, _, scores in results], axis=0)[order]
+    return [names[i] for i in order], merged
+
+# 병렬 평가 실행 - test_acc.py와 같은 형식의 리포트 반환
+def run_parallel_eval(csv_path, weights_path, workers, n_shards=None):
+    files = list_csv_files(csv_path)  # csv 파일 또는 저장소 chunk
+    shards = [s for s in shard_files(files, n_shards or workers) if s]
+    if not shards:
+        return [], {}, ''
+
+    # 워커 수만큼 CPU 코어를 나눠서 사용 (TF 스레드 과다 경쟁 방지)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    # TensorFlow는 fork 이후 동작을 보장하지 않아서 spawn 사용
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(processes=workers, initializer=init_worker, initargs=(weights_path, threads)) as pool:
+        results = pool.map(evaluate_shard, [(csv_path, shard) for shard in shards])
+
+    files, scores = merge_scores(results)
+    return files, scores, format_report(files, scores)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='test csv 병렬 정확도 평가')
+    parser.add_argument('--csv-path', default='./dummy/outputs/test/csv/')
+    parser.add_argument('--weights', default='./models/modelv2.weights.h5')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--shards', type=int, default=None)
+    args = parser.parse_args()
+
+    files, scores, context = run_parallel_eval(args.csv_path, args.weights, args.workers, args.shards)
+    print(context)
+
+    # test_acc.py와 같은 위치에 리포트 저장
+    with open(args.weights[:-3], 'w') as f:
+        f.write(context)
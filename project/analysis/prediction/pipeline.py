@@ -0,0 +1,249 @@
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# 학습 데이터 생성 파이프라인
+# df_exercise.py -> df_bmi.py -> dummy/generate.py -> dummy/render.py (monthly, details)
+# - 단계마다 입력 / 출력 경로를 선언하고, 입력 파일 내용 hash + 실행 명령이 이전 실행과 같으면 건너뜀
+# - 입력 / 출력 관계로 의존성을 만들고, 서로 의존하지 않는 단계는 동시에 실행
+# - 단계는 각 스크립트 폴더(cwd)에서 subprocess로 실행, 로그는 단계별 파일로 저장
+# 경로는 모두 이 파일이 있는 폴더(prediction) 기준
+
+root = os.path.dirname(os.path.abspath(__file__))
+cache_path = os.path.join(root, '.pipeline_cache.json')
+log_dir = os.path.join(root, '.pipeline_logs')
+
+stats_dir = 'statistics/korean_health_stats'
+
+# 단계 정의 - params로 명령을 만든다. clean_outputs가 True면 입력이 바뀌었을 때 출력을 지우고 다시 생성
+def build_stages(params):
+    python = sys.executable
+    people = f'{stats_dir}/updated_test.csv'
+    return {
+        'exercise': {
+            'cwd': 'statistics',
+            'cmd': [python, 'df_exercise.py', '--n', str(params['n']), '--seed', str(params['seed']),
+                    '--input', 'korean_health_stats/exercise_total.csv', '--output', 'korean_health_stats/test.csv'],
+            'inputs': [f'{stats_dir}/exercise_total.csv', 'statistics/df_exercise.py', 'statistics/population.py'],
+            'outputs': [f'{stats_dir}/test.csv'],
+        },
+        'bmi': {
+            'cwd': 'statistics',
+            'cmd': [python, 'df_bmi.py', '--seed', str(params['seed']), '--input', 'korean_health_stats/test.csv',
+                    '--stats', 'korean_health_stats/obesity.csv', '--output', 'korean_health_stats/updated_test.csv'],
+            'inputs': [f'{stats_dir}/test.csv', f'{stats_dir}/obesity.csv', 'statistics/df_bmi.py', 'statistics/population.py'],
+            'outputs': [people],
+        },
+        'generate': {
+            'cwd': 'dummy',
+            'cmd': [python, 'generate.py', '--people', f'../{people}', '--out-dir', 'outputs/shards',
+                    '--seed', str(params['seed']), '--shard-size', str(params['shard_size']), '--workers', str(params['workers']),
+                    '--format', params['format']],
+            'inputs': [people, 'dummy/generate.py', 'dummy/simulation.py'],
+            'outputs': ['dummy/outputs/shards'],
+            'clean_outputs': True,
+        },
+        'charts': {
+            'cwd': 'dummy',
+            'cmd': [python, 'render.py', '--csv-path', 'outputs/shards', '--chart-dir', 'outputs/charts/monthly',
+                    '--mode', 'monthly', '--sample', str(params['chart_sample']), '--seed', str(params['seed']),
+                    '--workers', str(params['workers'])],
+            'inputs': ['dummy/outputs/shards', 'dummy/render.py'],
+            'outputs': ['dummy/outputs/charts/monthly'],
+            'clean_outputs': True,
+        },
+        'details': {
+            'cwd': 'dummy',
+            'cmd': [python, 'render.py', '--csv-path', 'outputs/shards', '--chart-dir', 'outputs/charts',
+                    '--mode', 'details', '--sample', str(params['chart_sample']), '--seed', str(params['seed']),
+                    '--workers', str(params['workers'])],
+            'inputs': ['dummy/outputs/shards', 'dummy/render.py'],
+            'outputs': ['dummy/outputs/charts/details'],
+            'clean_outputs': True,
+        },
+    }
+
+# 입력 / 출력 경로로 단계 간 의존성 만들기 (다른 단계의 출력을 입력으로 쓰면 그 단계 다음에 실행)
+def stage_dependencies(stages):
+    producers = {output: name for name, stage in stages.items() for output in stage['outputs']}
+    return {name: {producers[i] for i in stage['inputs'] if i in producers and producers[i] != name}
+            for name, stage in stages.items()}
+
+### 내용 hash
+# 파일 hash는 (크기, 수정 시각)이 같으면 이전 계산 결과를 재사용 (큰 출력 폴더를 매번 읽지 않도록)
+def file_hash(path, memo):
+    stat = os.stat(path)
+    key = f'{stat.st_size}:{stat.st_mtime_ns}'
+    if memo.get(path, {}).get('key') == key:
+        return memo[path]['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    memo[path] = {'key': key, 'sha256': digest.hexdigest()}
+    return memo[path]['sha256']
+
+# 폴더는 (상대 경로, 파일 hash) 목록의 hash, 없는 경로는 None
+def path_hash(path, memo):
+    full_path = os.path.join(root, path)
+    if os.path.isfile(full_path):
+        return file_hash(full_path, memo)
+    if not os.path.isdir(full_path):
+        return None
+
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(full_path):
+        dirnames.sort()
+        for f in sorted(filenames):
+            if f.endswith('.tmp'):
+                continue
+            file_path = os.path.join(dirpath, f)
+            digest.update(os.path.relpath(file_path, full_path).encode())
+            digest.update(file_hash(file_path, memo).encode())
+    return digest.hexdigest()
+
+def load_cache():
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return json.load(f)
+    return {'stages': {}, 'files': {}}
+
+def save_cache(cache):
+    tmp_path = f'{cache_path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, cache_path)
+
+# 단계 실행 여부 판단용 key - 실행 명령 + 입력 hash
+def stage_key(stage, memo):
+    return {'cmd': stage['cmd'][1:], 'inputs': {path: path_hash(path, memo) for path in stage['inputs']}}
+
+# 이전 실행과 key가 같고, 출력도 그때 그대로 남아 있으면 건너뛰기
+def is_up_to_date(stage, record, key, memo):
+    if record is None or record['key'] != key:
+        return False
+    return all(path_hash(path, memo) == record['outputs'].get(path) for path in stage['outputs'])
+
+# 단계 1개 실행 (스레드에서 호출) - 출력은 로그 파일로
+def run_stage(name, stage, clean):
+    if clean:
+        for path in stage['outputs']:
+            full_path = os.path.join(root, path)
+            if os.path.isdir(full_path):
+                shutil.rmtree(full_path)
+            elif os.path.exists(full_path):
+                os.remove(full_path)
+
+    os.makedirs(log_dir, exist_ok=True)
+    start = time.perf_counter()
+    with open(os.path.join(log_dir, f'{name}.log'), 'w') as log:
+        code = subprocess.call(stage['cmd'], cwd=os.path.join(root, stage['cwd']), stdout=log, stderr=subprocess.STDOUT)
+    return code, time.perf_counter() - start
+
+def run_pipeline(params, targets=None, force=(), max_parallel=2):
+    stages = build_stages(params)
+    dependencies = stage_dependencies(stages)
+
+    # 대상 단계와 그 단계가 의존하는 단계만 실행
+    selected = set()
+    pending_targets = list(targets or stages)
+    while pending_targets:
+        name = pending_targets.pop()
+        if name not in selected:
+            selected.add(name)
+            pending_targets.extend(dependencies[name])
+
+    cache = load_cache()
+    memo = cache['files']
+    results = {}
+    running = {}
+    remaining = [name for name in stages if name in selected]
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while remaining or running:
+            # 의존하는 단계가 모두 끝난 단계를 실행 (건너뛴 단계도 끝난 것으로 본다)
+            for name in list(remaining):
+                if any(d not in results for d in dependencies[name]):
+                    continue
+                if any(results[d]['status'] in ('failed', 'blocked') for d in dependencies[name]):
+                    remaining.remove(name)
+                    results[name] = {'status': 'blocked', 'time': 0.0}
+                    continue
+
+                remaining.remove(name)
+                stage = stages[name]
+                missing = [p for p in stage['inputs'] if path_hash(p, memo) is None]
+                if missing:
+                    results[name] = {'status': 'failed', 'time': 0.0, 'error': f'missing inputs: {missing}'}
+                    continue
+
+                key = stage_key(stage, memo)
+                record = cache['stages'].get(name)
+                if name not in force and is_up_to_date(stage, record, key, memo):
+                    results[name] = {'status': 'cached', 'time': 0.0}
+                    print(f'[{name}] up to date, skipped')
+                    continue
+
+                # 입력이 바뀐 경우에만 이전 출력 정리 (같은 입력으로 중단된 실행은 이어서 진행)
+                clean = stage.get('clean_outputs', False) and record is not None and record['key'] != key
+                print(f'[{name}] running: {" ".join(stage["cmd"][1:])}')
+                running[executor.submit(run_stage, name, stage, clean)] = (name, key)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, key = running.pop(future)
+                code, elapsed = future.result()
+                if code == 0:
+                    cache['stages'][name] = {'key': key, 'outputs': {p: path_hash(p, memo) for p in stages[name]['outputs']}}
+                    save_cache(cache)
+                    results[name] = {'status': 'done', 'time': elapsed}
+                    print(f'[{name}] done in {elapsed:.1f} s')
+                else:
+                    results[name] = {'status': 'failed', 'time': elapsed, 'error': f'exit code {code}, log: {os.path.join(log_dir, name + ".log")}'}
+                    print(f'[{name}] failed ({results[name]["error"]})')
+
+    save_cache(cache)
+    return results
+
+def format_summary(results, elapsed):
+    lines = [f"{'stage':<10}{'status':<10}{'time (s)':>10}"]
+    for name, result in results.items():
+        lines.append(f"{name:<10}{result['status']:<10}{result['time']:>10.1f}" + (f"  {result['error']}" if 'error' in result else ''))
+    lines.append(f"{'total':<20}{sum(r['time'] for r in results.values()):>10.1f}  (wall {elapsed:.1f} s)")
+    return '\n'.join(lines)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='가상 사용자 학습 데이터 생성 파이프라인')
+    parser.add_argument('targets', nargs='*', help='실행할 단계 (기본: 전체, 의존하는 단계는 자동 포함)')
+    parser.add_argument('--n', type=int, default=200, help='생성할 인원 수 (df_exercise.py)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shard-size', type=int, default=1000)
+    parser.add_argument('--format', choices=['csv', 'store'], default='store', help='generate.py 출력 형식')
+    parser.add_argument('--chart-sample', type=float, default=0.01, help='차트를 그릴 사용자 비율')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='단계 안에서 쓰는 프로세스 수')
+    parser.add_argument('--parallel', type=int, default=2, help='동시에 실행할 단계 수')
+    parser.add_argument('--force', nargs='*', default=[], help='캐시와 상관없이 다시 실행할 단계')
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    unknown = (set(args.targets) | set(args.force)) - set(build_stages({'n': 0, 'seed': 0, 'shard_size': 0, 'chart_sample': 0, 'workers': 0, 'format': 'store'}))
+    if unknown:
+        raise SystemExit(f'unknown stages: {sorted(unknown)}')
+    params = {'n': args.n, 'seed': args.seed, 'shard_size': args.shard_size,
+              'chart_sample': args.chart_sample, 'workers': args.workers, 'format': args.format}
+    start = time.perf_counter()
+    results = run_pipeline(params, args.targets or None, set(args.force), args.parallel)
+    print(format_summary(results, time.perf_counter() - start))
+    if any(r['status'] in ('failed', 'blocked') for r in results.values()):
+        sys.exit(1)
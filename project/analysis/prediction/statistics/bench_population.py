@@ -0,0 +1,131 @@
+import time
+import numpy as np
+import pandas as pd
+from population import states, group_sizes, generate_exercise, state_counts, generate_bmi
+
+# df_exercise.py / df_bmi.py 가상 인구 생성 속도 비교
+# - legacy : 1명씩 dict 생성 (iterrows), 1명씩 np.random 호출, DataFrame.apply(axis=1)
+# - vector : population.py (그룹 단위로 배열 생성)
+# 통계 csv(korean_health_stats)가 없어도 돌 수 있게 같은 형식의 표를 만들어서 사용
+
+legacy_n = 20000
+vector_n = 200000
+age_groups = ['19-29', '30-39', '40-49', '50-59', '60-69', '70+']
+
+# exercise_total.csv / obesity.csv 형식의 통계표
+def make_stats(rng):
+    rows = [(age, sex) for age in age_groups for sex in (1, 2)]
+    exercise = pd.DataFrame({'age': [a for a, _ in rows], 'sex': [s for _, s in rows],
+                             'percent': np.round(rng.uniform(20, 50, len(rows)), 1)})
+    state = rng.dirichlet([1, 8, 4, 6], len(rows)) * 100
+    obesity = pd.DataFrame({'age': exercise['age'], 'sex': exercise['sex'],
+                            'state1': state[:, 0], 'state2': state[:, 1], 'state3': state[:, 2], 'state4': state[:, 3],
+                            'height_avg': np.where(exercise['sex'] == 1, 172.0, 159.0), 'height_std': 6.0})
+    return exercise, obesity
+
+# 기존 df_exercise.py generate_data (print, 나이대 가중치 루프 제외 - 원래도 반영되지 않았음)
+def legacy_exercise(row_data, N):
+    result_data = []
+    male_population = row_data[row_data['sex'] == 1]['percent'].sum()
+    female_population = row_data[row_data['sex'] == 2]['percent'].sum()
+    for _, row in row_data.iterrows():
+        M = N // 2
+        if row['sex'] == 1:
+            group_population = int(M * (row['percent'] / male_population) + 0.7)
+        else:
+            group_population = int(M * (row['percent'] / female_population) + 0.7)
+        active_ratio = int((row['percent'] / 100) * group_population)
+        for k in range(group_population):
+            user_data = {'age': row['age'], 'sex': row['sex'], 'consumed_cal': 0, 'intake_cal': 0, 'BMI': 0,
+                         'fat': np.random.normal(18, 2), 'muscle': np.random.normal(19, 2), 'BMR': 0}
+            if k < active_ratio:
+                user_data['consumed_cal'] = 450 + round(np.random.normal(100, 75), 2)
+            else:
+                user_data['consumed_cal'] = 100 + round(np.random.normal(100, 50), 2)
+            result_data.append(user_data)
+    return pd.DataFrame(result_data)
+
+# 기존 df_bmi.py calculate_new_counts
+def legacy_state_counts(row, user_count_dict):
+    total_count = user_count_dict.get((row['age'], row['sex']), 0)
+    for k, state in enumerate(states):
+        row[f'new_{state}_count'] = np.floor(total_count * row[state] / 100)
+    remaining_count = int(total_count - sum(row[f'new_{state}_count'] for state in states))
+    for state in sorted(states, key=lambda s: row[s], reverse=True):
+        if remaining_count > 0:
+            row[f'new_{state}_count'] += 1
+            remaining_count -= 1
+    return row
+
+# 기존 df_bmi.py 신장 / 체중 생성 + 나이 + BMR (1명씩)
+def legacy_bmi(data, stats):
+    user_count_dict = data.groupby(['age', 'sex']).size().to_dict()
+    counts = stats[['age', 'sex'] + states].copy().apply(legacy_state_counts, axis=1, user_count_dict=user_count_dict)
+    result = []
+    for (_, count_row), (_, stat_row) in zip(counts.iterrows(), stats.iterrows()):
+        for state in states:
+            for _ in range(int(count_row[f'new_{state}_count'])):
+                height = round(np.random.normal(stat_row['height_avg'], stat_row['height_std']), 2)
+                if state == 'state1':
+                    bmi = np.random.uniform(17.0, 18.5)
+                elif state == 'state2':
+                    bmi = np.random.uniform(18.5, 22.9)
+                elif state == 'state3':
+                    bmi = np.random.uniform(23.0, 24.9)
+                else:
+                    n = np.random.choice([1, 2, 3], 1, p=[0.82, 0.15, 0.03])
+                    bmi = np.random.uniform(25.0, 29.9) if n == 1 else np.random.uniform(30.0, 34.9) if n == 2 else np.random.uniform(35.0, 38.0)
+                bmi = round(bmi, 2)
+                result.append({'height': height, 'weight': round(bmi * (round(height / 100, 2) ** 2), 2), 'BMI': bmi})
+    generated = pd.DataFrame(result)
+    data = data.copy()
+    data['height'], data['weight'], data['BMI'] = generated['height'], generated['weight'], generated['BMI']
+    data['age'] = data['age'].apply(lambda age: int(np.random.uniform(*map(int, age.split('-')))) if '-' in age else int(np.random.uniform(70, 85)))
+    data['BMR'] = data.apply(lambda r: int(10 * r['weight'] + 6.25 * r['height'] - 5 * r['age'] + (5 if r['sex'] == 1 else -161)), axis=1)
+    return data, counts
+
+def body_stats(people):
+    return {
+        'mean height': people['height'].mean(),
+        'mean weight': people['weight'].mean(),
+        'mean BMI': people['BMI'].mean(),
+        'BMI >= 25 ratio': (people['BMI'] >= 25).mean(),
+        'mean age': people['age'].mean(),
+        'mean BMR': people['BMR'].mean(),
+        'mean consumed_cal': people['consumed_cal'].mean(),
+    }
+
+if __name__ == "__main__":
+    exercise, obesity = make_stats(np.random.default_rng(0))
+    rng = np.random.default_rng(1)
+
+    # 1. 인원수 계산이 기존과 같은지 (나이대 가중치 없는 표 기준)
+    group_population, active_count = group_sizes(exercise, legacy_n)
+    legacy_people = legacy_exercise(exercise, legacy_n)
+    assert (legacy_people.groupby(['age', 'sex'], sort=False).size().to_numpy() == group_population).all()
+    print('group sizes == legacy: True')
+
+    start = time.perf_counter()
+    legacy_people = legacy_exercise(exercise, legacy_n)
+    legacy_people = legacy_people.sort_values(by=['age', 'sex'], kind='stable').reset_index(drop=True)
+    legacy_result, legacy_counts = legacy_bmi(legacy_people, obesity)
+    legacy_time = time.perf_counter() - start
+
+    user_counts = legacy_people.groupby(['age', 'sex']).size().to_dict()
+    assert (state_counts(obesity, user_counts) == legacy_counts[[f'new_{s}_count' for s in states]].to_numpy()).all()
+    print('state counts == legacy: True')
+
+    # 2. 속도 비교
+    start = time.perf_counter()
+    people, _ = generate_exercise(exercise, vector_n, rng)
+    people = people.sort_values(by=['age', 'sex'], kind='stable').reset_index(drop=True)
+    result = generate_bmi(people, obesity, rng)
+    vector_time = time.perf_counter() - start
+    print(f'legacy: {legacy_n / legacy_time:10.0f} people/sec ({legacy_n} people, {legacy_time:.1f} s)')
+    print(f'vector: {vector_n / vector_time:10.0f} people/sec ({vector_n} people, {vector_time:.2f} s)')
+
+    # 3. 분포 비교 (vector는 나이대 가중치가 반영되어 인원 구성이 조금 다르다)
+    legacy_stats, vector_stats = body_stats(legacy_result), body_stats(result)
+    print(f"\n{'stat':<22}{'legacy':>10}{'vector':>10}")
+    for name in legacy_stats:
+        print(f'{name:<22}{legacy_stats[name]:>10.2f}{vector_stats[name]:>10.2f}')
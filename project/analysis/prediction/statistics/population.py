@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# 통계 기반 가상 인구 생성 (df_exercise.py, df_bmi.py 공통)
+# (나이대, 성별, 상태) 그룹마다 필요한 인원수를 먼저 계산하고, 그룹 단위로 배열을 한 번에 뽑는다.
+
+# 나이대별 가중치 - 40대까지는 더 반영하고, 50대 이상은 덜 반영
+age_weights = {
+    '19-29': 1.2, '30-39': 1.2, '40-49': 1.2,
+    '50-59': 0.7, '60-69': 0.7, '70+': 0.7,
+}
+
+# BMI 상태별 범위 (state4 비만은 3단계로 나눠져 있는데, 그 분포가 치우쳐져있다.)
+bmi_ranges = {
+    'state1': [(17.0, 18.5)],  # 저체중
+    'state2': [(18.5, 22.9)],  # 정상체중
+    'state3': [(23.0, 24.9)],  # 과체중
+    'state4': [(25.0, 29.9), (30.0, 34.9), (35.0, 38.0)],  # 비만 1 ~ 3단계
+}
+obese_probs = [0.82, 0.15, 0.03]
+states = list(bmi_ranges)
+
+### 1. 운동 빈도 기반 베이스 데이터 (df_exercise.py)
+# 나이대별 가중치를 percent에 반영 (원본 표는 바꾸지 않음)
+def weight_percent(exercise):
+    exercise = exercise.copy()
+    exercise['percent'] = exercise['percent'] * exercise['age'].map(age_weights).fillna(1.0)
+    return exercise
+
+# 나이대 / 성별 그룹별 인원수와 그중 운동을 자주 하는 인원수
+def group_sizes(exercise, n):
+    percent = exercise['percent'].to_numpy(dtype=np.float64)
+    sex = exercise['sex'].to_numpy()
+
+    # 전체 퍼센트를 받아서 그걸 총 인구라 생각 (성별마다 n의 절반)
+    sex_total = np.where(sex == 1, percent[sex == 1].sum(), percent[sex == 2].sum())
+    group_population = ((n // 2) * (percent / sex_total) + 0.7).astype(int)
+    active_count = np.minimum((percent / 100 * group_population).astype(int), group_population)
+    return group_population, active_count
+
+def generate_exercise(exercise, n, rng):
+    exercise = weight_percent(exercise)
+    group_population, active_count = group_sizes(exercise, n)
+    total = group_population.sum()
+
+    # 그룹 정보를 사람 수만큼 펼치기 (그룹 안에서는 운동을 자주 하는 사람이 앞쪽)
+    age = np.repeat(exercise['age'].to_numpy(), group_population)
+    sex = np.repeat(exercise['sex'].to_numpy(), group_population)
+    group_start = np.repeat(np.cumsum(group_population) - group_population, group_population)
+    active = (np.arange(total) - group_start) < np.repeat(active_count, group_population)
+
+    # 운동을 잘하는 사람 450 + N(100, 75), 운동량 적은 사람 100 + N(100, 50)
+    consumed_cal = np.where(active, 450 + np.round(rng.normal(100, 75, total), 2), 100 + np.round(rng.normal(100, 50, total), 2))
+
+    people = pd.DataFrame({
+        'age': age,
+        'sex': sex,
+        'consumed_cal': consumed_cal,
+        'intake_cal': 0,
+        'BMI': 0,  # df_bmi.py에서 계산
+        'fat': rng.normal(18, 2, total),  # Fat percentage with some variation
+        'muscle': rng.normal(19, 2, total),  # Muscle percentage with some variation
+        'BMR': 0,  # df_bmi.py에서 계산
+    })
+    return people, pd.DataFrame({'age': exercise['age'], 'sex': exercise['sex'],
+                                 'active': active_count, 'inactive': group_population - active_count})
+
+### 2. 신장, 체중, BMI (df_bmi.py)
+# 상태별 인원수 - 비율대로 내림 후, 남은 인원은 비율이 높은 상태부터 1명씩 배분
+def state_counts(stats, user_counts):
+    percents = stats[states].to_numpy(dtype=np.float64)
+    totals = np.array([user_counts.get((age, sex), 0) for age, sex in zip(stats['age'], stats['sex'])])
+
+    counts = np.floor(totals[:, np.newaxis] * percents / 100).astype(int)
+    remaining = totals - counts.sum(axis=1)
+    order = np.argsort(-percents, axis=1, kind='stable')
+    rank = np.argsort(order, axis=1)  # 상태별 비율 순위
+    counts += rank < remaining[:, np.newaxis]
+    return counts
+
+# 상태별 BMI - 상태마다 범위를 고르고 균등분포
+def sample_bmi(state, rng):
+    low = np.empty(len(state))
+    high = np.empty(len(state))
+    for k, name in enumerate(states):
+        mask = state == k
+        ranges = np.array(bmi_ranges[name])
+        if len(ranges) > 1:
+            pick = rng.choice(len(ranges), size=mask.sum(), p=obese_probs)
+        else:
+            pick = np.zeros(mask.sum(), dtype=int)
+        low[mask], high[mask] = ranges[pick, 0], ranges[pick, 1]
+    return np.round(rng.uniform(low, high), 2)
+
+# 사람마다 (나이대, 성별) 그룹의 신장 분포와 상태별 인원수로 신장, 체중, BMI 생성
+def generate_body(people, stats, rng):
+    user_counts = people.groupby(['age', 'sex']).size().to_dict()
+    counts = state_counts(stats, user_counts)
+
+    height = np.full(len(people), np.nan)
+    bmi = np.full(len(people), np.nan)
+    for (age, sex, height_avg, height_std), group_counts in zip(
+            stats[['age', 'sex', 'height_avg', 'height_std']].itertuples(index=False), counts):
+        rows = np.flatnonzero((people['age'].to_numpy() == age) & (people['sex'].to_numpy() == sex))
+        if len(rows) == 0:
+            continue
+        # 상태를 그룹 안에서 섞어서 배정 (운동 빈도 순서와 BMI 상태가 엮이지 않도록)
+        state = rng.permutation(np.repeat(np.arange(len(states)), group_counts))
+        height[rows] = np.round(rng.normal(height_avg, height_std, len(rows)), 2)
+        bmi[rows] = sample_bmi(state, rng)
+
+    # BMI를 기반으로 체중 계산
+    weight = np.round(bmi * np.round(height / 100, 2) ** 2, 2)
+    return height, weight, bmi
+
+# 나이대 ('19-29')의 나이 범위 [min, max) - '70+'는 70 ~ 84
+def age_bounds(age):
+    if '-' in age:
+        return tuple(map(int, age.split('-')))
+    return 70, 85
+
+# 나이대 안에서 나이를 균등분포로 (나이대 종류만큼만 범위를 계산하고 한 번에 뽑기)
+def sample_age(age_groups, rng):
+    groups, inverse = np.unique(np.asarray(age_groups, dtype=str), return_inverse=True)
+    bounds = np.array([age_bounds(age) for age in groups]).reshape(-1, 2)
+    return rng.integers(bounds[inverse, 0], bounds[inverse, 1])
+
+# 기초 대사량 (Mifflin-St Jeor, 소수점 버림)
+def calculate_bmr(weight, height, age, sex):
+    equation = 10 * weight + 6.25 * height - 5 * age
+    return np.trunc(np.where(sex == 1, equation + 5, equation - 161)).astype(int)
+
+def generate_bmi(people, stats, rng):
+    people = people.copy()
+    people['height'], people['weight'], people['BMI'] = generate_body(people, stats, rng)
+    people['age'] = sample_age(people['age'], rng)
+    people['BMR'] = calculate_bmr(people['weight'].to_numpy(), people['height'].to_numpy(),
+                                  people['age'].to_numpy(), people['sex'].to_numpy())
+    return people
@@ -0,0 +1,91 @@
+import os
+import math
+import time
+import tensorflow as tf
+from tensorflow.keras.callbacks import Callback
+
+# 학습 프로필 - TRAIN_PROFILE 환경 변수로 선택 (기본값: default)
+# intra_op_threads / inter_op_threads : 0 이면 TensorFlow 기본값 사용
+# jit_compile : train step을 XLA로 컴파일
+# mixed_precision : 'mixed_bfloat16' 이면 연산은 bfloat16, 가중치는 float32로 유지
+profiles = {
+    'default': {
+        'intra_op_threads': 0,
+        'inter_op_threads': 0,
+        'jit_compile': False,
+        'mixed_precision': None,
+        'batch_size': 128,
+        'learning_rate': 0.001,
+    },
+    # CPU 노드용 - 코어 수만큼 intra-op, 배치를 키운 만큼 학습률도 조금 올림
+    'cpu': {
+        'intra_op_threads': os.cpu_count() or 1,
+        'inter_op_threads': 2,
+        'jit_compile': True,
+        'mixed_precision': None,
+        'batch_size': 1024,
+        'learning_rate': 0.002,
+    },
+    # bfloat16 지원 CPU (AVX512_BF16, AMX) 용
+    'cpu_bf16': {
+        'intra_op_threads': os.cpu_count() or 1,
+        'inter_op_threads': 2,
+        'jit_compile': True,
+        'mixed_precision': 'mixed_bfloat16',
+        'batch_size': 1024,
+        'learning_rate': 0.002,
+    },
+}
+
+# 프로필 가져오기 (환경 변수로 개별 값 덮어쓰기 가능)
+def get_profile(name=None):
+    name = name or os.getenv('TRAIN_PROFILE', 'default')
+    if name not in profiles:
+        raise ValueError(f'Unknown train profile: {name} ({", ".join(profiles)})')
+
+    profile = dict(profiles[name], name=name)
+    if os.getenv('TRAIN_BATCH_SIZE'):
+        profile['batch_size'] = int(os.getenv('TRAIN_BATCH_SIZE'))
+    if os.getenv('TRAIN_THREADS'):
+        profile['intra_op_threads'] = int(os.getenv('TRAIN_THREADS'))
+    return profile
+
+# 프로필 적용 - TensorFlow 연산이 한 번이라도 실행되기 전에 호출해야 스레드 설정이 반영된다.
+def apply_profile(profile):
+    tf.config.threading.set_intra_op_parallelism_threads(profile['intra_op_threads'])
+    tf.config.threading.set_inter_op_parallelism_threads(profile['inter_op_threads'])
+    if profile['mixed_precision']:
+        tf.keras.mixed_precision.set_global_policy(profile['mixed_precision'])
+
+    print(f"Train profile: {profile['name']} (threads {profile['intra_op_threads']}/{profile['inter_op_threads']}, "
+          f"jit {profile['jit_compile']}, precision {profile['mixed_precision'] or 'float32'}, batch {profile['batch_size']})")
+    return profile
+
+# model.fit(validation_split=...) 에서 실제로 학습에 쓰이는 샘플 수 (Keras와 같은 방식으로 계산)
+def train_sample_count(n_samples, validation_split=0.0):
+    return int(math.ceil(n_samples * (1.0 - validation_split)))
+
+# epoch 별 학습 시간과 초당 샘플 수 출력
+class ThroughputLogger(Callback):
+    def __init__(self, n_samples):
+        super().__init__()
+        self.n_samples = n_samples
+        self.epoch_times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.epoch_start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = time.perf_counter() - self.epoch_start
+        self.epoch_times.append(elapsed)
+        samples_per_sec = self.n_samples / elapsed
+        if logs is not None:
+            logs['epoch_time'] = elapsed
+            logs['samples_per_sec'] = samples_per_sec
+        print(f' - epoch {epoch + 1}: {elapsed:.2f} s, {samples_per_sec:.0f} samples/sec')
+
+    def on_train_end(self, logs=None):
+        # 첫 epoch은 tracing / XLA 컴파일 시간이 포함돼서 제외하고 평균
+        steady = self.epoch_times[1:] or self.epoch_times
+        if steady:
+            print(f'Average epoch time: {sum(steady) / len(steady):.2f} s, {self.n_samples * len(steady) / sum(steady):.0f} samples/sec')